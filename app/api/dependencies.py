@@ -1,4 +1,5 @@
 """FastAPI dependency injection setup."""
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from typing import Optional
 
@@ -9,6 +10,9 @@ from app.services.tencent_client import TencentCloudClient, AsyncTencentClient
 from app.services.schedule_manager import ScheduleManager
 from app.storage.json_storage import ScheduleStorage
 
+# Worker threads for slow Slack handler work (dashboard loads, stats, traces)
+SLACK_BACKGROUND_WORKERS = 8
+
 
 def get_tencent_client(
     settings: Settings = Depends(get_settings),
@@ -62,6 +66,10 @@ class ServiceContainer:
         self._tencent_client: Optional[TencentCloudClient] = None
         self._schedule_manager: Optional[ScheduleManager] = None
         self._slack_client = None
+        # Threads are started on demand, so creating the pool up front is cheap
+        self.background_pool = ThreadPoolExecutor(
+            max_workers=SLACK_BACKGROUND_WORKERS, thread_name_prefix="slack-bg"
+        )
 
     @property
     def tencent_client(self) -> TencentCloudClient:
@@ -92,6 +100,10 @@ class ServiceContainer:
         """Set Slack client."""
         self._slack_client = client
 
+    def shutdown(self) -> None:
+        """Stop accepting background work; queued tasks are dropped."""
+        self.background_pool.shutdown(wait=False, cancel_futures=True)
+
     @classmethod
     def get_instance(cls) -> "ServiceContainer":
         """Get singleton instance."""
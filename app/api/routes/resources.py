@@ -1,7 +1,9 @@
 """Resource API endpoints."""
+import json
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
 
 from app.api.dependencies import get_async_tencent_client
 from app.services.tencent_client import AsyncTencentClient
@@ -69,19 +71,8 @@ async def get_input_status(
     """Get input status (main/backup) for a StreamLive channel."""
     if service not in ["StreamLive", "MediaLive"]:
         return {"error": "Input status is only available for StreamLive channels"}
-    
-    # Use sync client for input status check (not yet async)
-    from app.services.tencent_client import TencentCloudClient
-    from app.config import get_settings
-    
-    settings = get_settings()
-    sync_client = TencentCloudClient(
-        secret_id=settings.TENCENT_SECRET_ID,
-        secret_key=settings.TENCENT_SECRET_KEY,
-        region=settings.TENCENT_REGION,
-    )
-    
-    input_status = sync_client.get_channel_input_status(resource_id)
+
+    input_status = await client.get_channel_input_status(resource_id)
     
     if not input_status:
         return {"error": "Failed to get input status"}
@@ -89,6 +80,23 @@ async def get_input_status(
     return input_status
 
 
+@router.get("/{resource_id}/input-status/stream")
+async def stream_input_status(
+    resource_id: str,
+    service: str = Query(..., description="Service type (StreamLive, StreamLink)"),
+    client: AsyncTencentClient = Depends(get_async_tencent_client),
+):
+    """Stream input status stages (log-based first, then final) as NDJSON."""
+    if service not in ["StreamLive", "MediaLive"]:
+        return {"error": "Input status is only available for StreamLive channels"}
+
+    async def ndjson():
+        async for stage in client.stream_channel_input_status(resource_id):
+            yield json.dumps(stage, ensure_ascii=False, default=str) + "\n"
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
 @router.post("/cache/clear")
 async def clear_cache(
     client: AsyncTencentClient = Depends(get_async_tencent_client),
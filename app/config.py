@@ -1,6 +1,6 @@
 """Configuration management using Pydantic BaseSettings."""
-from functools import lru_cache
-from typing import List, Optional
+from functools import cached_property, lru_cache
+from typing import FrozenSet, List, Optional
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -86,9 +86,24 @@ class Settings(BaseSettings):
             return []
         return [user_id.strip() for user_id in self.STREAMLINK_ONLY_USERS.split(",") if user_id.strip()]
 
+    @cached_property
+    def allowed_users_set(self) -> FrozenSet[str]:
+        """ALLOWED_USERS as a set for membership checks (parsed once)."""
+        return frozenset(self.allowed_users_list)
+
+    @cached_property
+    def streamlink_only_users_set(self) -> FrozenSet[str]:
+        """STREAMLINK_ONLY_USERS as a set for membership checks (parsed once)."""
+        return frozenset(self.streamlink_only_users_list)
+
+    @cached_property
+    def all_allowed_users_set(self) -> FrozenSet[str]:
+        """Users in either ALLOWED_USERS or STREAMLINK_ONLY_USERS."""
+        return self.allowed_users_set | self.streamlink_only_users_set
+
     def is_streamlink_only_user(self, user_id: str) -> bool:
         """Check if user can only control StreamLink (not StreamLive)."""
-        return user_id in self.streamlink_only_users_list
+        return user_id in self.streamlink_only_users_set
 
     def can_control_streamlive(self, user_id: str) -> bool:
         """Check if user can control StreamLive channels."""
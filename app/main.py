@@ -16,6 +16,7 @@ from slack_bolt.adapter.socket_mode import SocketModeHandler
 
 from app.config import get_settings
 from app.api.dependencies import ServiceContainer
+from app.services.tencent_client import AsyncTencentClient
 from app.api.routes import health, resources, schedules, webhooks
 from app.slack.handlers import register_all_handlers
 from app.services.scheduler import SchedulerService
@@ -204,6 +205,11 @@ async def lifespan(app: FastAPI):
         _scheduler.shutdown()
         logger.info("Scheduler stopped")
 
+    AsyncTencentClient.close()
+
+    if _services:
+        _services.shutdown()
+
     if _slack_handler:
         try:
             _slack_handler.close()
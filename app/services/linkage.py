@@ -1,13 +1,27 @@
 """Service for determining linkage between StreamLink and StreamLive resources."""
 import logging
 import re
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, List, NamedTuple, Set
 
 from app.config import get_settings
 
 logger = logging.getLogger(__name__)
 
 
+class FlowIndex(NamedTuple):
+    """StreamLink flows indexed by the output URL forms is_url_match compares.
+
+    Built once with LinkageMatcher.build_index and reused for every channel,
+    so linking N channels to F flows costs O(F + N) lookups instead of O(N*F)
+    URL comparisons.
+    """
+
+    flows: List[Dict]
+    by_url: Dict[str, List[int]]  # normalized output URL -> flow positions
+    by_key: Dict[str, List[int]]  # stream key (>= MIN_STREAM_KEY_LENGTH) -> flow positions
+    min_key_length: int
+
+
 class LinkageMatcher:
     """
     Determines technical linkage between StreamLink flows and StreamLive channels
@@ -33,11 +47,11 @@ class LinkageMatcher:
     def extract_query_params(cls, url: str) -> Dict[str, str]:
         """Extract query parameters from URL."""
         params = {}
-        if "?" in url:
-            query_part = url.split("?", 1)[1]
+        _, sep, query_part = url.partition("?")
+        if sep:
             for param in query_part.split("&"):
-                if "=" in param:
-                    key, value = param.split("=", 1)
+                key, eq, value = param.partition("=")
+                if eq:
                     params[key.lower()] = value
         return params
 
@@ -47,9 +61,7 @@ class LinkageMatcher:
         if not url:
             return []
         # Remove query string for path parsing
-        url_clean = url.strip().lower()
-        if "?" in url_clean:
-            url_clean = url_clean.split("?")[0]
+        url_clean = url.strip().lower().partition("?")[0]
         parts = re.split(r"[:/@]", url_clean)
         return [p for p in parts if p and p not in cls.IGNORE_TOKENS]
 
@@ -149,6 +161,47 @@ class LinkageMatcher:
         logger.debug(f"  Found {len(linked)} linked flows for '{channel_name}'")
         return linked
 
+    @classmethod
+    def build_index(cls, link_flows: List[Dict]) -> FlowIndex:
+        """Index StreamLink flows by normalized output URL and stream key."""
+        min_len = get_settings().MIN_STREAM_KEY_LENGTH
+        by_url: Dict[str, List[int]] = {}
+        by_key: Dict[str, List[int]] = {}
+        for pos, flow in enumerate(link_flows):
+            for out_url in flow.get("output_urls", []):
+                if not out_url:
+                    continue
+                by_url.setdefault(cls.normalize_url(out_url), []).append(pos)
+                key = cls.get_stream_key(out_url)
+                if key and len(key) >= min_len:
+                    by_key.setdefault(key, []).append(pos)
+        return FlowIndex(link_flows, by_url, by_key, min_len)
+
+    @classmethod
+    def find_linked_flows_indexed(
+        cls,
+        live_channel: Dict,
+        flow_index: FlowIndex,
+        exclude_ids: Set[str] = None,
+    ) -> List[Dict]:
+        """find_linked_flows against a prebuilt FlowIndex (same result and order)."""
+        exclude_ids = exclude_ids or set()
+        positions: Set[int] = set()
+        for endpoint in live_channel.get("input_endpoints", []):
+            if not endpoint:
+                continue
+            positions.update(flow_index.by_url.get(cls.normalize_url(endpoint), ()))
+            key = cls.get_stream_key(endpoint)
+            if key and len(key) >= flow_index.min_key_length:
+                positions.update(flow_index.by_key.get(key, ()))
+
+        flows = flow_index.flows
+        linked = [flows[pos] for pos in sorted(positions) if flows[pos].get("id") not in exclude_ids]
+        logger.debug(
+            f"  Found {len(linked)} linked flows for '{live_channel.get('name', live_channel.get('id', 'unknown'))}'"
+        )
+        return linked
+
 
 class ResourceHierarchyBuilder:
     """Builds hierarchy of resources based on technical linkage."""
@@ -158,12 +211,13 @@ class ResourceHierarchyBuilder:
         """Group channels into parent-children hierarchy based on linkage."""
         lives = [c for c in channels if c.get("service") == "StreamLive"]
         links = [c for c in channels if c.get("service") == "StreamLink"]
+        flow_index = LinkageMatcher.build_index(links)
 
         hierarchy = []
         assigned_link_ids = set()
 
         for live in lives:
-            linked_flows = LinkageMatcher.find_linked_flows(live, links, assigned_link_ids)
+            linked_flows = LinkageMatcher.find_linked_flows_indexed(live, flow_index, assigned_link_ids)
 
             for flow in linked_flows:
                 assigned_link_ids.add(flow["id"])
@@ -1,11 +1,22 @@
 """Tencent Cloud client service with async support."""
 import asyncio
+import atexit
+import heapq
 import logging
+import re
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
-from typing import Dict, List, Optional
-
+from collections import Counter, OrderedDict, deque
+from collections.abc import MutableMapping
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache, partial, wraps
+from operator import attrgetter, itemgetter
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from tencentcloud.common import credential
 from tencentcloud.common.exception.tencent_cloud_sdk_exception import (
     TencentCloudSDKException,
@@ -17,6 +28,7 @@ from tencentcloud.mdc.v20200828 import mdc_client, models as mdc_models
 
 from app.config import get_settings
 from app.models.enums import ChannelStatus
+from app.services.linkage import FlowIndex, LinkageMatcher, ResourceHierarchyBuilder
 
 logger = logging.getLogger(__name__)
 
@@ -37,8 +49,535 @@ except ImportError:
     logger.debug("CSS SDK (Live) not available")
 
 
+# Channel log event types relevant to main/backup pipeline detection
+# InputFailover = switched to backup, InputRecover = switched back to main
+# PipelineFailover/PipelineRecover = similar pipeline-level events
+# SilentSwitch = switched to placeholder image (no input signal)
+FAILOVER_EVENT_TYPES = frozenset([
+    "PipelineFailover", "PipelineRecover", "InputFailover", "InputRecover", "SilentSwitch",
+])
+FAILOVER_SWITCH_TYPES = frozenset(["PipelineFailover", "InputFailover"])
+
+# StreamLink statistics APIs are rate limited to 20 req/sec
+FLOW_STATS_CACHE_TTL = 60  # seconds
+FLOW_STATS_NEGATIVE_CACHE_TTL = 15  # seconds; failed lookups are retried sooner
+FLOW_STATS_IDLE_CACHE_TTL = 120  # seconds; idle flows rarely flip (start/stop invalidates)
+FLOW_STATS_RATE_LIMIT = 20  # requests per second over both flow statistics APIs, per process
+FLOW_STATS_CONCURRENCY = 15
+FLOW_STATS_WINDOW_BUCKET = 5  # seconds; batch calls within a bucket share one window
+FLOW_STATS_HEDGE_DELAY = 0.2  # seconds (~p50 realtime status latency) before requesting statistics alongside it
+FLOW_STATS_CACHE_SHARDS = 16  # power of two; each shard has its own lock
+
+# DescribeStreamLinkFlow calls for flows missing from the detail cache
+FLOW_DETAIL_RATE_LIMIT = 20  # requests per second (Tencent's default per-API quota), per process
+FLOW_DETAIL_CONCURRENCY = 8
+FLOW_DETAIL_THROTTLE_RETRIES = 2  # retries after a RequestLimitExceeded response
+FLOW_DETAIL_THROTTLE_BACKOFF = 0.5  # seconds; doubled on each retry
+
+# Pooled keep-alive connections per SDK client (per host), so parallel batch
+# calls reuse sockets instead of paying a TCP+TLS handshake each
+HTTP_POOL_MAXSIZE = 32
+# Transport-level retries for SDK requests: connection errors only. The SDK
+# sends every call (start/stop included) as POST, so read errors and HTTP
+# status codes are not retried and a delivered request is never re-sent.
+HTTP_RETRY = Retry(total=2, read=0, status=0, backoff_factor=0.2)
+
+RESOURCE_DETAILS_CACHE_TTL = 30  # seconds; start/stop invalidates explicitly
+PARENT_INDEX_CACHE_TTL = 30  # seconds; StreamLive -> linked StreamLink flow IDs
+STREAMPACKAGE_STATUS_CACHE_TTL = 30  # seconds; StreamPackage input status behind input status lookups
+
+# Concurrent per-service log queries in get_integrated_logs
+INTEGRATED_LOGS_CONCURRENCY = 8
+
+STATE_CACHE_TTL = 5  # seconds; state-only describe calls behind integrated logs
+LISTING_CACHE_TTL = 5  # seconds; channel/flow listings behind input status lookups
+INPUT_STATE_QUERY_TIMEOUT = 2  # seconds; per-request timeout for QueryInputStreamState
+INPUT_STATISTICS_HEDGE_DELAY = 0.3  # seconds (~p50 state query latency) before hedging with input statistics
+INPUT_STATUS_LEVELS = frozenset(["quick", "standard", "full"])  # get_channel_input_status min_level values
+
+# Incremental StreamLive channel log scans for active pipeline detection
+PIPELINE_LOG_CURSOR_OVERLAP = 60  # seconds re-read per scan for late log entries
+PIPELINE_LOG_EVENTS_MAX = 256  # failover events kept per channel
+
+# Worker threads shared by all AsyncTencentClient instances for SDK calls
+ASYNC_SDK_WORKERS = 16
+
+# Upper bound on cached entries so long-running processes don't grow without limit
+LINKAGE_CACHE_MAX_ENTRIES = 4096
+LINKAGE_CACHE_SHARDS = 16  # power of two; each shard has its own lock
+
+# Main/backup naming conventions for flows and inputs ("_b"/"_m" must not be
+# followed by a letter, so e.g. "news_broadcast" is not treated as backup)
+BACKUP_NAME_RE = re.compile(r"_b(?![a-z])|backup", re.IGNORECASE)
+MAIN_NAME_RE = re.compile(r"_m(?![a-z])|main", re.IGNORECASE)
+BACKUP_INPUT_NAME_RE = re.compile(r"_b(?![a-z])|backup|fv_", re.IGNORECASE)
+# Input Source Redundancy: the ingest region in an endpoint or flow URL tells
+# which source address it is (ap-seoul-1 typically main, ap-seoul-2 backup)
+MAIN_SOURCE_REGION = "ap-seoul-1"
+BACKUP_SOURCE_REGION = "ap-seoul-2"
+
+
+_MBPS_FORMAT = "{:.2f}".format
+
+# (Type, Time, Message) of a StreamLive PipelineLog entry
+_CHANNEL_LOG_FIELDS = attrgetter("Type", "Time", "Message")
+
+
+def _log_sort_key(log: Dict) -> str:
+    """Sort key for integrated log entries (ISO timestamps sort lexically)."""
+    return log.get("timestamp", log.get("time", ""))
+
+
+def _format_mbps(bitrate: float) -> str:
+    """Format a bitrate in bps as a Mbps string with two decimals ("0" when unset)."""
+    return _MBPS_FORMAT(bitrate / 1_000_000) if bitrate else "0"
+
+
+# Time formats expected by the Tencent APIs (all UTC)
+ISO_UTC_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+CSS_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+CSS_DATE_FORMAT = "%Y-%m-%d"
+
+
+@lru_cache(maxsize=8)
+def _iso_utc_at(epoch_second: int) -> str:
+    """Format a Unix timestamp (whole seconds) as the ISO 8601 UTC string the APIs expect."""
+    return datetime.fromtimestamp(epoch_second, timezone.utc).strftime(ISO_UTC_FORMAT)
+
+
+def _iso_utc_now() -> str:
+    """Current UTC time as an ISO 8601 string (formatted at most once per second)."""
+    return _iso_utc_at(int(time.time()))
+
+
+def _iso_utc_hours_ago(hours: float) -> str:
+    """UTC time ``hours`` ago as an ISO 8601 string."""
+    return _iso_utc_at(int(time.time() - hours * 3600))
+
+
+def _iso_utc_window(hours: float) -> tuple:
+    """(start, end) ISO 8601 strings for the last ``hours``, from one clock read."""
+    now = int(time.time())
+    return _iso_utc_at(now - int(hours * 3600)), _iso_utc_at(now)
+
+
+def _is_throttled(error: TencentCloudSDKException) -> bool:
+    """Whether an SDK error is Tencent's API rate limit (RequestLimitExceeded[.*])."""
+    return (error.get_code() or "").startswith("RequestLimitExceeded")
+
+
+@lru_cache(maxsize=512)
+def _url_match_forms(url: str) -> tuple:
+    """(stream key, normalized URL, source region) used to match flow outputs to endpoints.
+
+    The source region is "main", "backup" or None from the region marker in the URL.
+    """
+    url_lower = url.lower()
+    if MAIN_SOURCE_REGION in url_lower:
+        region = "main"
+    elif BACKUP_SOURCE_REGION in url_lower:
+        region = "backup"
+    else:
+        region = None
+    return url.rpartition("/")[2], url_lower.strip().rstrip("/"), region
+
+
+@lru_cache(maxsize=512)
+def _parse_css_stream_name(name: str) -> tuple:
+    """Split a CSS "app/stream" name into (AppName, StreamName); AppName is "" if absent."""
+    parts = name.split("/", 1)
+    return (parts[0], parts[1]) if len(parts) == 2 else ("", name)
+
+
+@lru_cache(maxsize=4)
+def _flow_stats_window(bucket: int) -> tuple:
+    """Return the (StartTime, EndTime) strings of the 5-minute statistics window.
+
+    Args:
+        bucket: int(time.time()) // FLOW_STATS_WINDOW_BUCKET
+    """
+    end = datetime.fromtimestamp(bucket * FLOW_STATS_WINDOW_BUCKET, timezone.utc)
+    start = end - timedelta(minutes=5)
+    return start.strftime(ISO_UTC_FORMAT), end.strftime(ISO_UTC_FORMAT)
+
+
+# control_resource dispatch: service (and its legacy alias) -> (start, stop) method names.
+# Names rather than bound methods so instance/class patches are honoured.
+_CONTROL_METHODS = {
+    "StreamLive": ("start_mdl_channel", "stop_mdl_channel"),
+    "MediaLive": ("start_mdl_channel", "stop_mdl_channel"),
+    "StreamLink": ("start_streamlink_input", "stop_streamlink_input"),
+    "MediaConnect": ("start_streamlink_input", "stop_streamlink_input"),
+}
+
+# Status keyword tables, checked in priority order (a state mentioning both
+# "start" and "error" is running). SDK states are matched case-insensitively
+# as substrings.
+_MDL_STATUS_KEYWORDS = (
+    (("running", "start"), ChannelStatus.RUNNING.value),
+    (("idle",), ChannelStatus.IDLE.value),
+    (("stop",), ChannelStatus.STOPPED.value),
+    (("error", "alert"), ChannelStatus.ERROR.value),
+)
+_STREAMLINK_STATUS_KEYWORDS = (
+    (("running", "start", "active", "online"), ChannelStatus.RUNNING.value),
+    (("idle", "wait"), ChannelStatus.IDLE.value),
+    (("stop", "off"), ChannelStatus.STOPPED.value),
+    (("error", "alert", "fail"), ChannelStatus.ERROR.value),
+)
+_UNKNOWN_STATUS = ChannelStatus.UNKNOWN.value
+
+
+def _match_status(state: str, table: tuple) -> str:
+    """Return the status of the first keyword group found in ``state``."""
+    state_lower = state.lower()
+    for keywords, status in table:
+        if any(keyword in state_lower for keyword in keywords):
+            return status
+    return _UNKNOWN_STATUS
+
+
+@lru_cache(maxsize=64)
+def _normalize_mdl_status(state: str) -> str:
+    """Normalize MediaLive status (cached; the set of API states is tiny)."""
+    return _match_status(state, _MDL_STATUS_KEYWORDS)
+
+
+@lru_cache(maxsize=64)
+def _normalize_streamlink_status(state: str) -> str:
+    """Normalize StreamLink status (cached; the set of API states is tiny)."""
+    return _match_status(state, _STREAMLINK_STATUS_KEYWORDS)
+
+
+def _model_fields(obj, defaults: Dict[str, Any]) -> Dict[str, Any]:
+    """Read several fields of an SDK model in one pass.
+
+    Tencent SDK models keep field values in ``__dict__`` under ``_<Name>``
+    behind property accessors, so reading the instance dict directly skips one
+    descriptor call per field. Unset (None) fields fall back to the default;
+    objects without those keys (e.g. plain test doubles) fall back to getattr.
+    """
+    d = getattr(obj, "__dict__", None) or {}
+    values = {}
+    for name, default in defaults.items():
+        key = "_" + name
+        if key in d:
+            value = d[key]
+        elif name in d:
+            value = d[name]
+        else:
+            value = getattr(obj, name, default)
+        values[name] = default if value is None else value
+    return values
+
+
+_STREAM_INFO_DEFAULTS = {"Status": 0, "InputAddress": "", "AppName": "", "StreamName": ""}
+_FAILOVER_SETTINGS_DEFAULTS = {"SecondaryInputId": "", "LossThreshold": None, "RecoverBehavior": None}
+_FLOW_STATUS_ITEM_DEFAULTS = {"Type": "", "InputId": "", "OutputId": "", "Protocol": ""}
+_COMMON_STATUS_DEFAULTS = {"Bitrate": 0, "State": "unknown", "ConnectedTime": ""}
+_SRT_STATUS_DEFAULTS = {"RTT": None, "RecvPacketLossRate": None, "SendPacketLossRate": None}
+_INPUT_SETTINGS_DEFAULTS = {"InputAddress": "", "AppName": "", "StreamName": "", "SourceUrl": ""}
+_CHANNEL_SUMMARY_DEFAULTS = {"Id": "", "Name": "Unknown Channel", "State": "unknown", "AttachedInputs": ()}
+_FLOW_SUMMARY_DEFAULTS = {"FlowId": "", "FlowName": "Unknown Flow", "State": "unknown", "MaxBandwidth": 0}
+_CHANNEL_INFO_DEFAULTS = {"Name": "", "AttachedInputs": (), "OutputGroups": ()}
+_INPUT_NAME_DEFAULTS = {"Id": "", "Name": ""}
+_INPUT_STATISTICS_DEFAULTS = {"InputId": "", "NetworkIn": 0, "NetworkValid": False}
+_INPUT_STREAM_STATE_DEFAULTS = {"InputName": "", "Protocol": "", "InputStreamInfoList": ()}
+
+
+class RateLimiter:
+    """Thread-safe token-bucket rate limiter.
+
+    Allows bursts of up to ``rate`` acquisitions and refills at ``rate`` tokens
+    per ``period`` seconds. Bounds the aggregate request rate of all threads
+    sharing it; a caller only sleeps when the bucket is empty.
+    """
+
+    def __init__(self, rate: int, period: float = 1.0):
+        self._rate = rate
+        self._period = period
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available and consume it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                elapsed = now - self._updated
+                self._updated = now
+                self._tokens = min(self._rate, self._tokens + elapsed * self._rate / self._period)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) * self._period / self._rate
+            time.sleep(wait)
+
+
+class BoundedCache(OrderedDict):
+    """Dict that evicts its least recently used entries beyond ``maxsize``.
+
+    Entries keep their own timestamps, so TTL checks stay with the callers;
+    this only bounds memory. Not thread-safe: callers hold their cache lock.
+    """
+
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        while len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
+class ShardedCache(MutableMapping):
+    """Thread-safe mapping spread over independently locked BoundedCache shards.
+
+    Single-key reads and writes only lock their key's shard, so lookups of
+    different keys from concurrent requests don't serialize. Compound
+    read-modify-write sequences still need a lock of their own.
+    """
+
+    def __init__(self, maxsize: int, shards: int = LINKAGE_CACHE_SHARDS):
+        self._shards = [(BoundedCache(max(1, maxsize // shards)), threading.Lock()) for _ in range(shards)]
+        self._mask = shards - 1
+
+    def _shard(self, key) -> tuple:
+        return self._shards[hash(key) & self._mask]
+
+    def __getitem__(self, key):
+        shard, lock = self._shard(key)
+        with lock:
+            return shard[key]
+
+    def get(self, key, default=None):
+        shard, lock = self._shard(key)
+        with lock:
+            return shard.get(key, default)
+
+    def __setitem__(self, key, value):
+        shard, lock = self._shard(key)
+        with lock:
+            shard[key] = value
+
+    def __delitem__(self, key):
+        shard, lock = self._shard(key)
+        with lock:
+            del shard[key]
+
+    def pop(self, key, *default):
+        shard, lock = self._shard(key)
+        with lock:
+            return shard.pop(key, *default)
+
+    def __contains__(self, key):
+        shard, lock = self._shard(key)
+        with lock:
+            return key in shard
+
+    def __iter__(self):
+        keys = []
+        for shard, lock in self._shards:
+            with lock:
+                keys.extend(shard)
+        return iter(keys)
+
+    def __len__(self):
+        return sum(len(shard) for shard, _ in self._shards)
+
+    def clear(self) -> None:
+        for shard, lock in self._shards:
+            with lock:
+                shard.clear()
+
+
+def _ttl_cached(ttl: float, ignore: tuple = ()):
+    """Cache a TencentCloudClient method's result in the linkage cache for ``ttl`` seconds.
+
+    Keyed by method name and arguments, so callers polling the same resource
+    state within the window reuse one SDK result. Keyword arguments named in
+    ``ignore`` (prefetched inputs, not part of the query) are left out of the key.
+    ``method.invalidate(self, *args)`` drops one cached result.
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            cache_key = (fn.__name__, args, tuple(sorted(
+                item for item in kwargs.items() if item[0] not in ignore
+            )))
+            cached = self._linkage_cache.get(cache_key)
+            if cached and (time.time() - cached["timestamp"] < ttl):
+                return cached["data"]
+
+            value = fn(self, *args, **kwargs)
+            self._linkage_cache[cache_key] = {"data": value, "timestamp": time.time()}
+            return value
+
+        def invalidate(self, *args) -> None:
+            """Drop the cached result for ``args`` (no keyword arguments)."""
+            self._linkage_cache.pop((fn.__name__, args, ()), None)
+
+        wrapper.invalidate = invalidate
+        return wrapper
+    return decorator
+
+
+@dataclass(slots=True)
+class InputState:
+    """Signal state of a StreamLive input collected by get_channel_input_status."""
+
+    bandwidth: int = 0
+    network_valid: bool = False
+    status: int = 0
+    is_active: bool = False
+    active_sources: list = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class ChannelInputStatus:
+    """Active input status of a StreamLive channel.
+
+    Built by get_channel_input_status and converted to a dict with to_dict()
+    at the return boundary; optional verification sections are omitted from
+    the dict when not set.
+    """
+
+    channel_id: str
+    channel_name: str = ""
+    active_input: Optional[str] = None
+    active_input_id: Optional[str] = None
+    primary_input_id: Optional[str] = None
+    secondary_input_id: Optional[str] = None
+    failover_loss_threshold: Optional[int] = None
+    failover_recover_behavior: Optional[str] = None
+    input_details: list = field(default_factory=list)
+    input_states: Dict[str, "InputState"] = field(default_factory=dict)
+    verification_sources: list = field(default_factory=list)
+    is_input_source_redundancy: bool = False
+    active_source_address: Optional[str] = None
+    streampackage_verification: Optional[Dict] = None
+    css_verification: Optional[Dict] = None
+    log_based_detection: Optional[Dict] = None
+    active_input_name: Optional[str] = None
+    message: str = ""
+
+    def to_dict(self) -> Dict:
+        """Convert to the dict shape returned by get_channel_input_status."""
+        result = {
+            "channel_id": self.channel_id,
+            "channel_name": self.channel_name,
+            "active_input": self.active_input,
+            "active_input_id": self.active_input_id,
+            "primary_input_id": self.primary_input_id,
+            "secondary_input_id": self.secondary_input_id,
+            "failover_loss_threshold": self.failover_loss_threshold,
+            "failover_recover_behavior": self.failover_recover_behavior,
+            "input_details": self.input_details,
+            "input_states": {inp_id: asdict(st) for inp_id, st in self.input_states.items()},
+            "verification_sources": self.verification_sources,
+            "verification_level": len(self.verification_sources),
+            "is_input_source_redundancy": self.is_input_source_redundancy,
+            "active_source_address": self.active_source_address,
+        }
+        if self.streampackage_verification is not None:
+            result["streampackage_verification"] = self.streampackage_verification
+        if self.css_verification is not None:
+            result["css_verification"] = self.css_verification
+        if self.log_based_detection is not None:
+            result["log_based_detection"] = self.log_based_detection
+        if self.active_input:
+            result["active_input_name"] = self.active_input_name
+        result["message"] = self.message
+        return result
+
+
+@dataclass(slots=True)
+class InputSourceStatus:
+    """QueryInputStreamState result for a single StreamLive input."""
+
+    input_id: str
+    input_name: str = ""
+    protocol: str = ""
+    active_sources: list = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class FlowStatItem:
+    """One input or output entry of DescribeStreamLinkFlowRealtimeStatus."""
+
+    type: str
+    input_id: str
+    output_id: str
+    bitrate: int
+    state: str
+    connected_time: Optional[str]
+    srt: Optional[Dict] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the item in the dict shape consumers expect."""
+        data = {
+            "type": self.type,
+            "input_id": self.input_id,
+            "output_id": self.output_id,
+            "bitrate": self.bitrate,
+            "bitrate_mbps": _format_mbps(self.bitrate),
+            "state": self.state,
+            "connected_time": self.connected_time,
+        }
+        if self.srt is not None:
+            data["rtt"] = self.srt["RTT"]
+            data["recv_packet_loss_rate"] = self.srt["RecvPacketLossRate"]
+            data["send_packet_loss_rate"] = self.srt["SendPacketLossRate"]
+        return data
+
+
+@dataclass(slots=True)
+class ChannelLogRecord:
+    """One StreamLive pipeline log entry collected by get_streamlive_channel_logs."""
+
+    resource_id: str
+    pipeline: str
+    event_type: str
+    time: str
+    message: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the entry in the integrated-log dict shape."""
+        return {
+            "service": "StreamLive",
+            "resource_id": self.resource_id,
+            "pipeline": self.pipeline,
+            "event_type": self.event_type,
+            "time": self.time,
+            "message": self.message,
+            "timestamp": self.time,
+        }
+
+
 class TencentCloudClient:
-    """Unified client for Tencent Cloud services."""
+    """Unified client for Tencent Cloud services.
+
+    Worker pools are shared by all instances (API dependencies build a client
+    per request), created with the first instance's THREAD_POOL_WORKERS and
+    shut down at interpreter exit.
+    """
+
+    _pools: Optional[tuple] = None
+    _rate_limiters: Dict[str, RateLimiter] = {}
+    _pools_lock = threading.Lock()
 
     def __init__(
         self,
@@ -55,179 +594,248 @@ class TencentCloudClient:
         self._timeout = settings.API_REQUEST_TIMEOUT
         self._max_workers = settings.THREAD_POOL_WORKERS
 
-        self._linkage_cache: Dict = {}
+        # Single-key cache reads and writes lock only their shard; _cache_lock
+        # guards compound updates (the list_all_resources refresh flag, the
+        # flow-detail merge in _cache_flow_details)
+        self._linkage_cache = ShardedCache(LINKAGE_CACHE_MAX_ENTRIES)
         self._cache_lock = threading.Lock()
-        self.executor = ThreadPoolExecutor(max_workers=self._max_workers)
-
-        # Pre-create SDK clients for reuse (thread-safe)
+        # Flow statistics are read far more often than written and batch calls
+        # from the dashboard run concurrently, so they live in sharded dicts
+        # instead of contending on _cache_lock.
+        self._flow_stats_shards = [
+            (BoundedCache(LINKAGE_CACHE_MAX_ENTRIES // FLOW_STATS_CACHE_SHARDS), threading.Lock())
+            for _ in range(FLOW_STATS_CACHE_SHARDS)
+        ]
+        (
+            self.executor,
+            self._sdk_call_executor,
+            self._stats_executor,
+            self._listing_executor,
+        ) = self._shared_pools(self._max_workers)
+        # Pace flow detail and flow statistics requests from every caller (sync
+        # and async paths, every per-request client) so cold-cache bursts stay
+        # within the API quota
+        self._mdc_rate_limiter = self._shared_rate_limiter("flow_detail", FLOW_DETAIL_RATE_LIMIT)
+        self._flow_stats_rate_limiter = self._shared_rate_limiter("flow_stats", FLOW_STATS_RATE_LIMIT)
+        # In-flight calls coalesced by _single_flight (integrated logs, cache
+        # refreshes), so identical concurrent requests share one fan-out
+        self._inflight: Dict[Any, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+        # Pre-create SDK clients for reuse (thread-safe). Profiles are built
+        # once per endpoint; services on the regional endpoint share one.
         self._cred = credential.Credential(self._secret_id, self._secret_key)
-        self._http_profile = HttpProfile()
-        self._http_profile.reqTimeout = self._timeout
-        self._client_profile = ClientProfile(httpProfile=self._http_profile)
-
-        # Cached client instances
-        self._mdc_client: Optional[mdc_client.MdcClient] = None
-        self._mdl_client: Optional[mdl_client.MdlClient] = None
-        self._mdp_client = None
-        self._css_client = None
+        regional_profile = self._build_client_profile()
+        self._client_profiles = {
+            "mdc": regional_profile,
+            "mdl": regional_profile,
+            "css": regional_profile,
+            # QueryInputStreamState gets a short request timeout of its own, so
+            # a silent input cannot hold a leaf worker until the SDK timeout
+            "mdl_state": self._build_client_profile(timeout=min(self._timeout, INPUT_STATE_QUERY_TIMEOUT)),
+            # StreamPackage has its own endpoint, so it gets its own profile
+            "mdp": self._build_client_profile("mdp.intl.tencentcloudapi.com"),
+        }
+
+        # Cached client instances, keyed like _client_profiles
+        self._sdk_clients: Dict[str, Any] = {}
         self._client_init_lock = threading.Lock()
 
         logger.info("TencentCloudClient initialized")
 
+    @classmethod
+    def _shared_pools(cls, max_workers: int) -> tuple:
+        """Return the process-wide (general, sdk_call, stats, listing) pools."""
+        with cls._pools_lock:
+            if cls._pools is None:
+                cls._pools = (
+                    ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="tc-sdk"),
+                    # Leaf SDK calls issued from inside executor tasks (e.g. the
+                    # parallel statistics request in get_flow_statistics,
+                    # per-domain CSS listing). Tasks here never submit further
+                    # work, so waiting on them cannot deadlock the general pool.
+                    ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="tc-leaf"),
+                    # Per-workload pools so a burst of rate-limited flow statistics
+                    # calls cannot starve cache pre-warming (or the other way round)
+                    ThreadPoolExecutor(max_workers=FLOW_STATS_CONCURRENCY, thread_name_prefix="tc-stats"),
+                    ThreadPoolExecutor(max_workers=4, thread_name_prefix="tc-list"),
+                )
+                atexit.register(cls.close)
+            return cls._pools
+
+    @classmethod
+    def _shared_rate_limiter(cls, name: str, rate: int) -> RateLimiter:
+        """Return the process-wide token bucket for an API family."""
+        with cls._pools_lock:
+            limiter = cls._rate_limiters.get(name)
+            if limiter is None:
+                limiter = cls._rate_limiters[name] = RateLimiter(rate)
+            return limiter
+
+    @classmethod
+    def close(cls) -> None:
+        """Shut down the shared worker pools (interpreter exit)."""
+        with cls._pools_lock:
+            pools, cls._pools = cls._pools, None
+        for pool in pools or ():
+            pool.shutdown(wait=False)
+
+    def _mount_connection_pool(self, client) -> None:
+        """Enlarge the SDK client's requests connection pool.
+
+        The SDK keeps one requests.Session per client, whose default adapter
+        only keeps 10 connections per host; batch calls run more in parallel.
+        The pool is never smaller than the general worker pool, so a larger
+        THREAD_POOL_WORKERS setting does not spill connections.
+        """
+        session = getattr(getattr(getattr(client, "request", None), "conn", None), "_session", None)
+        if session is None:
+            return
+        pool_size = max(HTTP_POOL_MAXSIZE, self._max_workers)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=HTTP_RETRY)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+    def _build_client_profile(self, endpoint: Optional[str] = None, timeout: Optional[float] = None) -> ClientProfile:
+        """Build a keep-alive client profile with the configured (or given) timeout."""
+        http_profile = HttpProfile()
+        http_profile.reqTimeout = self._timeout if timeout is None else timeout
+        http_profile.keepAlive = True
+        if endpoint:
+            http_profile.endpoint = endpoint
+        return ClientProfile(httpProfile=http_profile)
+
+    def _get_sdk_client(self, key: str, client_cls):
+        """Get the cached SDK client for a service key (thread-safe)."""
+        client = self._sdk_clients.get(key)
+        if client is None:
+            with self._client_init_lock:
+                client = self._sdk_clients.get(key)
+                if client is None:
+                    client = client_cls(self._cred, self._region, self._client_profiles[key])
+                    self._mount_connection_pool(client)
+                    self._sdk_clients[key] = client
+        return client
+
+    def refresh_credentials(self, secret_id: str, secret_key: str) -> None:
+        """Rotate the API credential; cached SDK clients are rebuilt on next use."""
+        with self._client_init_lock:
+            self._secret_id = secret_id
+            self._secret_key = secret_key
+            self._cred = credential.Credential(secret_id, secret_key)
+            self._sdk_clients = {}
+
     def _get_mdc_client(self) -> mdc_client.MdcClient:
         """Get cached MDC client (thread-safe)."""
-        if self._mdc_client is None:
-            with self._client_init_lock:
-                if self._mdc_client is None:
-                    self._mdc_client = mdc_client.MdcClient(
-                        self._cred, self._region, self._client_profile
-                    )
-        return self._mdc_client
+        return self._get_sdk_client("mdc", mdc_client.MdcClient)
 
     def _get_mdl_client(self) -> mdl_client.MdlClient:
         """Get cached MDL client (thread-safe)."""
-        if self._mdl_client is None:
-            with self._client_init_lock:
-                if self._mdl_client is None:
-                    self._mdl_client = mdl_client.MdlClient(
-                        self._cred, self._region, self._client_profile
-                    )
-        return self._mdl_client
+        return self._get_sdk_client("mdl", mdl_client.MdlClient)
+
+    def _get_mdl_state_client(self) -> mdl_client.MdlClient:
+        """Get cached MDL client with the QueryInputStreamState timeout (thread-safe)."""
+        return self._get_sdk_client("mdl_state", mdl_client.MdlClient)
 
     def _get_mdp_client(self):
         """Get cached MDP (StreamPackage) client (thread-safe)."""
         if not STREAMPACKAGE_AVAILABLE:
             return None
-        if self._mdp_client is None:
-            with self._client_init_lock:
-                if self._mdp_client is None:
-                    http_profile = HttpProfile()
-                    http_profile.reqTimeout = self._timeout
-                    http_profile.endpoint = "mdp.intl.tencentcloudapi.com"
-                    client_profile = ClientProfile(httpProfile=http_profile)
-                    self._mdp_client = mdp_client.MdpClient(
-                        self._cred, self._region, client_profile
-                    )
-        return self._mdp_client
+        return self._get_sdk_client("mdp", mdp_client.MdpClient)
 
     def _get_css_client(self):
         """Get cached CSS (Live) client (thread-safe)."""
         if not CSS_AVAILABLE:
             return None
-        if self._css_client is None:
-            with self._client_init_lock:
-                if self._css_client is None:
-                    self._css_client = live_client.LiveClient(
-                        self._cred, self._region, self._client_profile
-                    )
-        return self._css_client
+        return self._get_sdk_client("css", live_client.LiveClient)
 
     def _normalize_mdl_status(self, state: str) -> str:
         """Normalize MediaLive status."""
-        state_lower = str(state).lower()
-        if "running" in state_lower or "start" in state_lower:
-            return ChannelStatus.RUNNING.value
-        elif "idle" in state_lower:
-            return ChannelStatus.IDLE.value
-        elif "stop" in state_lower:
-            return ChannelStatus.STOPPED.value
-        elif "error" in state_lower or "alert" in state_lower:
-            return ChannelStatus.ERROR.value
-        return ChannelStatus.UNKNOWN.value
+        return _normalize_mdl_status(str(state))
 
     def _normalize_streamlink_status(self, state: str) -> str:
         """Normalize StreamLink status."""
-        state_str = str(state).lower()
-        if any(x in state_str for x in ["running", "start", "active", "online"]):
-            return ChannelStatus.RUNNING.value
-        elif any(x in state_str for x in ["idle", "wait"]):
-            return ChannelStatus.IDLE.value
-        elif any(x in state_str for x in ["stop", "off"]):
-            return ChannelStatus.STOPPED.value
-        elif any(x in state_str for x in ["error", "alert", "failed", "fail"]):
-            return ChannelStatus.ERROR.value
-        return ChannelStatus.UNKNOWN.value
+        return _normalize_streamlink_status(str(state))
+
+    @staticmethod
+    def _extract_input_endpoints(inp) -> List[str]:
+        """Extract unique endpoint URLs from a StreamLive input."""
+        endpoints = []
+        settings = getattr(inp, "InputSettings", None) or ()
+        for sett in settings:
+            fields = _model_fields(sett, _INPUT_SETTINGS_DEFAULTS)
+            addr = fields["InputAddress"]
+            app = fields["AppName"]
+            stream = fields["StreamName"]
+            src_url = fields["SourceUrl"]
+
+            if addr and app and stream:
+                endpoints.append(f"{addr}/{app}/{stream}")
+            elif addr:
+                endpoints.append(addr)
+            if src_url:
+                endpoints.append(src_url)
+
+        if not endpoints:
+            for addr_info in getattr(inp, "InputAddressList", None) or ():
+                ip = getattr(addr_info, "Ip", "")
+                if ip:
+                    endpoints.append(ip)
+
+        return list(dict.fromkeys(endpoints))
 
     def list_mdl_channels(self) -> List[Dict]:
         """List StreamLive channels."""
         try:
             client = self._get_mdl_client()
-            req = mdl_models.DescribeStreamLiveChannelsRequest()
-            resp = client.DescribeStreamLiveChannels(req)
-            info_list = resp.Infos if hasattr(resp, "Infos") else []
 
             cache_key = "mdl_batch_inputs"
             input_map = {}
             input_name_map = {}
 
-            with self._cache_lock:
-                cached = self._linkage_cache.get(cache_key)
-                if cached and (time.time() - cached["timestamp"] < self._cache_ttl):
-                    input_map = cached["data"]
-                    input_name_map = cached.get("name_map", {})
-
+            cached = self._linkage_cache.get(cache_key)
+            if cached and (time.time() - cached["timestamp"] < self._cache_ttl):
+                input_map = cached["data"]
+                input_name_map = cached.get("name_map", {})
+
+            # The input listing does not depend on the channel listing, so on
+            # a cache miss both calls are in flight at once. Concurrent cache
+            # misses share one listing.
+            inputs_future = None
             if not input_map:
-                try:
-                    inp_req = mdl_models.DescribeStreamLiveInputsRequest()
-                    inp_resp = client.DescribeStreamLiveInputs(inp_req)
-                    all_inputs = inp_resp.Infos if hasattr(inp_resp, "Infos") else []
-
-                    for inp in all_inputs:
-                        endpoints = []
-                        settings = getattr(inp, "InputSettings", [])
-                        for sett in settings:
-                            addr = getattr(sett, "InputAddress", "")
-                            app = getattr(sett, "AppName", "")
-                            stream = getattr(sett, "StreamName", "")
-                            src_url = getattr(sett, "SourceUrl", "")
-
-                            if addr and app and stream:
-                                endpoints.append(f"{addr}/{app}/{stream}")
-                            elif addr:
-                                endpoints.append(addr)
-                            if src_url:
-                                endpoints.append(src_url)
-
-                        if not endpoints and hasattr(inp, "InputAddressList"):
-                            for addr_info in getattr(inp, "InputAddressList", []):
-                                ip = getattr(addr_info, "Ip", "")
-                                if ip:
-                                    endpoints.append(ip)
-
-                        inp_id = str(getattr(inp, "Id", "")).strip()
-                        if inp_id:
-                            input_map[inp_id] = list(set(endpoints))
-                            # Try multiple name attributes
-                            input_name = getattr(inp, "Name", "") or getattr(inp, "InputName", "")
-                            input_type = getattr(inp, "Type", "")
-                            if input_name or input_type:
-                                input_name_map[inp_id] = {
-                                    "name": input_name,
-                                    "type": input_type,
-                                }
+                inputs_future = self._sdk_call_executor.submit(
+                    self._single_flight, cache_key, self._fetch_mdl_input_maps
+                )
 
-                    with self._cache_lock:
-                        self._linkage_cache[cache_key] = {
-                            "data": input_map,
-                            "name_map": input_name_map,
-                            "timestamp": time.time(),
-                        }
+            req = mdl_models.DescribeStreamLiveChannelsRequest()
+            resp = client.DescribeStreamLiveChannels(req)
+            info_list = getattr(resp, "Infos", None) or []
+            if not info_list:
+                # Nothing to attach inputs to; an in-flight input listing still
+                # finishes in the background and warms the cache
+                return []
+
+            if inputs_future:
+                try:
+                    input_map, input_name_map = inputs_future.result()
                 except Exception as e:
                     logger.error(f"Failed to fetch batch inputs: {e}")
 
             channels = []
             for info in info_list:
-                ch_id = getattr(info, "Id", "")
-                ch_name = getattr(info, "Name", "Unknown Channel")
-                ch_state = getattr(info, "State", "unknown")
-                attached_inputs = getattr(info, "AttachedInputs", [])
-
-                input_endpoints = []
+                fields = _model_fields(info, _CHANNEL_SUMMARY_DEFAULTS)
+                ch_id = fields["Id"]
+                ch_name = fields["Name"]
+                ch_state = fields["State"]
+                attached_inputs = fields["AttachedInputs"]
+
+                # Ordered set: primary input's endpoints first, duplicates dropped
+                input_endpoints: Dict[str, None] = {}
                 input_details = []
                 for att in attached_inputs:
                     att_id = str(getattr(att, "Id", att)).strip()
                     if att_id in input_map:
-                        input_endpoints.extend(input_map[att_id])
+                        input_endpoints.update(dict.fromkeys(input_map[att_id]))
 
                     input_name = getattr(att, "Name", "")
                     input_type = ""
@@ -251,7 +859,7 @@ class TencentCloudClient:
                     "service": "StreamLive",
                     "type": "channel",
                     "input_attachments": input_details,
-                    "input_endpoints": list(set(input_endpoints)),
+                    "input_endpoints": list(input_endpoints),
                 })
 
             return channels
@@ -260,28 +868,102 @@ class TencentCloudClient:
             logger.error(f"Failed to list MediaLive channels: {e}")
             return []
 
+    def _fetch_mdl_input_maps(self) -> tuple:
+        """List all StreamLive inputs and cache their endpoints and names.
+
+        Returns:
+            (input_map, input_name_map): input ID -> endpoints, and input ID ->
+            {"name", "type"}
+        """
+        client = self._get_mdl_client()
+        inp_resp = client.DescribeStreamLiveInputs(mdl_models.DescribeStreamLiveInputsRequest())
+        input_map = {}
+        input_name_map = {}
+
+        for inp in getattr(inp_resp, "Infos", None) or []:
+            inp_id = str(getattr(inp, "Id", "")).strip()
+            if inp_id:
+                input_map[inp_id] = self._extract_input_endpoints(inp)
+                # Try multiple name attributes
+                input_name = getattr(inp, "Name", "") or getattr(inp, "InputName", "")
+                input_type = getattr(inp, "Type", "")
+                if input_name or input_type:
+                    input_name_map[inp_id] = {
+                        "name": input_name,
+                        "type": input_type,
+                    }
+
+        self._linkage_cache["mdl_batch_inputs"] = {
+            "data": input_map,
+            "name_map": input_name_map,
+            "timestamp": time.time(),
+        }
+        return input_map, input_name_map
+
+    def _single_flight(self, key, fn, *args):
+        """Call ``fn(*args)``, sharing the result with concurrent calls for ``key``.
+
+        The first caller for a key runs ``fn``; callers arriving while it is in
+        flight wait for and return its result (or exception) instead of
+        issuing the same API calls again.
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+
+        if not owner:
+            return future.result()
+
+        try:
+            result = fn(*args)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+    def _fetch_flow_detail_once(self, flow_id: str) -> Dict:
+        """_fetch_single_flow_detail, shared by concurrent listings of the same flow."""
+        return self._single_flight(("flow_detail", flow_id), self._fetch_single_flow_detail, flow_id)
+
     def _fetch_single_flow_detail(self, flow_id: str) -> Dict:
         """Fetch detailed flow info."""
         try:
             client = self._get_mdc_client()
             req = mdc_models.DescribeStreamLinkFlowRequest()
             req.FlowId = flow_id
-            resp = client.DescribeStreamLinkFlow(req)
-
-            if hasattr(resp, "Info"):
-                info = resp.Info
+            for attempt in range(FLOW_DETAIL_THROTTLE_RETRIES + 1):
+                self._mdc_rate_limiter.acquire()
+                try:
+                    resp = client.DescribeStreamLinkFlow(req)
+                    break
+                except TencentCloudSDKException as e:
+                    if attempt == FLOW_DETAIL_THROTTLE_RETRIES or not _is_throttled(e):
+                        raise
+                    logger.debug(f"DescribeStreamLinkFlow throttled for {flow_id}, backing off")
+                    time.sleep(FLOW_DETAIL_THROTTLE_BACKOFF * 2 ** attempt)
+
+            info = getattr(resp, "Info", None)
+            if info is not None:
                 output_urls = []
                 monitor_url = None  # RTMP_PULL monitor URL for playback
 
-                if hasattr(info, "OutputGroup"):
-                    for og in info.OutputGroup:
+                output_group = getattr(info, "OutputGroup", None)
+                if output_group:
+                    for og in output_group:
                         protocol = getattr(og, "Protocol", "")
                         output_name = getattr(og, "OutputName", "").lower()
 
                         # Extract RTMP_PULL monitor URL for VLC playback
                         if protocol == "RTMP_PULL":
-                            if hasattr(og, "RTMPPullSettings") and og.RTMPPullSettings:
-                                server_urls = getattr(og.RTMPPullSettings, "ServerUrls", [])
+                            pull_settings = getattr(og, "RTMPPullSettings", None)
+                            if pull_settings:
+                                server_urls = getattr(pull_settings, "ServerUrls", [])
                                 for url_info in server_urls:
                                     # url_info can be a dict string or object
                                     if isinstance(url_info, str):
@@ -302,8 +984,9 @@ class TencentCloudClient:
                             continue
 
                         if protocol == "RTMP" or "streamlive" in output_name:
-                            if hasattr(og, "RTMPSettings") and og.RTMPSettings:
-                                dests = getattr(og.RTMPSettings, "Destinations", [])
+                            rtmp_settings = getattr(og, "RTMPSettings", None)
+                            if rtmp_settings:
+                                dests = getattr(rtmp_settings, "Destinations", [])
                                 for d in dests:
                                     url = getattr(d, "Url", "")
                                     key = getattr(d, "StreamKey", "")
@@ -313,14 +996,15 @@ class TencentCloudClient:
                                     elif url:
                                         output_urls.append(url)
 
-                input_group = getattr(info, "InputGroup", [])
-                input_details = []
-                for inp in input_group:
-                    input_details.append({
-                        "id": getattr(inp, "InputId", ""),
-                        "name": getattr(inp, "InputName", "") or getattr(inp, "InputId", "") or "Unknown",
+                input_group = getattr(info, "InputGroup", ())
+                input_details = [
+                    {
+                        "id": (inp_id := getattr(inp, "InputId", "")),
+                        "name": getattr(inp, "InputName", "") or inp_id or "Unknown",
                         "protocol": getattr(inp, "Protocol", ""),
-                    })
+                    }
+                    for inp in input_group
+                ]
 
                 return {
                     "id": flow_id,
@@ -339,93 +1023,153 @@ class TencentCloudClient:
     def list_streamlink_inputs(self) -> List[Dict]:
         """List StreamLink flows with incremental detail fetching."""
         try:
-            client = self._get_mdc_client()
-            req = mdc_models.DescribeStreamLinkFlowsRequest()
-            req.PageNum = 1
-            req.PageSize = 100
-            resp = client.DescribeStreamLinkFlows(req)
-            summary_list = resp.Infos if hasattr(resp, "Infos") else []
+            return self._streamlink_inputs_from_summaries(self._list_streamlink_flow_summaries())
+        except Exception as e:
+            logger.error(f"Failed to list StreamLink flows: {e}")
+            return []
 
-            cache_key = "mdc_linkage_details"
-            flow_details = {}
-            ids_to_fetch = []
+    def _streamlink_inputs_from_summaries(self, summary_list: list) -> List[Dict]:
+        """Build the StreamLink flow listing, fetching only missing flow details.
 
-            with self._cache_lock:
-                cached = self._linkage_cache.get(cache_key)
-                if cached:
-                    flow_details = cached.get("data", {}).copy()
+        The detail calls are leaf SDK calls, so they run on the leaf pool: the
+        caller may itself be a task on the shared general pool.
+        """
+        if not summary_list:
+            return []
+        flow_details, ids_to_fetch = self._get_cached_flow_details(summary_list)
 
-            # Find which flows need detail fetching (new or not in cache)
-            for f in summary_list:
-                flow_id = f.FlowId
-                if flow_id not in flow_details:
-                    ids_to_fetch.append(flow_id)
+        # Only fetch details for new/missing flows
+        if ids_to_fetch:
+            logger.info(f"Fetching details for {len(ids_to_fetch)} new flows (skipping {len(summary_list) - len(ids_to_fetch)} cached)")
+            flow_details = self._cache_flow_details(
+                flow_details,
+                zip(ids_to_fetch, self._sdk_call_executor.map(self._fetch_flow_detail_once, ids_to_fetch)),
+            )
+        else:
+            logger.debug(f"All {len(summary_list)} flows found in cache")
 
-            # Only fetch details for new/missing flows
-            if ids_to_fetch:
-                logger.info(f"Fetching details for {len(ids_to_fetch)} new flows (skipping {len(summary_list) - len(ids_to_fetch)} cached)")
-                results = list(self.executor.map(self._fetch_single_flow_detail, ids_to_fetch))
-                for res in results:
-                    flow_details[res["id"]] = res
+        return self._build_streamlink_inputs(summary_list, flow_details)
 
-                with self._cache_lock:
-                    self._linkage_cache[cache_key] = {"data": flow_details, "timestamp": time.time()}
-            else:
-                logger.debug(f"All {len(summary_list)} flows found in cache")
+    @_ttl_cached(LISTING_CACHE_TTL)
+    def _streamlink_flows(self) -> List[Dict]:
+        """list_streamlink_inputs(), shared by status lookups for a few seconds.
 
-            inputs = []
-            for info in summary_list:
-                flow_id = getattr(info, "FlowId", "")
-                detail = flow_details.get(flow_id, {})
+        Start/stop of a flow drops the cached listing.
+        """
+        return self.list_streamlink_inputs()
 
-                # Get protocol from input_details
-                input_details = detail.get("input_details", [])
-                protocol = input_details[0].get("protocol", "") if input_details else ""
+    @_ttl_cached(LISTING_CACHE_TTL)
+    def _streamlink_flow_index(self) -> FlowIndex:
+        """_streamlink_flows() indexed for LinkageMatcher.find_linked_flows_indexed."""
+        return LinkageMatcher.build_index(self._streamlink_flows())
 
-                # Get max bandwidth from summary (in bps, convert to Mbps for display)
-                max_bandwidth = getattr(info, "MaxBandwidth", 0)
-                max_bandwidth_mbps = max_bandwidth // 1000000 if max_bandwidth else 0
+    def _list_streamlink_flow_summaries(self) -> list:
+        """List StreamLink flow summaries (first page, up to 100 flows)."""
+        client = self._get_mdc_client()
+        req = mdc_models.DescribeStreamLinkFlowsRequest()
+        req.PageNum = 1
+        req.PageSize = 100
+        resp = client.DescribeStreamLinkFlows(req)
+        return getattr(resp, "Infos", None) or []
 
-                inputs.append({
-                    "id": flow_id,
-                    "name": getattr(info, "FlowName", "Unknown Flow"),
-                    "status": detail.get("status", self._normalize_streamlink_status(getattr(info, "State", "unknown"))),
-                    "service": "StreamLink",
-                    "type": "flow",
-                    "output_urls": detail.get("output_urls", []),
-                    "monitor_url": detail.get("monitor_url"),  # VLC playable URL
-                    "input_attachments": detail.get("input_details", []),
-                    "protocol": protocol,
-                    "max_bandwidth_mbps": max_bandwidth_mbps,
-                })
+    def _get_cached_flow_details(self, summary_list: list) -> tuple:
+        """Split flows into cached details and IDs whose details must be fetched.
 
-            logger.info(f"Found {len(inputs)} StreamLink resources")
-            return inputs
+        Returns:
+            (flow_details, ids_to_fetch) where flow_details is the cached
+            details keyed by flow ID. It is shared with the cache and must
+            not be mutated; _cache_flow_details merges into a new dict.
+        """
+        cached = self._linkage_cache.get("mdc_linkage_details")
+        flow_details = cached.get("data", {}) if cached else {}
 
-        except Exception as e:
-            logger.error(f"Failed to list StreamLink flows: {e}")
-            return []
+        # Find which flows need detail fetching (new or not in cache)
+        ids_to_fetch = [f.FlowId for f in summary_list if f.FlowId not in flow_details]
+        return flow_details, ids_to_fetch
+
+    def _cache_flow_details(self, flow_details: Dict[str, Dict], fetched) -> Dict[str, Dict]:
+        """Cache ``flow_details`` merged with fetched (flow_id, detail) pairs.
+
+        The merge also folds in whatever concurrent listings cached since
+        ``flow_details`` was read, so their details are not overwritten.
+        Returns the merged dict; ``flow_details`` itself is left untouched.
+        """
+        fetched = dict(fetched)  # finish the network calls before locking
+        with self._cache_lock:
+            cached = self._linkage_cache.get("mdc_linkage_details")
+            merged = {**flow_details}
+            if cached and cached["data"] is not flow_details:
+                merged.update(cached["data"])
+            merged.update(fetched)
+            self._linkage_cache["mdc_linkage_details"] = {"data": merged, "timestamp": time.time()}
+        return merged
+
+    def _build_streamlink_inputs(self, summary_list: list, flow_details: Dict[str, Dict]) -> List[Dict]:
+        """Build StreamLink resource dicts from flow summaries and their details."""
+        inputs = []
+        for info in summary_list:
+            fields = _model_fields(info, _FLOW_SUMMARY_DEFAULTS)
+            flow_id = fields["FlowId"]
+            detail = flow_details.get(flow_id, {})
+
+            # Get protocol from input_details
+            input_details = detail.get("input_details", [])
+            protocol = input_details[0].get("protocol", "") if input_details else ""
+
+            # Get max bandwidth from summary (in bps, convert to Mbps for display)
+            max_bandwidth = fields["MaxBandwidth"]
+            max_bandwidth_mbps = max_bandwidth // 1000000 if max_bandwidth else 0
+
+            inputs.append({
+                "id": flow_id,
+                "name": fields["FlowName"],
+                "status": detail.get("status") or self._normalize_streamlink_status(fields["State"]),
+                "service": "StreamLink",
+                "type": "flow",
+                "output_urls": detail.get("output_urls", []),
+                "monitor_url": detail.get("monitor_url"),  # VLC playable URL
+                "input_attachments": detail.get("input_details", []),
+                "protocol": protocol,
+                "max_bandwidth_mbps": max_bandwidth_mbps,
+            })
+
+        logger.info(f"Found {len(inputs)} StreamLink resources")
+        return inputs
 
     def _fetch_all_resources_sync(self) -> List[Dict]:
-        """Fetch all resources (internal, no cache)."""
-        all_resources = []
+        """Fetch all resources (internal, no cache).
 
-        f_mdl = self.executor.submit(self.list_mdl_channels)
-        f_link = self.executor.submit(self.list_streamlink_inputs)
+        This runs on shared pool threads (background refresh, pre-warming), so
+        only leaf SDK calls are handed to the leaf pool; the listings that wait
+        on other work run in this thread instead of queueing behind other
+        clients' tasks in the general pool.
+        """
+        all_resources = []
 
-        mdl_channels = f_mdl.result()
-        link_resources = f_link.result()
+        summaries_future = self._sdk_call_executor.submit(self._list_streamlink_flow_summaries)
+        mdl_channels = self.list_mdl_channels()
+        try:
+            link_resources = self._streamlink_inputs_from_summaries(summaries_future.result())
+        except Exception as e:
+            logger.error(f"Failed to list StreamLink flows: {e}")
+            link_resources = []
 
         all_resources.extend(mdl_channels)
         all_resources.extend(link_resources)
 
         return all_resources
 
-    def list_all_resources(self, force_refresh: bool = False) -> List[Dict]:
+    def _fetch_all_resources_once(self) -> List[Dict]:
+        """_fetch_all_resources_sync, shared by concurrent cold-cache and refresh callers."""
+        return self._single_flight("all_resources", self._fetch_all_resources_sync)
+
+    def list_all_resources(self, force_refresh: bool = False, cached_only: bool = False) -> Optional[List[Dict]]:
         """List all resources with stale-while-revalidate caching.
 
         Args:
             force_refresh: If True, bypass cache and fetch fresh data
+            cached_only: If True, return None instead of fetching synchronously
+                when there is no usable cache entry
 
         Returns:
             List of all resources (may be stale if background refresh is in progress)
@@ -445,7 +1189,9 @@ class TencentCloudClient:
 
         # No cache or cache too old - synchronous fetch required
         if not cached or (now - cached["timestamp"] > max_ttl):
-            all_resources = self._fetch_all_resources_sync()
+            if cached_only:
+                return None
+            all_resources = self._fetch_all_resources_once()
             with self._cache_lock:
                 self._linkage_cache[cache_key] = {
                     "data": all_resources,
@@ -467,7 +1213,7 @@ class TencentCloudClient:
 
             def background_refresh():
                 try:
-                    fresh_data = self._fetch_all_resources_sync()
+                    fresh_data = self._fetch_all_resources_once()
                     with self._cache_lock:
                         self._linkage_cache[cache_key] = {
                             "data": fresh_data,
@@ -496,6 +1242,7 @@ class TencentCloudClient:
             req = mdl_models.StartStreamLiveChannelRequest()
             req.Id = channel_id
             client.StartStreamLiveChannel(req)
+            self.invalidate_resource_details(channel_id, "StreamLive")
             return {"success": True, "message": "MediaLive channel started successfully"}
         except TencentCloudSDKException as e:
             logger.error(f"Failed to start MediaLive channel: {e}")
@@ -508,6 +1255,7 @@ class TencentCloudClient:
             req = mdl_models.StopStreamLiveChannelRequest()
             req.Id = channel_id
             client.StopStreamLiveChannel(req)
+            self.invalidate_resource_details(channel_id, "StreamLive")
             return {"success": True, "message": "MediaLive channel stopped successfully"}
         except TencentCloudSDKException as e:
             logger.error(f"Failed to stop MediaLive channel: {e}")
@@ -518,6 +1266,10 @@ class TencentCloudClient:
         try:
             client = self._get_mdc_client()
             client.call_json("StartStreamLinkFlow", {"FlowId": input_id})
+            self.invalidate_flow_stats(input_id)
+            self.invalidate_resource_details(input_id, "StreamLink")
+            self._streamlink_flows.invalidate(self)
+            self._streamlink_flow_index.invalidate(self)
             return {"success": True, "message": "StreamLink flow started successfully"}
         except TencentCloudSDKException as e:
             logger.error(f"Failed to start StreamLink flow: {e}")
@@ -528,6 +1280,10 @@ class TencentCloudClient:
         try:
             client = self._get_mdc_client()
             client.call_json("StopStreamLinkFlow", {"FlowId": input_id})
+            self.invalidate_flow_stats(input_id)
+            self.invalidate_resource_details(input_id, "StreamLink")
+            self._streamlink_flows.invalidate(self)
+            self._streamlink_flow_index.invalidate(self)
             return {"success": True, "message": "StreamLink flow stopped successfully"}
         except TencentCloudSDKException as e:
             logger.error(f"Failed to stop StreamLink flow: {e}")
@@ -535,30 +1291,28 @@ class TencentCloudClient:
 
     def control_resource(self, resource_id: str, service: str, action: str) -> Dict:
         """Control a resource (start/stop/restart)."""
-        if service in ["StreamLive", "MediaLive"]:
-            if action == "start":
-                return self.start_mdl_channel(resource_id)
-            elif action == "stop":
-                return self.stop_mdl_channel(resource_id)
-            elif action == "restart":
-                stop_result = self.stop_mdl_channel(resource_id)
-                if stop_result["success"]:
-                    return self.start_mdl_channel(resource_id)
-                return stop_result
-
-        elif service in ["StreamLink", "MediaConnect"]:
+        methods = _CONTROL_METHODS.get(service)
+        if methods is not None:
+            start = getattr(self, methods[0])
+            stop = getattr(self, methods[1])
             if action == "start":
-                return self.start_streamlink_input(resource_id)
-            elif action == "stop":
-                return self.stop_streamlink_input(resource_id)
-            elif action == "restart":
-                stop_result = self.stop_streamlink_input(resource_id)
-                if stop_result["success"]:
-                    return self.start_streamlink_input(resource_id)
-                return stop_result
+                return start(resource_id)
+            if action == "stop":
+                return stop(resource_id)
+            if action == "restart":
+                return self._restart(start, stop, resource_id)
 
         return {"success": False, "message": f"Action {action} not supported for {service}"}
 
+    @staticmethod
+    def _restart(start: Callable[[str], Dict], stop: Callable[[str], Dict], resource_id: str) -> Dict:
+        """Stop then start a resource; the stop failure is returned as-is."""
+        stop_result = stop(resource_id)
+        if stop_result["success"]:
+            return start(resource_id)
+        return stop_result
+
+    @_ttl_cached(STREAMPACKAGE_STATUS_CACHE_TTL)
     def _get_streampackage_input_status(self, streampackage_id: str) -> Optional[Dict]:
         """
         Get StreamPackage channel input status (main/backup).
@@ -568,7 +1322,7 @@ class TencentCloudClient:
         """
         if not STREAMPACKAGE_AVAILABLE:
             return None
-        
+
         try:
             client = self._get_mdp_client()
             if not client:
@@ -579,11 +1333,10 @@ class TencentCloudClient:
             req.Id = streampackage_id
             
             resp = client.DescribeStreamPackageChannel(req)
-            if not hasattr(resp, "Info"):
+            info = getattr(resp, "Info", None)
+            if info is None:
                 return None
             
-            info = resp.Info
-            
             # Check Points.Inputs (input URLs for primary and backup)
             points = getattr(info, "Points", None)
             input_urls = []
@@ -631,8 +1384,7 @@ class TencentCloudClient:
                 if len(active_inputs) == 1:
                     active_input = active_inputs[0]
                     active_input_id = active_input["id"]
-                    inp_name = active_input["name"].lower()
-                    if "backup" in inp_name or "_b" in inp_name:
+                    if BACKUP_NAME_RE.search(active_input["name"]):
                         active_input_type = "backup"
                     else:
                         active_input_type = "main"
@@ -653,6 +1405,7 @@ class TencentCloudClient:
             logger.debug(f"Could not get StreamPackage input status: {e}")
             return None
 
+    @_ttl_cached(STATE_CACHE_TTL)
     def _get_css_stream_status(self, stream_name: str, domain: str = None) -> Optional[Dict]:
         """
         Get CSS stream status to verify which origin is active.
@@ -678,12 +1431,10 @@ class TencentCloudClient:
                 req.DomainName = domain
             
             # Parse stream name (format: app/stream)
-            parts = stream_name.split("/")
-            if len(parts) >= 2:
-                req.AppName = parts[0]
-                req.StreamName = "/".join(parts[1:])
-            else:
-                req.StreamName = stream_name
+            app_name, stream = _parse_css_stream_name(stream_name)
+            if app_name:
+                req.AppName = app_name
+            req.StreamName = stream
             
             resp = client.DescribeLiveStreamState(req)
             
@@ -700,6 +1451,12 @@ class TencentCloudClient:
             logger.debug(f"Could not get CSS stream status: {e}")
             return None
 
+    def _active_pipeline_once(self, channel_id: str, hours: int = 24) -> Optional[Dict]:
+        """_get_active_pipeline_from_logs, shared by concurrent lookups of the same channel."""
+        return self._single_flight(
+            ("pipeline_logs", channel_id, hours), self._get_active_pipeline_from_logs, channel_id, hours
+        )
+
     def _get_active_pipeline_from_logs(self, channel_id: str, hours: int = 24) -> Optional[Dict]:
         """
         Get active pipeline (main/backup/silent) from channel logs.
@@ -719,33 +1476,37 @@ class TencentCloudClient:
                 - failover_count: Number of failovers in the period
         """
         try:
-            from datetime import datetime, timedelta, timezone
-
             client = self._get_mdl_client()
 
+            # Logs are append-only: keep the failover events already seen for
+            # this channel and only ask for what was logged since the last scan
+            # (with a small overlap for late-arriving entries)
+            now = int(time.time())
+            window_start = now - int(hours * 3600)
+            state_key = ("pipeline_log_events", channel_id, hours)
+            state = self._linkage_cache.get(state_key)
+            start = window_start
+            if state:
+                start = max(window_start, state["cursor"] - PIPELINE_LOG_CURSOR_OVERLAP)
+
             log_req = mdl_models.DescribeStreamLiveChannelLogsRequest()
             log_req.ChannelId = channel_id
-            log_req.StartTime = (datetime.now(timezone.utc) - timedelta(hours=hours)).strftime("%Y-%m-%dT%H:%M:%SZ")
-            log_req.EndTime = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+            log_req.StartTime = _iso_utc_at(start)
+            log_req.EndTime = _iso_utc_at(now)
 
             log_resp = client.DescribeStreamLiveChannelLogs(log_req)
 
-            if not log_resp.Infos:
-                return {
-                    "active_pipeline": "main",  # Default to main if no logs
-                    "last_event_type": None,
-                    "last_event_time": None,
-                    "failover_count": 0,
-                    "message": "로그 없음 - 기본값(main) 사용",
-                }
-
-            infos = log_resp.Infos
-
             # Collect failover events from both pipelines
-            failover_events = []
+            window_start_iso = _iso_utc_at(window_start)
+            failover_events = [
+                event for event in (state["events"] if state else ())
+                if event['time'] >= window_start_iso
+            ]
+            seen = {(e['type'], e['time'], e['pipeline']) for e in failover_events}
+            infos = log_resp.Infos
 
             for pipeline_attr in ['Pipeline0', 'Pipeline1']:
-                pipeline_logs = getattr(infos, pipeline_attr, None)
+                pipeline_logs = getattr(infos, pipeline_attr, None) if infos else None
                 if not pipeline_logs:
                     continue
 
@@ -755,17 +1516,32 @@ class TencentCloudClient:
                     log_time = getattr(log, 'Time', '')
 
                     # Only collect failover-related events
-                    # InputFailover = switched to backup, InputRecover = switched back to main
-                    # PipelineFailover/PipelineRecover = similar pipeline-level events
-                    # SilentSwitch = switched to placeholder image (no input signal)
-                    if log_type in ['PipelineFailover', 'PipelineRecover', 'InputFailover', 'InputRecover', 'SilentSwitch']:
+                    if log_type in FAILOVER_EVENT_TYPES and (log_type, log_time, pipeline_attr) not in seen:
+                        seen.add((log_type, log_time, pipeline_attr))
                         failover_events.append({
                             'type': log_type,
                             'time': log_time,
                             'pipeline': pipeline_attr,
                         })
 
+            # An incremental rescan only sees the delta window, so whether the
+            # channel had any logs at all is carried over from earlier scans
+            had_logs = bool(infos) or bool(state and state.get("had_logs"))
+            self._linkage_cache[state_key] = {
+                "cursor": now,
+                "events": deque(failover_events, maxlen=PIPELINE_LOG_EVENTS_MAX),
+                "had_logs": had_logs,
+            }
+
             if not failover_events:
+                if not had_logs:
+                    return {
+                        "active_pipeline": "main",  # Default to main if no logs
+                        "last_event_type": None,
+                        "last_event_time": None,
+                        "failover_count": 0,
+                        "message": "로그 없음 - 기본값(main) 사용",
+                    }
                 return {
                     "active_pipeline": "main",  # Default to main if no failover events
                     "last_event_type": None,
@@ -774,14 +1550,13 @@ class TencentCloudClient:
                     "message": "Failover 이벤트 없음 - main으로 서비스 중",
                 }
 
-            # Sort by time (most recent first)
-            failover_events.sort(key=lambda x: x['time'], reverse=True)
+            failover_count = sum(1 for e in failover_events if e['type'] in FAILOVER_SWITCH_TYPES)
 
-            # Count failovers
-            failover_count = sum(1 for e in failover_events if e['type'] in ['PipelineFailover', 'InputFailover'])
+            # Keep the 10 most recent events (most recent first) without a full sort
+            recent_events = heapq.nlargest(10, failover_events, key=itemgetter('time'))
 
             # Determine active pipeline from the most recent failover event
-            last_failover = failover_events[0]
+            last_failover = recent_events[0]
             last_failover_type = last_failover['type']
             last_failover_time = last_failover['time']
 
@@ -792,7 +1567,7 @@ class TencentCloudClient:
             if last_failover_type == 'SilentSwitch':
                 active_pipeline = "silent"
                 message = f"{last_failover_type} 발생 ({last_failover_time}) - 대기 이미지로 전환됨 (입력 신호 없음)"
-            elif last_failover_type in ['PipelineFailover', 'InputFailover']:
+            elif last_failover_type in FAILOVER_SWITCH_TYPES:
                 active_pipeline = "backup"
                 message = f"{last_failover_type} 발생 ({last_failover_time}) - backup으로 서비스 중"
             else:  # PipelineRecover or InputRecover
@@ -806,7 +1581,7 @@ class TencentCloudClient:
                 "last_event_type": last_failover_type,
                 "last_event_time": last_failover_time,
                 "failover_count": failover_count,
-                "all_events": failover_events[:10],  # Keep last 10 events for reference
+                "all_events": recent_events,  # Keep last 10 events for reference
                 "message": message,
             }
 
@@ -814,194 +1589,250 @@ class TencentCloudClient:
             logger.warning(f"Could not get active pipeline from logs for channel {channel_id}: {e}")
             return None
 
-    def get_channel_input_status(self, channel_id: str) -> Optional[Dict]:
+    def get_channel_input_status(
+        self,
+        channel_id: str,
+        flows: Optional[List[Dict]] = None,
+        flow_index: Optional[FlowIndex] = None,
+        channels_by_id: Optional[Dict[str, Dict]] = None,
+        scan_all_inputs: bool = False,
+        min_level: str = "full",
+    ) -> Optional[Dict]:
         """
         Get active input status (main/backup) for a StreamLive channel.
+
+        Args:
+            channel_id: StreamLive channel ID
+            flows: Pre-fetched list_streamlink_inputs() result (optional, for batch calls)
+            flow_index: LinkageMatcher.build_index() of the flows (optional; takes
+                precedence over flows, so batch calls index them only once)
+            channels_by_id: Pre-fetched list_mdl_channels() result keyed by channel ID
+                (optional; only used for input endpoints when the input listing fails)
+            scan_all_inputs: Collect the stream state of every attached input
+                instead of stopping at the first active one
+            min_level: How much verification to run once the channel logs show
+                a failover event: "full" runs every step, "standard" skips the
+                StreamPackage/CSS checks, "quick" also skips StreamLink flow
+                matching. Without a log event every step runs regardless.
         
         Returns:
             Dict with active_input (main/backup), input_details, and failover_info
+
+        Raises:
+            ValueError: If min_level is not "quick", "standard" or "full"
         """
+        if min_level not in INPUT_STATUS_LEVELS:
+            raise ValueError(f"Unknown min_level: {min_level!r}")
+
         try:
             client = self._get_mdl_client()
-            
+
+            # The input listing and the channel log scan (priority 0 below) do
+            # not depend on the channel description, so issue them alongside it
+            inputs_future = self._sdk_call_executor.submit(
+                client.DescribeStreamLiveInputs, mdl_models.DescribeStreamLiveInputsRequest()
+            )
+            pipeline_future = self._sdk_call_executor.submit(
+                self._active_pipeline_once, channel_id, 24
+            )
+
             # 1. Get channel details with failover settings and StreamPackage connection
             channel_req = mdl_models.DescribeStreamLiveChannelRequest()
             channel_req.Id = channel_id
             channel_resp = client.DescribeStreamLiveChannel(channel_req)
             info = channel_resp.Info
-            
-            attached_inputs = getattr(info, "AttachedInputs", [])
+            channel_fields = _model_fields(info, _CHANNEL_INFO_DEFAULTS)
+            channel_name = channel_fields["Name"]
+
+            attached_inputs = channel_fields["AttachedInputs"]
             if not attached_inputs:
                 return {
                     "channel_id": channel_id,
-                    "channel_name": getattr(info, "Name", ""),
+                    "channel_name": channel_name,
                     "active_input": None,
                     "message": "연결된 입력이 없습니다.",
                 }
 
             # Fetch all inputs to get names (AttachedInputs only has ID, not Name)
+            # and endpoints (reused by the StreamLink fallback below)
             input_id_to_name = {}
+            input_id_to_endpoints = {}
             try:
-                inp_req = mdl_models.DescribeStreamLiveInputsRequest()
-                inp_resp = client.DescribeStreamLiveInputs(inp_req)
-                all_inputs = inp_resp.Infos if hasattr(inp_resp, "Infos") else []
+                inp_resp = inputs_future.result()
+                all_inputs = getattr(inp_resp, "Infos", None) or []
                 for inp in all_inputs:
-                    inp_id = getattr(inp, "Id", "")
-                    inp_name = getattr(inp, "Name", "")
+                    inp_fields = _model_fields(inp, _INPUT_NAME_DEFAULTS)
+                    inp_id = inp_fields["Id"]
+                    inp_name = inp_fields["Name"]
                     if inp_id and inp_name:
                         input_id_to_name[inp_id] = inp_name
+                    if inp_id:
+                        input_id_to_endpoints[str(inp_id).strip()] = self._extract_input_endpoints(inp)
             except Exception as e:
                 logger.debug(f"Could not fetch input names: {e}")
             
             # Get StreamPackage ID from OutputGroups
             streampackage_id = None
-            if hasattr(info, "OutputGroups") and info.OutputGroups:
-                for og in info.OutputGroups:
-                    if hasattr(og, "StreamPackageSettings"):
-                        sp_settings = og.StreamPackageSettings
+            output_groups = channel_fields["OutputGroups"]
+            if output_groups:
+                for og in output_groups:
+                    sp_settings = getattr(og, "StreamPackageSettings", None)
+                    if sp_settings is not None:
                         streampackage_id = getattr(sp_settings, "Id", None)
                         if streampackage_id:
                             break
+
+            # StreamPackage verification (step 5) only needs the ID; start it now
+            # unless a conclusive log event may make it unnecessary
+            sp_status_future = None
+            if streampackage_id and min_level == "full":
+                sp_status_future = self._sdk_call_executor.submit(
+                    self._get_streampackage_input_status, streampackage_id
+                )
             
-            # Extract input details and failover settings
-            input_details = []
-            primary_input_id = None
+            # Extract input details (cheap single pass); names come from the
+            # input_id_to_name mapping because AttachedInputs doesn't carry Name
+            input_details = [
+                {
+                    "id": (att_id := str(getattr(att, "Id", att)).strip()),
+                    "name": input_id_to_name.get(att_id, ""),
+                    "is_primary": True,  # First attached input is typically primary
+                }
+                for att in attached_inputs
+            ]
+
+            # Channel input endpoints for StreamLink flow matching (steps 4 and
+            # 1.5), from the input listing above rather than re-listing every
+            # channel: primary input's endpoints first, duplicates dropped.
+            # Each endpoint maps to the attached input it belongs to.
+            endpoint_input_ids: Dict[str, str] = {}
+            for inp in input_details:
+                for endpoint in input_id_to_endpoints.get(inp["id"], ()):
+                    endpoint_input_ids.setdefault(endpoint, inp["id"])
+            channel_endpoints = list(endpoint_input_ids)
+            if not channel_endpoints and channels_by_id:
+                # Input listing failed; fall back to the caller's channel listing
+                channel_endpoints = (channels_by_id.get(channel_id) or {}).get("input_endpoints", [])
+            channel_info = {"id": channel_id, "input_endpoints": channel_endpoints}
+
+            # Attachment position and details by input ID for the priority ladder
+            input_by_id = {inp["id"]: (idx, inp) for idx, inp in enumerate(input_details)}
+
+            # First attached input is the primary
+            primary_input_id = input_details[0]["id"]
             secondary_input_id = None
             failover_loss_threshold = None
             failover_recover_behavior = None
-            
+
+            # Failover settings live on the primary attachment; stop at the first match
             for att in attached_inputs:
-                att_id = str(getattr(att, "Id", att)).strip()
-                # Get name from input_id_to_name mapping (AttachedInputs doesn't have Name)
-                att_name = input_id_to_name.get(att_id, "")
-                
-                # Check for failover settings
                 failover_settings = getattr(att, "FailOverSettings", None)
-                if failover_settings:
-                    secondary_id = getattr(failover_settings, "SecondaryInputId", "")
-                    if secondary_id:
-                        secondary_input_id = str(secondary_id).strip()
-                        if failover_loss_threshold is None:
-                            failover_loss_threshold = getattr(failover_settings, "LossThreshold", None)
-                        if failover_recover_behavior is None:
-                            failover_recover_behavior = getattr(failover_settings, "RecoverBehavior", None)
-                
-                input_details.append({
-                    "id": att_id,
-                    "name": att_name,
-                    "is_primary": True,  # First attached input is typically primary
-                })
-                
-                if primary_input_id is None:
-                    primary_input_id = att_id
-            
+                if not failover_settings:
+                    continue
+                fo = _model_fields(failover_settings, _FAILOVER_SETTINGS_DEFAULTS)
+                if fo["SecondaryInputId"]:
+                    secondary_input_id = str(fo["SecondaryInputId"]).strip()
+                    failover_loss_threshold = fo["LossThreshold"]
+                    failover_recover_behavior = fo["RecoverBehavior"]
+                    break
+
             # 2. Use QueryInputStreamState to determine active input/source (PRIMARY METHOD - MOST RELIABLE)
             # This API directly returns which source addresses are active (Status == 1)
             active_input_id = None
             active_source_address = None  # Track which source address is active (for Input Source Redundancy)
-            input_states = {}
-            source_status_by_input = {}  # Map input_id -> {source_address: status, type: main/backup}
-            
+            input_states: Dict[str, InputState] = {}
+            source_status_by_input: Dict[str, InputSourceStatus] = {}
+
+            # The statistics fallback (step 3) is hedged: requested only if the
+            # state queries are still pending after INPUT_STATISTICS_HEDGE_DELAY,
+            # or once they come back without an active input
+            stats_req = mdl_models.DescribeStreamLiveChannelInputStatisticsRequest()
+            stats_req.ChannelId = channel_id
+            # StartTime and EndTime are optional - if empty, returns current statistics
+            stats_future = None
+
             try:
+                # Query every attached input at once; results are still read in
+                # attachment order so the first active input wins. Each request
+                # is capped by the state client's INPUT_STATE_QUERY_TIMEOUT from
+                # when it starts, so time queued behind other channels' work on
+                # the shared leaf pool does not count against it.
+                state_client = self._get_mdl_state_client()
                 input_ids = [inp["id"] for inp in input_details]
-                for inp_id in input_ids:
+                state_futures = [
+                    self._sdk_call_executor.submit(
+                        # Source type comes from FailOverSettings (primary/secondary
+                        # input IDs); other inputs (e.g. black_image) default to main
+                        self._query_input_stream_state, state_client, inp_id,
+                        "backup" if inp_id == secondary_input_id else "main",
+                    )
+                    for inp_id in input_ids
+                ]
+
+                hedge_at = time.monotonic() + INPUT_STATISTICS_HEDGE_DELAY
+                for inp_id, state_future in zip(input_ids, state_futures):
                     try:
-                        query_req = mdl_models.QueryInputStreamStateRequest()
-                        query_req.Id = inp_id  # Only Id parameter is required (not ChannelId + InputId)
-                        
-                        query_resp = client.QueryInputStreamState(query_req)
-                        
-                        if hasattr(query_resp, "Info") and query_resp.Info:
-                            info_obj = query_resp.Info
-                            
-                            # Get InputStreamInfoList from Info
-                            if hasattr(info_obj, "InputStreamInfoList") and info_obj.InputStreamInfoList:
-                                stream_infos = info_obj.InputStreamInfoList
-                                
-                                active_sources = []
-                                for stream_info in stream_infos:
-                                    input_address = getattr(stream_info, "InputAddress", "")
-                                    app_name = getattr(stream_info, "AppName", "")
-                                    stream_name = getattr(stream_info, "StreamName", "")
-                                    status = getattr(stream_info, "Status", 0)
-                                    
-                                    # Build full URL first
-                                    full_url = f"{input_address}/{app_name}/{stream_name}" if input_address else ""
-
-                                    # Determine source type from FailOverSettings (primary/secondary input IDs)
-                                    # This is the most reliable method - based on channel configuration
-                                    source_type = None
-
-                                    if inp_id == secondary_input_id:
-                                        source_type = "backup"
-                                    elif inp_id == primary_input_id:
-                                        source_type = "main"
-                                    else:
-                                        # For other inputs (e.g., black_image), default to main
-                                        source_type = "main"
-                                    
-                                    if status == 1:  # Status 1 means active
-                                        active_sources.append({
-                                            "address": input_address,
-                                            "url": full_url,
-                                            "type": source_type,
-                                            "status": status
-                                        })
-                                        
-                                        # Set active input and source address
-                                        if not active_input_id:
-                                            active_input_id = inp_id
-                                            active_source_address = full_url
-                                        
-                                        logger.info(f"QueryInputStreamState: Input {inp_id} has active source {source_type} at {input_address}")
-                                
-                                # Store source status information
-                                source_status_by_input[inp_id] = {
-                                    "active_sources": active_sources,
-                                    "input_id": inp_id,
-                                    "input_name": getattr(info_obj, "InputName", ""),
-                                    "protocol": getattr(info_obj, "Protocol", "")
-                                }
-                                
-                                # If we found active sources, we can break (found the active input)
-                                if active_sources:
-                                    input_states[inp_id] = input_states.get(inp_id, {})
-                                    input_states[inp_id]["status"] = 1
-                                    input_states[inp_id]["is_active"] = True
-                                    input_states[inp_id]["active_sources"] = active_sources
-                                    
-                                    # Use first active source as primary
-                                    if active_sources:
-                                        primary_source = active_sources[0]
-                                        active_source_address = primary_source["url"]
-                                        
+                        if stats_future is None and not state_future.done():
+                            try:
+                                state_future.result(timeout=max(0.0, hedge_at - time.monotonic()))
+                            except FutureTimeoutError:
+                                stats_future = self._sdk_call_executor.submit(
+                                    client.DescribeStreamLiveChannelInputStatistics, stats_req
+                                )
+                        source_status = state_future.result()
                     except Exception as e:
                         logger.debug(f"Could not query state for input {inp_id}: {e}")
                         continue
+                    if source_status is None:
+                        continue
+
+                    source_status_by_input[inp_id] = source_status
+                    active_sources = source_status.active_sources
+                    if active_sources:
+                        if not active_input_id:
+                            active_input_id = inp_id
+                            active_source_address = active_sources[0]["url"]
+                        st = input_states.setdefault(inp_id, InputState())
+                        st.status = 1
+                        st.is_active = True
+                        st.active_sources = active_sources
+
+                        # Active input found - skip the remaining inputs
+                        if not scan_all_inputs:
+                            break
+
+                # Drop queries that have not started; running ones end at their
+                # request timeout
+                for state_future in state_futures:
+                    state_future.cancel()
             except Exception as e:
                 logger.warning(f"QueryInputStreamState failed: {e}")
             
             # 3. Fallback: Use input statistics to determine active input
-            if not active_input_id:
+            if active_input_id:
+                # Only a hedged request can exist here; it may already be running
+                if stats_future is not None:
+                    stats_future.cancel()
+            else:
                 try:
-                    # Use DescribeStreamLiveChannelInputStatistics to check which input is active
-                    # This API shows real-time statistics for each input
-                    stats_req = mdl_models.DescribeStreamLiveChannelInputStatisticsRequest()
-                    stats_req.ChannelId = channel_id
-                    # StartTime and EndTime are optional - if empty, returns current statistics
-                    
-                    stats_resp = client.DescribeStreamLiveChannelInputStatistics(stats_req)
-                    if hasattr(stats_resp, "Infos") and stats_resp.Infos:
+                    # DescribeStreamLiveChannelInputStatistics shows real-time
+                    # statistics for each input
+                    if stats_future is None:
+                        stats_resp = client.DescribeStreamLiveChannelInputStatistics(stats_req)
+                    else:
+                        stats_resp = stats_future.result()
+                    infos = getattr(stats_resp, "Infos", None)
+                    if infos:
+                        stat_rows = [_model_fields(stat_info, _INPUT_STATISTICS_DEFAULTS) for stat_info in infos]
                         max_bandwidth = 0
-                        for stat_info in stats_resp.Infos:
-                            inp_id = getattr(stat_info, "InputId", "")
-                            network_in = getattr(stat_info, "NetworkIn", 0)
-                            network_valid = getattr(stat_info, "NetworkValid", False)
-                            
-                            input_states[inp_id] = {
-                                "bandwidth": network_in,
-                                "network_valid": network_valid,
-                            }
+                        for row in stat_rows:
+                            inp_id = row["InputId"]
+                            network_in = row["NetworkIn"]
+                            network_valid = row["NetworkValid"]
+
+                            st = input_states.setdefault(inp_id, InputState())
+                            st.bandwidth = network_in
+                            st.network_valid = network_valid
                             
                             # Active input is the one with valid network and highest bandwidth
                             if network_valid and network_in > max_bandwidth:
@@ -1010,121 +1841,115 @@ class TencentCloudClient:
                         
                         # If no input has valid network, check if any has bandwidth > 0
                         if not active_input_id:
-                            for stat_info in stats_resp.Infos:
-                                inp_id = getattr(stat_info, "InputId", "")
-                                network_in = getattr(stat_info, "NetworkIn", 0)
-                                if network_in > 0:
-                                    active_input_id = inp_id
+                            for row in stat_rows:
+                                if row["NetworkIn"] > 0:
+                                    active_input_id = row["InputId"]
                                     break
                 except Exception as e:
                     logger.warning(f"Could not get input statistics: {e}")
             
+            # Below "full", a failover event in the channel logs (priority 0)
+            # settles the answer, so the remaining verification can be skipped
+            logs_conclusive = False
+            if min_level != "full":
+                try:
+                    early_log_result = pipeline_future.result()
+                    logs_conclusive = bool(early_log_result and early_log_result.get("last_event_type"))
+                except Exception:
+                    pass  # reported with priority 0 below
+                if streampackage_id and not logs_conclusive:
+                    sp_status_future = self._sdk_call_executor.submit(
+                        self._get_streampackage_input_status, streampackage_id
+                    )
+
+            flow_type_by_input = {}  # Map input_id to flow type (main/backup)
+
             # 4. Fallback: Check StreamLink flows to determine active input/source
             # This works for both Channel-level Failover and Input Source Redundancy
             # Only use if QueryInputStreamState didn't provide active source
-            if not active_source_address:
+            if not active_source_address and not (logs_conclusive and min_level == "quick"):
                 try:
-                    from app.services.linkage import LinkageMatcher
-                    
-                    # Get all StreamLink flows
-                    flows = self.list_streamlink_inputs()
-                    
+                    # Get all StreamLink flows, indexed by output URL
+                    if flow_index is None:
+                        flow_index = (
+                            LinkageMatcher.build_index(flows) if flows is not None
+                            else self._streamlink_flow_index()
+                        )
+
                     # Find flows linked to this channel
-                    channel_info = {
-                        "id": channel_id,
-                        "input_endpoints": [],
-                    }
-                    # Get input endpoints from channel details
-                    channel_details = self.get_resource_details(channel_id, "StreamLive")
-                    if channel_details:
-                        # Reconstruct input endpoints from input attachments
-                        all_inputs = self.list_mdl_channels()
-                        for ch in all_inputs:
-                            if ch.get("id") == channel_id:
-                                channel_info["input_endpoints"] = ch.get("input_endpoints", [])
-                                break
-                    
-                    linked_flows = LinkageMatcher.find_linked_flows(channel_info, flows)
-                    
+                    linked_flows = LinkageMatcher.find_linked_flows_indexed(channel_info, flow_index)
+
+                    # Normalize each endpoint once instead of once per flow URL,
+                    # keeping the attached input that owns it (the primary input
+                    # when the endpoints came from the channel listing fallback)
+                    endpoint_forms = [
+                        (endpoint_input_ids.get(endpoint, primary_input_id), endpoint, *_url_match_forms(endpoint))
+                        for endpoint in channel_info["input_endpoints"]
+                    ]
+
                     # Check which StreamLink flow is running and connected to which input
-                    flow_type_by_input = {}  # Map input_id to flow type (main/backup)
                     flow_type_by_source = {}  # Map source address to flow type (for Input Source Redundancy)
                     
                     for flow in linked_flows:
-                        if flow.get("status") == "running":
-                            flow_output_urls = flow.get("output_urls", [])
-                            flow_name = flow.get("name", "").lower()
-                            
-                            # Determine if this is main or backup flow from name
-                            is_backup_flow = "_b" in flow_name or "backup" in flow_name
-                            is_main_flow = "_m" in flow_name or ("main" in flow_name and not is_backup_flow)
-                            
-                            # Match output URL to input endpoint to find which input/source is active
-                            for inp in input_details:
-                                inp_id = inp["id"]
-                                
-                                # Get input endpoints for this input
-                                inp_endpoints = []
-                                matched_source = None
-                                
-                                for endpoint in channel_info.get("input_endpoints", []):
-                                    # Check if this endpoint matches the flow output
-                                    for flow_url in flow_output_urls:
-                                        # Normalize URLs for comparison
-                                        endpoint_norm = endpoint.lower().strip().rstrip("/")
-                                        flow_url_norm = flow_url.lower().strip().rstrip("/")
-                                        
-                                        # Extract stream key for comparison
-                                        endpoint_key = endpoint.split("/")[-1] if "/" in endpoint else endpoint
-                                        flow_key = flow_url.split("/")[-1] if "/" in flow_url else flow_url
-                                        
-                                        if endpoint_key == flow_key or endpoint_norm == flow_url_norm or endpoint_norm in flow_url_norm or flow_url_norm in endpoint_norm:
-                                            inp_endpoints.append(endpoint)
-                                            
-                                            # For Input Source Redundancy: determine which source address is active
-                                            # ap-seoul-1 typically means main, ap-seoul-2 means backup
-                                            if "ap-seoul-1" in endpoint.lower() or "ap-seoul-1" in flow_url.lower():
-                                                matched_source = "main"
-                                                active_source_address = endpoint
-                                            elif "ap-seoul-2" in endpoint.lower() or "ap-seoul-2" in flow_url.lower():
-                                                matched_source = "backup"
-                                                active_source_address = endpoint
-                                            
-                                            break
-                                
-                                if inp_endpoints:
-                                    if not active_input_id:
-                                        active_input_id = inp_id
-                                    
-                                    # Store flow type for this input
-                                    if is_backup_flow:
-                                        flow_type_by_input[inp_id] = "backup"
-                                        if matched_source:
-                                            flow_type_by_source[matched_source] = "backup"
-                                    elif is_main_flow:
-                                        flow_type_by_input[inp_id] = "main"
-                                        if matched_source:
-                                            flow_type_by_source[matched_source] = "main"
-                                    
-                                    # For Input Source Redundancy: use source address type if available
-                                    if matched_source:
-                                        flow_type_by_input[inp_id] = matched_source
-                                    
-                                    logger.info(f"Found active input {inp_id} via StreamLink flow {flow.get('name')} (backup={is_backup_flow}, main={is_main_flow}, source={matched_source})")
-                                    
-                                    # If we found a match, we can break (one flow per input typically)
+                        if flow.get("status") != "running":
+                            continue
+
+                        flow_name = flow.get("name", "")
+                        url_forms = [(url, *_url_match_forms(url)) for url in flow.get("output_urls", [])]
+
+                        # Determine if this is main or backup flow from name
+                        is_backup_flow = bool(BACKUP_NAME_RE.search(flow_name))
+                        is_main_flow = not is_backup_flow and bool(MAIN_NAME_RE.search(flow_name))
+
+                        # Match output URLs to input endpoints to find which source is active
+                        matched_input_id = None
+                        matched_source = None
+                        for endpoint_input_id, endpoint, endpoint_key, endpoint_norm, endpoint_region in endpoint_forms:
+                            for flow_url, flow_key, flow_url_norm, flow_url_region in url_forms:
+                                if endpoint_key == flow_key or endpoint_norm == flow_url_norm or endpoint_norm in flow_url_norm or flow_url_norm in endpoint_norm:
+                                    matched_input_id = endpoint_input_id
+
+                                    # For Input Source Redundancy: determine which source address is active
+                                    if "main" in (endpoint_region, flow_url_region):
+                                        matched_source = "main"
+                                        active_source_address = endpoint
+                                    elif "backup" in (endpoint_region, flow_url_region):
+                                        matched_source = "backup"
+                                        active_source_address = endpoint
+
                                     break
-                            
-                            if active_input_id:
-                                break
+
+                        if matched_input_id:
+                            inp_id = matched_input_id
+                            if not active_input_id:
+                                active_input_id = inp_id
+
+                            # Store flow type for this input
+                            if is_backup_flow:
+                                flow_type_by_input[inp_id] = "backup"
+                                if matched_source:
+                                    flow_type_by_source[matched_source] = "backup"
+                            elif is_main_flow:
+                                flow_type_by_input[inp_id] = "main"
+                                if matched_source:
+                                    flow_type_by_source[matched_source] = "main"
+
+                            # For Input Source Redundancy: use source address type if available
+                            if matched_source:
+                                flow_type_by_input[inp_id] = matched_source
+
+                            logger.info(f"Found active input {inp_id} via StreamLink flow {flow.get('name')} (backup={is_backup_flow}, main={is_main_flow}, source={matched_source})")
+
+                        if active_input_id:
+                            break
                 except Exception as e:
                     logger.debug(f"Could not determine active input from StreamLink: {e}")
             
             # 5. Multi-stage verification: Check StreamPackage input status
             streampackage_result = None
-            if streampackage_id:
+            if sp_status_future is not None:
                 try:
-                    streampackage_result = self._get_streampackage_input_status(streampackage_id)
+                    streampackage_result = sp_status_future.result()
                     if streampackage_result and streampackage_result.get("active_input"):
                         # StreamPackage에서 확인된 활성 입력이 있으면 우선 사용
                         sp_active = streampackage_result.get("active_input")
@@ -1140,7 +1965,7 @@ class TencentCloudClient:
             css_result = None
             try:
                 # Get StreamPackage endpoints to find CSS stream info
-                if streampackage_id:
+                if sp_status_future is not None:
                     # StreamPackage가 연결되어 있으면 CSS 검증 시도
                     streampackage_connected = True
                     stream_flowing = False
@@ -1178,7 +2003,7 @@ class TencentCloudClient:
             # This checks PipelineFailover/PipelineRecover events to determine actual serving pipeline
             # IMPORTANT: Only trust log-based detection if there was an actual event
             try:
-                log_based_result = self._get_active_pipeline_from_logs(channel_id, hours=24)
+                log_based_result = pipeline_future.result()
                 if log_based_result and log_based_result.get("last_event_type"):
                     # Only use log-based result if there was an actual failover event
                     active_input_type = log_based_result["active_pipeline"]
@@ -1186,9 +2011,8 @@ class TencentCloudClient:
 
                     # Check for Input Source Redundancy based on QueryInputStreamState
                     if source_status_by_input:
-                        for inp_id, source_info in source_status_by_input.items():
-                            active_sources = source_info.get("active_sources", [])
-                            if len(active_sources) > 1:
+                        for source_info in source_status_by_input.values():
+                            if len(source_info.active_sources) > 1:
                                 is_input_source_redundancy = True
                                 verification_sources.append("InputSourceRedundancy")
                                 break
@@ -1203,8 +2027,7 @@ class TencentCloudClient:
             # Note: QueryInputStreamState only tells us which sources have signal, not which is serving
             if not active_input_type and active_input_id:
                 if active_input_id in source_status_by_input:
-                    source_info = source_status_by_input[active_input_id]
-                    active_sources = source_info.get("active_sources", [])
+                    active_sources = source_status_by_input[active_input_id].active_sources
 
                     if active_sources:
                         # If only one source has signal, that's the active one
@@ -1227,30 +2050,25 @@ class TencentCloudClient:
             # Priority 1.5: If no log event, check running StreamLink flows directly
             if not active_input_type:
                 try:
-                    from app.services.linkage import LinkageMatcher
-                    flows = self.list_streamlink_inputs()
-
-                    # Get channel input endpoints
-                    channel_info = {"id": channel_id, "input_endpoints": []}
-                    all_channels = self.list_mdl_channels()
-                    for ch in all_channels:
-                        if ch.get("id") == channel_id:
-                            channel_info["input_endpoints"] = ch.get("input_endpoints", [])
-                            break
+                    if flow_index is None:
+                        flow_index = (
+                            LinkageMatcher.build_index(flows) if flows is not None
+                            else self._streamlink_flow_index()
+                        )
 
-                    linked_flows = LinkageMatcher.find_linked_flows(channel_info, flows)
+                    linked_flows = LinkageMatcher.find_linked_flows_indexed(channel_info, flow_index)
 
                     # Find running flows and determine main/backup from name
                     running_flows = [f for f in linked_flows if f.get("status") == "running"]
 
                     for flow in running_flows:
-                        flow_name = flow.get("name", "").lower()
-                        if "_b" in flow_name or "backup" in flow_name:
+                        flow_name = flow.get("name", "")
+                        if BACKUP_NAME_RE.search(flow_name):
                             active_input_type = "backup"
                             verification_sources.append("StreamLinkRunning")
                             logger.info(f"Detected backup from running flow: {flow.get('name')}")
                             break
-                        elif "_m" in flow_name or "main" in flow_name:
+                        elif MAIN_NAME_RE.search(flow_name):
                             active_input_type = "main"
                             verification_sources.append("StreamLinkRunning")
                             logger.info(f"Detected main from running flow: {flow.get('name')}")
@@ -1258,7 +2076,6 @@ class TencentCloudClient:
 
                     # If only one flow is running and couldn't determine from name
                     if not active_input_type and len(running_flows) == 1:
-                        flow_name = running_flows[0].get("name", "").lower()
                         # Default: if no clear indicator, assume main
                         active_input_type = "main"
                         verification_sources.append("StreamLinkRunning(default)")
@@ -1300,43 +2117,38 @@ class TencentCloudClient:
                     verification_sources.append("FailOverSettings")
                 
                 # Priority 4: Input name pattern
-                else:
-                    for inp in input_details:
-                        if inp["id"] == active_input_id:
-                            inp_name = inp.get("name", "").lower()
-                            if "backup" in inp_name or "_b" in inp_name or "fv_" in inp_name:
-                                active_input_type = "backup"
-                                verification_sources.append("InputName")
-                            elif "main" in inp_name or "_m" in inp_name:
-                                active_input_type = "main"
-                                verification_sources.append("InputName")
-                            else:
-                                # Last resort: first input is main, second is backup
-                                idx = input_details.index(inp)
-                                active_input_type = "main" if idx == 0 else "backup"
-                                verification_sources.append("InputOrder")
-                            break
+                elif active_input_id in input_by_id:
+                    idx, inp = input_by_id[active_input_id]
+                    inp_name = inp.get("name", "")
+                    if BACKUP_INPUT_NAME_RE.search(inp_name):
+                        active_input_type = "backup"
+                        verification_sources.append("InputName")
+                    elif MAIN_NAME_RE.search(inp_name):
+                        active_input_type = "main"
+                        verification_sources.append("InputName")
+                    else:
+                        # Last resort: first input is main, second is backup
+                        active_input_type = "main" if idx == 0 else "backup"
+                        verification_sources.append("InputOrder")
             
             # Check if there's actual signal on any input
             # Always verify actual signal status, regardless of log events
             has_signal = False
 
             # Check input_states for actual network activity
-            for inp_id, state in input_states.items():
-                bandwidth = state.get("bandwidth", 0)
-                if bandwidth and bandwidth > 0:
+            for state in input_states.values():
+                if state.bandwidth and state.bandwidth > 0:
                     has_signal = True
                     break
                 # Also check QueryInputStreamState results
-                if state.get("is_active") or state.get("status") == 1:
+                if state.is_active or state.status == 1:
                     has_signal = True
                     break
 
             # Also check source_status_by_input for active sources
             if not has_signal and source_status_by_input:
-                for inp_id, source_info in source_status_by_input.items():
-                    active_sources = source_info.get("active_sources", [])
-                    if active_sources:
+                for source_info in source_status_by_input.values():
+                    if source_info.active_sources:
                         has_signal = True
                         break
 
@@ -1348,26 +2160,25 @@ class TencentCloudClient:
                 verification_sources.append("NoSignal")
 
             # Build result with multi-stage verification info
-            result = {
-                "channel_id": channel_id,
-                "channel_name": getattr(info, "Name", ""),
-                "active_input": active_input_type,
-                "active_input_id": active_input_id,
-                "primary_input_id": primary_input_id,
-                "secondary_input_id": secondary_input_id,
-                "failover_loss_threshold": failover_loss_threshold,
-                "failover_recover_behavior": failover_recover_behavior,
-                "input_details": input_details,
-                "input_states": input_states,
-                "verification_sources": verification_sources,
-                "verification_level": len(verification_sources),
-                "is_input_source_redundancy": is_input_source_redundancy,
-                "active_source_address": active_source_address,
-            }
+            result = ChannelInputStatus(
+                channel_id=channel_id,
+                channel_name=channel_name,
+                active_input=active_input_type,
+                active_input_id=active_input_id,
+                primary_input_id=primary_input_id,
+                secondary_input_id=secondary_input_id,
+                failover_loss_threshold=failover_loss_threshold,
+                failover_recover_behavior=failover_recover_behavior,
+                input_details=input_details,
+                input_states=input_states,
+                verification_sources=verification_sources,
+                is_input_source_redundancy=is_input_source_redundancy,
+                active_source_address=active_source_address,
+            )
             
             # Add StreamPackage verification info
             if streampackage_result:
-                result["streampackage_verification"] = {
+                result.streampackage_verification = {
                     "streampackage_id": streampackage_id,
                     "active_input": streampackage_result.get("active_input"),
                     "input_details": streampackage_result.get("input_details", []),
@@ -1375,14 +2186,14 @@ class TencentCloudClient:
             
             # Add CSS verification info
             if css_result:
-                result["css_verification"] = {
+                result.css_verification = {
                     "streampackage_connected": css_result.get("streampackage_connected", False),
                     "stream_flowing": css_result.get("stream_flowing", False),
                 }
 
             # Add log-based detection info (MOST RELIABLE)
             if log_based_result:
-                result["log_based_detection"] = {
+                result.log_based_detection = {
                     "active_pipeline": log_based_result.get("active_pipeline"),
                     "last_event_type": log_based_result.get("last_event_type"),
                     "last_event_time": log_based_result.get("last_event_time"),
@@ -1391,28 +2202,27 @@ class TencentCloudClient:
                 }
 
             if active_input_type:
-                active_name = next(
-                    (inp["name"] for inp in input_details if inp["id"] == active_input_id),
-                    active_input_id
-                )
-                result["active_input_name"] = active_name
+                active_entry = input_by_id.get(active_input_id)
+                active_name = active_entry[1]["name"] if active_entry else active_input_id
+                result.active_input_name = active_name
 
                 # Build message with verification sources and log info
                 sources_str = ", ".join(verification_sources) if verification_sources else "기본"
 
-                # Add failover event info if available
-                if log_based_result and log_based_result.get("last_event_type"):
-                    event_info = f" | 마지막 이벤트: {log_based_result['last_event_type']}"
-                    if log_based_result.get("failover_count", 0) > 0:
-                        event_info += f" (24h 내 failover {log_based_result['failover_count']}회)"
+                # Add failover event info if available (built as one string, no +=)
+                last_event_type = log_based_result.get("last_event_type") if log_based_result else None
+                if last_event_type:
+                    failover_count = log_based_result.get("failover_count", 0)
+                    failover_info = f" (24h 내 failover {failover_count}회)" if failover_count > 0 else ""
+                    event_info = f" | 마지막 이벤트: {last_event_type}{failover_info}"
                 else:
                     event_info = ""
 
-                result["message"] = f"현재 활성 입력: {active_input_type.upper()} ({active_name}) [검증: {sources_str}]{event_info}"
+                result.message = f"현재 활성 입력: {active_input_type.upper()} ({active_name}) [검증: {sources_str}]{event_info}"
             else:
-                result["message"] = "활성 입력을 확인할 수 없습니다."
+                result.message = "활성 입력을 확인할 수 없습니다."
             
-            return result
+            return result.to_dict()
             
         except TencentCloudSDKException as e:
             logger.error(f"Tencent Cloud SDK error getting input status: {e}")
@@ -1429,8 +2239,112 @@ class TencentCloudClient:
                 "message": f"오류 발생: {str(e)}",
             }
 
+    @staticmethod
+    def _query_input_stream_state(client, input_id: str, source_type: str) -> Optional[InputSourceStatus]:
+        """QueryInputStreamState for one input; None when it reports no streams.
+
+        Sources with Status 1 are active and are tagged with ``source_type``.
+        """
+        query_req = mdl_models.QueryInputStreamStateRequest()
+        query_req.Id = input_id  # Only Id parameter is required (not ChannelId + InputId)
+        info = getattr(client.QueryInputStreamState(query_req), "Info", None)
+        if info is None:
+            return None
+        info_fields = _model_fields(info, _INPUT_STREAM_STATE_DEFAULTS)
+        stream_infos = info_fields["InputStreamInfoList"]
+        if not stream_infos:
+            return None
+
+        active_sources = []
+        for stream_info in stream_infos:
+            fields = _model_fields(stream_info, _STREAM_INFO_DEFAULTS)
+            status = fields["Status"]
+            if status != 1:  # Status 1 means active
+                continue
+
+            input_address = fields["InputAddress"]
+            full_url = f"{input_address}/{fields['AppName']}/{fields['StreamName']}" if input_address else ""
+            active_sources.append({
+                "address": input_address,
+                "url": full_url,
+                "type": source_type,
+                "status": status
+            })
+            logger.info(f"QueryInputStreamState: Input {input_id} has active source {source_type} at {input_address}")
+
+        return InputSourceStatus(
+            input_id=input_id,
+            input_name=info_fields["InputName"],
+            protocol=info_fields["Protocol"],
+            active_sources=active_sources,
+        )
+
+    def get_channel_input_status_batch(
+        self, channel_ids: List[str], min_level: str = "full"
+    ) -> Dict[str, Optional[Dict]]:
+        """Get active input status for multiple StreamLive channels in parallel.
+
+        StreamLink flows are listed and indexed once and shared by every
+        per-channel lookup, so only the channel-specific APIs run per channel.
+
+        Args:
+            channel_ids: List of StreamLive channel IDs
+            min_level: Verification level for every channel (see
+                get_channel_input_status)
+
+        Returns:
+            Dict mapping channel_id to input status (or None if failed)
+
+        Raises:
+            ValueError: If min_level is not "quick", "standard" or "full"
+        """
+        if min_level not in INPUT_STATUS_LEVELS:
+            raise ValueError(f"Unknown min_level: {min_level!r}")
+        if not channel_ids:
+            return {}
+
+        flow_index = self._streamlink_flow_index()
+
+        def fetch_status(channel_id: str) -> tuple:
+            return channel_id, self.get_channel_input_status(
+                channel_id, flow_index=flow_index, min_level=min_level
+            )
+
+        results = {}
+        # Dedicated pool: the per-channel calls must not wait on self.executor tasks
+        with ThreadPoolExecutor(max_workers=min(len(channel_ids), self._max_workers)) as executor:
+            for channel_id, status in executor.map(fetch_status, channel_ids):
+                results[channel_id] = status
+
+        return results
+
     def get_resource_details(self, resource_id: str, service: str) -> Optional[Dict]:
-        """Get detailed information about a resource."""
+        """Get detailed information about a resource (cached for 30 seconds)."""
+        cache_key = self._resource_details_cache_key(resource_id, service)
+        cached = self._linkage_cache.get(cache_key)
+        if cached and (time.time() - cached["timestamp"] < RESOURCE_DETAILS_CACHE_TTL):
+            return cached["data"]
+
+        details = self._fetch_resource_details(resource_id, service)
+        if details is not None:
+            self._linkage_cache[cache_key] = {"data": details, "timestamp": time.time()}
+        return details
+
+    @staticmethod
+    def _resource_details_cache_key(resource_id: str, service: str) -> str:
+        """Cache key for get_resource_details; service aliases share one entry."""
+        if service == "MediaLive":
+            service = "StreamLive"
+        elif service == "MediaConnect":
+            service = "StreamLink"
+        return f"details_{service}_{resource_id}"
+
+    def invalidate_resource_details(self, resource_id: str, service: str) -> None:
+        """Drop cached details for a resource (e.g. after it is started or stopped)."""
+        self._linkage_cache.pop(self._resource_details_cache_key(resource_id, service), None)
+
+    def _fetch_resource_details(self, resource_id: str, service: str) -> Optional[Dict]:
+        """Fetch resource details from the StreamLive/StreamLink API."""
         try:
             if service in ["StreamLive", "MediaLive"]:
                 client = self._get_mdl_client()
@@ -1439,13 +2353,13 @@ class TencentCloudClient:
                 resp = client.DescribeStreamLiveChannel(req)
                 info = resp.Info
 
-                input_details = []
-                for att in getattr(info, "AttachedInputs", []):
-                    att_id = str(getattr(att, "Id", att)).strip()
-                    input_details.append({
-                        "id": att_id,
+                input_details = [
+                    {
+                        "id": (att_id := str(getattr(att, "Id", att)).strip()),
                         "name": getattr(att, "Name", "") or att_id,
-                    })
+                    }
+                    for att in getattr(info, "AttachedInputs", ())
+                ]
 
                 return {
                     "id": info.Id,
@@ -1462,16 +2376,16 @@ class TencentCloudClient:
                 req.FlowId = resource_id
                 resp = client.DescribeStreamLinkFlow(req)
 
-                if hasattr(resp, "Info"):
-                    info = resp.Info
-                    input_group = getattr(info, "InputGroup", [])
-                    input_details = []
-                    for inp in input_group:
-                        input_details.append({
-                            "id": getattr(inp, "InputId", ""),
-                            "name": getattr(inp, "InputName", "") or getattr(inp, "InputId", "") or "Unknown",
+                info = getattr(resp, "Info", None)
+                if info is not None:
+                    input_details = [
+                        {
+                            "id": (inp_id := getattr(inp, "InputId", "")),
+                            "name": getattr(inp, "InputName", "") or inp_id or "Unknown",
                             "protocol": getattr(inp, "Protocol", ""),
-                        })
+                        }
+                        for inp in getattr(info, "InputGroup", ())
+                    ]
 
                     return {
                         "id": getattr(info, "FlowId", resource_id),
@@ -1488,14 +2402,22 @@ class TencentCloudClient:
         return None
 
     def prewarm_cache(self) -> None:
-        """Pre-warm linkage caches in background."""
+        """Pre-warm linkage caches and SDK connections in background."""
         logger.info("Pre-warming Tencent Cloud linkage cache...")
-        self.executor.submit(self.list_all_resources)
+        self._listing_executor.submit(self.list_all_resources)
+        # list_all_resources covers MDL/MDC; open keep-alive connections to
+        # the optional products too so their first user request is warm
+        if STREAMPACKAGE_AVAILABLE:
+            self._listing_executor.submit(self.list_streampackage_channels)
+        if CSS_AVAILABLE:
+            self._listing_executor.submit(self.list_css_domains)
 
     def clear_cache(self) -> None:
         """Clear all caches."""
-        with self._cache_lock:
-            self._linkage_cache.clear()
+        self._linkage_cache.clear()
+        for shard, lock in self._flow_stats_shards:
+            with lock:
+                shard.clear()
         logger.info("Linkage cache cleared")
 
     def search_resources(self, keywords: List[str]) -> List[Dict]:
@@ -1505,13 +2427,19 @@ class TencentCloudClient:
         if not keywords:
             return all_resources
 
-        filtered = []
-        for resource in all_resources:
-            name = resource.get("name", "").lower()
-            if any(keyword.lower() in name for keyword in keywords):
-                filtered.append(resource)
+        # Lowercase the keywords once rather than case-folding them again for
+        # every resource name. A keyword containing a shorter one can never
+        # change the result, so only the minimal set is matched.
+        lowered = []
+        for keyword in sorted({k.lower() for k in keywords}, key=len):
+            if not any(shorter in keyword for shorter in lowered):
+                lowered.append(keyword)
+        if len(lowered) == 1:
+            keyword = lowered[0]
+            return [r for r in all_resources if keyword in r.get("name", "").lower()]
 
-        return filtered
+        pattern = re.compile("|".join(map(re.escape, lowered)))
+        return [r for r in all_resources if pattern.search(r.get("name", "").lower())]
 
     def list_streampackage_channels(self) -> List[Dict]:
         """List StreamPackage channels."""
@@ -1528,23 +2456,23 @@ class TencentCloudClient:
             resp = client.DescribeStreamPackageChannels(req)
 
             channels = []
-            if hasattr(resp, "Infos") and resp.Infos:
-                for info in resp.Infos:
+            infos = getattr(resp, "Infos", None)
+            if infos:
+                for info in infos:
                     channel_id = getattr(info, "Id", "")
                     channel_name = getattr(info, "Name", "")
                     state = getattr(info, "State", "unknown")
 
                     # Get input details
-                    input_details = []
                     points = getattr(info, "Points", None)
-                    if points:
-                        inputs = getattr(points, "Inputs", [])
-                        for inp in inputs:
-                            input_details.append({
-                                "id": getattr(inp, "InputId", ""),
-                                "name": getattr(inp, "InputName", ""),
-                                "url": getattr(inp, "Url", ""),
-                            })
+                    input_details = [
+                        {
+                            "id": getattr(inp, "InputId", ""),
+                            "name": getattr(inp, "InputName", ""),
+                            "url": getattr(inp, "Url", ""),
+                        }
+                        for inp in (getattr(points, "Inputs", ()) if points else ())
+                    ]
 
                     channels.append({
                         "id": channel_id,
@@ -1568,9 +2496,10 @@ class TencentCloudClient:
             return None
 
         try:
-            result = self._get_streampackage_input_status(channel_id)
-            if not result:
+            sp_status = self._get_streampackage_input_status(channel_id)
+            if not sp_status:
                 return None
+            result = dict(sp_status)  # Copy so the cached status is not mutated
 
             # Get additional channel info
             client = self._get_mdp_client()
@@ -1581,8 +2510,8 @@ class TencentCloudClient:
             req.Id = channel_id
             resp = client.DescribeStreamPackageChannel(req)
 
-            if hasattr(resp, "Info"):
-                info = resp.Info
+            info = getattr(resp, "Info", None)
+            if info is not None:
                 result.update({
                     "name": getattr(info, "Name", ""),
                     "state": getattr(info, "State", ""),
@@ -1598,7 +2527,10 @@ class TencentCloudClient:
     def get_flow_statistics(self, flow_id: str) -> Optional[Dict]:
         """Get real-time statistics for a StreamLink flow.
 
-        Uses DescribeStreamLinkFlowRealtimeStatus to get current bitrate, fps, codec, resolution.
+        Uses DescribeStreamLinkFlowRealtimeStatus to get current bitrate and state, and
+        DescribeStreamLinkFlowStatistics for fps and fallback bitrate (skipped for idle flows).
+        The statistics request overlaps the realtime one when the flow was active
+        last time or the realtime call is still pending after FLOW_STATS_HEDGE_DELAY.
 
         Args:
             flow_id: StreamLink flow ID
@@ -1621,7 +2553,23 @@ class TencentCloudClient:
             req = mdc_models.DescribeStreamLinkFlowRealtimeStatusRequest()
             req.FlowId = flow_id
 
-            resp = client.DescribeStreamLinkFlowRealtimeStatus(req)
+            self._flow_stats_rate_limiter.acquire()
+            realtime_future = self._sdk_call_executor.submit(client.DescribeStreamLinkFlowRealtimeStatus, req)
+
+            # The statistics request (fps, fallback bitrate) is hedged: issued up
+            # front for flows that were active last time, otherwise only if the
+            # realtime call is slow, so idle flows usually make a single call
+            stats_future = None
+            hedge_delay = 0 if self._flow_was_active(flow_id) else FLOW_STATS_HEDGE_DELAY
+            try:
+                resp = realtime_future.result(timeout=hedge_delay)
+            except FutureTimeoutError:
+                stats_future = self._submit_flow_statistics(client, flow_id)
+                try:
+                    resp = realtime_future.result()
+                except Exception:
+                    stats_future.cancel()
+                    raise
 
             result = {
                 "flow_id": flow_id,
@@ -1637,134 +2585,90 @@ class TencentCloudClient:
                 "outputs": [],
             }
 
-            if hasattr(resp, "Datas") and resp.Datas:
-                for item in resp.Datas:
+            datas = getattr(resp, "Datas", None)
+            if datas:
+                inputs: List[FlowStatItem] = []
+                outputs: List[FlowStatItem] = []
+
+                for item in datas:
                     # CommonStatus contains bitrate and state
                     common_status = getattr(item, "CommonStatus", None)
-                    item_type = getattr(item, "Type", "")
-                    input_id = getattr(item, "InputId", "")
-                    output_id = getattr(item, "OutputId", "")
-
-                    if common_status:
-                        bitrate = getattr(common_status, "Bitrate", 0) or 0
-                        state = getattr(common_status, "State", "unknown")
-                        connected_time = getattr(common_status, "ConnectedTime", "")
-
-                        item_data = {
-                            "type": item_type,
-                            "input_id": input_id,
-                            "output_id": output_id,
-                            "bitrate": bitrate,
-                            "bitrate_mbps": f"{bitrate / 1_000_000:.2f}" if bitrate else "0",
-                            "state": state,
-                            "connected_time": connected_time,
-                        }
+                    if common_status is None:
+                        continue
+
+                    fields = _model_fields(item, _FLOW_STATUS_ITEM_DEFAULTS)
+                    # Categorize by type (lowercased once per item)
+                    kind = fields["Type"].lower()
+                    if kind == "input":
+                        target = inputs
+                    elif kind == "output":
+                        target = outputs
+                    else:
+                        continue
 
-                        # Categorize by type
-                        if item_type.lower() == "input":
-                            result["inputs"].append(item_data)
-                            # Use input stats as primary (sum up if multiple)
-                            result["bitrate"] += bitrate
-                            if state != "unknown" and result["state"] == "unknown":
-                                result["state"] = state
-                            if connected_time and not result["connected_time"]:
-                                result["connected_time"] = connected_time
-                        elif item_type.lower() == "output":
-                            result["outputs"].append(item_data)
+                    status = _model_fields(common_status, _COMMON_STATUS_DEFAULTS)
+                    stat = FlowStatItem(
+                        type=fields["Type"],
+                        input_id=fields["InputId"],
+                        output_id=fields["OutputId"],
+                        bitrate=status["Bitrate"],
+                        state=status["State"],
+                        connected_time=status["ConnectedTime"],
+                    )
 
                     # Check protocol-specific status for additional info
-                    protocol = getattr(item, "Protocol", "")
-                    if protocol == "SRT":
+                    if fields["Protocol"] == "SRT":
                         srt_status = getattr(item, "SRTStatus", None)
                         if srt_status:
                             # SRT provides RTT, packet loss info
-                            item_data["rtt"] = getattr(srt_status, "RTT", None)
-                            item_data["recv_packet_loss_rate"] = getattr(srt_status, "RecvPacketLossRate", None)
-                            item_data["send_packet_loss_rate"] = getattr(srt_status, "SendPacketLossRate", None)
+                            stat.srt = _model_fields(srt_status, _SRT_STATUS_DEFAULTS)
+
+                    target.append(stat)
+
+                # Use input stats as primary (sum up if multiple)
+                result["bitrate"] = sum(i.bitrate for i in inputs)
+                result["state"] = next((i.state for i in inputs if i.state != "unknown"), "unknown")
+                result["connected_time"] = next((i.connected_time for i in inputs if i.connected_time), None)
 
                 # If input bitrate is 0, use output bitrate (some flows only report output)
-                if result["bitrate"] == 0 and result["outputs"]:
-                    output_bitrate = sum(o.get("bitrate", 0) for o in result["outputs"])
+                if result["bitrate"] == 0 and outputs:
+                    # One pass: sum output bitrate and remember the first known state
+                    output_bitrate = 0
+                    output_state = None
+                    for o in outputs:
+                        output_bitrate += o.bitrate
+                        if output_state is None and o.state and o.state != "unknown":
+                            output_state = o.state
                     if output_bitrate > 0:
                         result["bitrate"] = output_bitrate
                         # Also get state from output if input state is unknown
-                        if result["state"] == "unknown":
-                            for o in result["outputs"]:
-                                if o.get("state") and o["state"] != "unknown":
-                                    result["state"] = o["state"]
-                                    break
+                        if result["state"] == "unknown" and output_state:
+                            result["state"] = output_state
+
+                result["inputs"] = [i.to_dict() for i in inputs]
+                result["outputs"] = [o.to_dict() for o in outputs]
 
                 # Calculate total bitrate in Mbps
                 if result["bitrate"] > 0:
-                    result["bitrate_mbps"] = f"{result['bitrate'] / 1_000_000:.2f}"
-
-            # Try to get media info (codec, resolution) from statistics API
-            try:
-                from datetime import datetime, timedelta, timezone
-
-                media_req = mdc_models.DescribeStreamLinkFlowMediaStatisticsRequest()
-                media_req.FlowId = flow_id
-                media_req.Type = "Input"
-                media_req.Period = "5s"  # 5 second granularity
-                media_req.StartTime = (datetime.now(timezone.utc) - timedelta(minutes=5)).strftime("%Y-%m-%dT%H:%M:%SZ")
-                media_req.EndTime = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-
-                media_resp = client.DescribeStreamLinkFlowMediaStatistics(media_req)
-
-                if hasattr(media_resp, "Infos") and media_resp.Infos:
-                    # Get the most recent media info
-                    for info in media_resp.Infos:
-                        video = getattr(info, "Video", None)
-                        audio = getattr(info, "Audio", None)
-
-                        if video:
-                            fps = getattr(video, "Fps", 0) or 0
-                            if fps > 0 and result["fps"] == 0:
-                                result["fps"] = fps
-
-                        # Try to get codec info from statistics API
-                        # Note: The DescribeStreamLinkFlowStatistics may provide more detail
-                        break  # Only need the most recent
-            except Exception as e:
-                logger.debug(f"Could not get media statistics for flow {flow_id}: {e}")
+                    result["bitrate_mbps"] = _format_mbps(result["bitrate"])
+
+            # Idle flow (no state, no bitrate): the statistics window will be
+            # empty too, so don't request it (or drop a hedged request that
+            # hasn't started yet)
+            if self._is_idle_flow_stats(result):
+                if stats_future is not None:
+                    stats_future.cancel()
+                logger.debug(f"Flow {flow_id} is idle, skipping statistics")
+                return result
 
-            # Try to get additional stats (fps, codec) from statistics API
+            # Get additional stats (fps, bitrate fallback) from statistics API
             try:
-                from datetime import datetime, timedelta, timezone
-
-                stats_req = mdc_models.DescribeStreamLinkFlowStatisticsRequest()
-                stats_req.FlowId = flow_id
-                stats_req.Type = "Input"
-                stats_req.Period = "5s"
-                stats_req.StartTime = (datetime.now(timezone.utc) - timedelta(minutes=5)).strftime("%Y-%m-%dT%H:%M:%SZ")
-                stats_req.EndTime = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-
-                stats_resp = client.DescribeStreamLinkFlowStatistics(stats_req)
-
-                if hasattr(stats_resp, "Infos") and stats_resp.Infos:
-                    # Get the most recent stats
-                    for info_arr in stats_resp.Infos:
-                        flow_stats_list = getattr(info_arr, "FlowStatistics", [])
-                        if flow_stats_list:
-                            # Get most recent entry
-                            latest = flow_stats_list[-1] if isinstance(flow_stats_list, list) else flow_stats_list
-
-                            video = getattr(latest, "Video", None)
-                            audio = getattr(latest, "Audio", None)
-
-                            if video:
-                                fps = getattr(video, "Fps", 0) or 0
-                                if fps > 0 and result["fps"] == 0:
-                                    result["fps"] = fps
-                                rate = getattr(video, "Rate", 0) or 0
-                                if rate > 0 and result["bitrate"] == 0:
-                                    result["bitrate"] = rate
-                                    result["bitrate_mbps"] = f"{rate / 1_000_000:.2f}"
-
-                            if audio:
-                                audio_rate = getattr(audio, "Rate", 0) or 0
-                                # Could add audio rate to total if needed
-                            break  # Only need most recent
+                if stats_future is None:
+                    self._flow_stats_rate_limiter.acquire()
+                    infos = self._fetch_flow_statistics_infos(client, flow_id)
+                else:
+                    infos = stats_future.result(timeout=self._timeout)
+                self._merge_flow_statistics(result, infos)
             except Exception as e:
                 logger.debug(f"Could not get flow statistics for flow {flow_id}: {e}")
 
@@ -1778,10 +2682,61 @@ class TencentCloudClient:
             logger.error(f"Unexpected error getting flow statistics for {flow_id}: {e}")
             return None
 
+    @staticmethod
+    def _is_idle_flow_stats(stats: Dict) -> bool:
+        """Whether realtime status reported neither a state nor any bitrate."""
+        return stats.get("state") == "unknown" and not stats.get("bitrate")
+
+    def _flow_was_active(self, flow_id: str) -> bool:
+        """Whether the flow's cached statistics (fresh or stale) showed activity."""
+        shard, lock = self._flow_stats_shard(flow_id)
+        with lock:
+            cached = shard.get(flow_id)
+        return bool(cached and cached["data"] and not self._is_idle_flow_stats(cached["data"]))
+
+    def _submit_flow_statistics(self, client: mdc_client.MdcClient, flow_id: str) -> Future:
+        """Take a rate-limit token and request the statistics window on the leaf pool."""
+        self._flow_stats_rate_limiter.acquire()
+        return self._sdk_call_executor.submit(self._fetch_flow_statistics_infos, client, flow_id)
+
+    @staticmethod
+    def _fetch_flow_statistics_infos(client: mdc_client.MdcClient, flow_id: str) -> list:
+        """Request the current DescribeStreamLinkFlowStatistics window and return its Infos."""
+        req = mdc_models.DescribeStreamLinkFlowStatisticsRequest()
+        req.FlowId = flow_id
+        req.Type = "Input"
+        req.Period = "5s"
+        req.StartTime, req.EndTime = _flow_stats_window(int(time.time()) // FLOW_STATS_WINDOW_BUCKET)
+        return getattr(client.DescribeStreamLinkFlowStatistics(req), "Infos", None) or []
+
+    @staticmethod
+    def _merge_flow_statistics(result: Dict, infos: list) -> None:
+        """Fill fps and fallback bitrate in result from the most recent statistics entry."""
+        for info_arr in infos:
+            flow_stats_list = getattr(info_arr, "FlowStatistics", [])
+            if not flow_stats_list:
+                continue
+            latest = flow_stats_list[-1] if isinstance(flow_stats_list, list) else flow_stats_list
+
+            video = getattr(latest, "Video", None)
+            if video:
+                fps = getattr(video, "Fps", 0) or 0
+                if fps > 0 and result["fps"] == 0:
+                    result["fps"] = fps
+                rate = getattr(video, "Rate", 0) or 0
+                if rate > 0 and result["bitrate"] == 0:
+                    result["bitrate"] = rate
+                    result["bitrate_mbps"] = _format_mbps(rate)
+            break  # Only need most recent
+
     def get_flow_statistics_batch(self, flow_ids: List[str]) -> Dict[str, Optional[Dict]]:
         """Get statistics for multiple flows in parallel with caching.
 
-        Uses a 60-second cache to avoid API rate limits (20 req/sec).
+        Uses a 60-second cache to avoid API rate limits (20 req/sec), and every
+        SDK request in get_flow_statistics is paced by the process-wide
+        FLOW_STATS_RATE_LIMIT token bucket. Failed lookups are cached for 15
+        seconds so broken flows are not retried on every call, and idle flows
+        for 120 seconds.
 
         Args:
             flow_ids: List of flow IDs
@@ -1789,20 +2744,7 @@ class TencentCloudClient:
         Returns:
             Dict mapping flow_id to statistics (or None if failed)
         """
-        results = {}
-        ids_to_fetch = []
-        cache_ttl = 60  # 60 seconds cache for flow stats
-
-        # Check cache first
-        now = time.time()
-        with self._cache_lock:
-            for flow_id in flow_ids:
-                cache_key = f"flow_stats_{flow_id}"
-                cached = self._linkage_cache.get(cache_key)
-                if cached and (now - cached["timestamp"] < cache_ttl):
-                    results[flow_id] = cached["data"]
-                else:
-                    ids_to_fetch.append(flow_id)
+        results, ids_to_fetch = self._get_cached_flow_stats(flow_ids)
 
         if not ids_to_fetch:
             logger.debug(f"All {len(flow_ids)} flow stats from cache")
@@ -1813,25 +2755,71 @@ class TencentCloudClient:
         def fetch_stats(flow_id: str) -> tuple:
             return (flow_id, self.get_flow_statistics(flow_id))
 
-        # Submit all tasks in parallel (rate limit errors ok, cache helps on retry)
-        futures = [self.executor.submit(fetch_stats, fid) for fid in ids_to_fetch]
+        # Submit all tasks in parallel; get_flow_statistics paces its own requests
+        futures = [self._stats_executor.submit(fetch_stats, fid) for fid in ids_to_fetch]
 
-        for future in futures:
+        for flow_id, future in zip(ids_to_fetch, futures):
             try:
-                flow_id, stats = future.result(timeout=self._timeout)
+                _, stats = future.result(timeout=self._timeout)
                 results[flow_id] = stats
-
-                # Cache the result
-                with self._cache_lock:
-                    self._linkage_cache[f"flow_stats_{flow_id}"] = {
-                        "data": stats,
-                        "timestamp": time.time(),
-                    }
+                self._cache_flow_stats(flow_id, stats)
             except Exception as e:
                 logger.debug(f"Stats fetch skipped (rate limit ok): {e}")
+                self._cache_flow_stats(flow_id, None)
 
         return results
 
+    def _get_cached_flow_stats(self, flow_ids: List[str]) -> tuple:
+        """Split flow IDs into cached statistics and IDs that need fetching.
+
+        Returns:
+            Tuple of (dict of cached flow_id -> stats, list of flow IDs to fetch)
+        """
+        results = {}
+        ids_to_fetch = []
+
+        now = time.time()
+        for flow_id in flow_ids:
+            shard, lock = self._flow_stats_shard(flow_id)
+            with lock:
+                cached = shard.get(flow_id)
+            if cached and (now - cached["timestamp"] < cached["ttl"]):
+                results[flow_id] = cached["data"]
+            else:
+                ids_to_fetch.append(flow_id)
+
+        return results, ids_to_fetch
+
+    def _flow_stats_shard(self, flow_id: str) -> tuple:
+        """Return the (dict, lock) cache shard holding a flow's statistics."""
+        return self._flow_stats_shards[hash(flow_id) & (FLOW_STATS_CACHE_SHARDS - 1)]
+
+    def _cache_flow_stats(self, flow_id: str, stats: Optional[Dict]) -> None:
+        """Store flow statistics in the cache.
+
+        None is cached as a negative result with a short TTL; idle flows are
+        cached longer than active ones.
+        """
+        if stats is None:
+            ttl = FLOW_STATS_NEGATIVE_CACHE_TTL
+        elif self._is_idle_flow_stats(stats):
+            ttl = FLOW_STATS_IDLE_CACHE_TTL
+        else:
+            ttl = FLOW_STATS_CACHE_TTL
+        shard, lock = self._flow_stats_shard(flow_id)
+        with lock:
+            shard[flow_id] = {
+                "data": stats,
+                "timestamp": time.time(),
+                "ttl": ttl,
+            }
+
+    def invalidate_flow_stats(self, flow_id: str) -> None:
+        """Drop cached statistics for a flow (e.g. after it is started or stopped)."""
+        shard, lock = self._flow_stats_shard(flow_id)
+        with lock:
+            shard.pop(flow_id, None)
+
     def list_css_domains(self) -> List[Dict]:
         """List CSS (Cloud Streaming Service) domains."""
         if not CSS_AVAILABLE:
@@ -1847,8 +2835,9 @@ class TencentCloudClient:
             resp = client.DescribeLiveDomains(req)
 
             domains = []
-            if hasattr(resp, "DomainList") and resp.DomainList:
-                for domain_info in resp.DomainList:
+            domain_list = getattr(resp, "DomainList", None)
+            if domain_list:
+                for domain_info in domain_list:
                     domain_name = getattr(domain_info, "DomainName", "")
                     domain_type = getattr(domain_info, "DomainType", "")
                     status = getattr(domain_info, "Status", "")
@@ -1869,6 +2858,7 @@ class TencentCloudClient:
             logger.error(f"Failed to list CSS domains: {e}")
             return []
 
+    @_ttl_cached(STATE_CACHE_TTL)
     def list_css_streams(self, domain: Optional[str] = None) -> List[Dict]:
         """List active CSS streams."""
         if not CSS_AVAILABLE:
@@ -1890,8 +2880,9 @@ class TencentCloudClient:
                 resp = client.DescribeLiveStreamOnlineList(req)
                 streams = []
 
-                if hasattr(resp, "OnlineInfo") and resp.OnlineInfo:
-                    for stream_info in resp.OnlineInfo:
+                online_info = getattr(resp, "OnlineInfo", None)
+                if online_info:
+                    for stream_info in online_info:
                         stream_name = getattr(stream_info, "StreamName", "")
                         app_name = getattr(stream_info, "AppName", "")
                         publish_time = getattr(stream_info, "PublishTime", "")
@@ -1909,15 +2900,21 @@ class TencentCloudClient:
 
                 return streams
             else:
-                # List all domains first, then get streams for each
+                # List all domains first, then get streams for each domain concurrently
                 domains = self.list_css_domains()
+                domain_names = [d["domain"] for d in domains if d.get("domain")]
                 all_streams = []
 
-                for domain_info in domains:
-                    domain_name = domain_info.get("domain")
-                    if domain_name:
-                        domain_streams = self.list_css_streams(domain_name)
-                        all_streams.extend(domain_streams)
+                futures = [
+                    self._sdk_call_executor.submit(self.list_css_streams, domain_name)
+                    for domain_name in domain_names
+                ]
+                # Collect in domain order so the result is deterministic
+                for future in futures:
+                    try:
+                        all_streams.extend(future.result(timeout=self._timeout))
+                    except Exception as e:
+                        logger.debug(f"CSS stream listing skipped for a domain: {e}")
 
                 return all_streams
 
@@ -1946,16 +2943,15 @@ class TencentCloudClient:
                 if domain:
                     push_req.DomainName = domain
 
-                parts = stream_name.split("/")
-                if len(parts) >= 2:
-                    push_req.AppName = parts[0]
-                    push_req.StreamName = "/".join(parts[1:])
-                else:
-                    push_req.StreamName = stream_name
+                app_name, stream = _parse_css_stream_name(stream_name)
+                if app_name:
+                    push_req.AppName = app_name
+                push_req.StreamName = stream
 
                 push_resp = client.DescribeLiveStreamPushInfoList(push_req)
-                if hasattr(push_resp, "DataInfoList") and push_resp.DataInfoList:
-                    push_info = push_resp.DataInfoList[0]
+                push_infos = getattr(push_resp, "DataInfoList", None)
+                if push_infos:
+                    push_info = push_infos[0]
                     result.update({
                         "push_url": getattr(push_info, "StreamUrl", ""),
                         "push_domain": getattr(push_info, "DomainName", ""),
@@ -1994,8 +2990,6 @@ class TencentCloudClient:
             return None
 
         try:
-            from datetime import datetime, timedelta, timezone
-
             client = self._get_css_client()
             if not client:
                 return None
@@ -2007,30 +3001,30 @@ class TencentCloudClient:
                 req.DomainName = domain
 
             # Parse stream name
-            parts = stream_name.split("/")
-            if len(parts) >= 2:
-                req.AppName = parts[0]
-                req.StreamName = "/".join(parts[1:])
-            else:
-                req.StreamName = stream_name
+            app_name, stream = _parse_css_stream_name(stream_name)
+            if app_name:
+                req.AppName = app_name
+            req.StreamName = stream
 
             # Set time range (default: last 24 hours)
+            now = datetime.now(timezone.utc)
             if not start_time:
-                start_time = (datetime.now(timezone.utc) - timedelta(days=1)).strftime("%Y-%m-%d")
+                start_time = (now - timedelta(days=1)).strftime(CSS_DATE_FORMAT)
             if not end_time:
-                end_time = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+                end_time = now.strftime(CSS_DATE_FORMAT)
 
             req.StartTime = start_time
             req.EndTime = end_time
 
             resp = client.DescribeStreamDayPlayInfoList(req)
 
-            if hasattr(resp, "DataInfoList") and resp.DataInfoList:
+            data_info_list = getattr(resp, "DataInfoList", None)
+            if data_info_list:
                 total_bandwidth = 0
                 total_traffic = 0
                 daily_info = []
 
-                for data_info in resp.DataInfoList:
+                for data_info in data_info_list:
                     bandwidth = getattr(data_info, "Bandwidth", 0)
                     flux = getattr(data_info, "Flux", 0)
                     time_str = getattr(data_info, "Time", "")
@@ -2089,12 +3083,10 @@ class TencentCloudClient:
             if domain:
                 push_req.DomainName = domain
 
-            parts = stream_name.split("/")
-            if len(parts) >= 2:
-                push_req.AppName = parts[0]
-                push_req.StreamName = "/".join(parts[1:])
-            else:
-                push_req.StreamName = stream_name
+            app_name, stream = _parse_css_stream_name(stream_name)
+            if app_name:
+                push_req.AppName = app_name
+            push_req.StreamName = stream
 
             push_resp = client.DescribeStreamPushInfoList(push_req)
 
@@ -2103,8 +3095,9 @@ class TencentCloudClient:
                 "domain": domain,
             }
 
-            if hasattr(push_resp, "DataInfoList") and push_resp.DataInfoList:
-                push_info = push_resp.DataInfoList[0]
+            push_infos = getattr(push_resp, "DataInfoList", None)
+            if push_infos:
+                push_info = push_infos[0]
 
                 # Extract quality information
                 quality_info.update({
@@ -2116,34 +3109,29 @@ class TencentCloudClient:
                     "client_ip": getattr(push_info, "ClientIp", ""),
                 })
 
-                # Try to get detailed push quality (if available in newer API versions)
-                # Note: Some fields may not be available in all API versions
-                try:
-                    # These fields might be available in DescribeStreamPushInfoList
-                    video_codec = getattr(push_info, "VideoCodec", "")
-                    audio_codec = getattr(push_info, "AudioCodec", "")
-                    video_bitrate = getattr(push_info, "VideoBitrate", 0)
-                    audio_bitrate = getattr(push_info, "AudioBitrate", 0)
-                    video_fps = getattr(push_info, "VideoFps", 0)
-                    resolution = getattr(push_info, "Resolution", "")
-
-                    if video_codec or audio_codec:
-                        quality_info["codec"] = {
-                            "video": video_codec,
-                            "audio": audio_codec,
-                        }
-                    if video_bitrate or audio_bitrate:
-                        quality_info["bitrate"] = {
+                # Detailed push quality (if available in newer API versions).
+                # Some fields may not be available in all API versions, so every
+                # read has a default and missing fields are simply left out.
+                video_codec = getattr(push_info, "VideoCodec", "")
+                audio_codec = getattr(push_info, "AudioCodec", "")
+                video_bitrate = getattr(push_info, "VideoBitrate", 0) or 0
+                audio_bitrate = getattr(push_info, "AudioBitrate", 0) or 0
+
+                quality_info.update({
+                    key: value
+                    for key, value in (
+                        ("codec", {"video": video_codec, "audio": audio_codec}
+                            if video_codec or audio_codec else None),
+                        ("bitrate", {
                             "video": video_bitrate,  # bps
                             "audio": audio_bitrate,  # bps
                             "total": video_bitrate + audio_bitrate,
-                        }
-                    if video_fps:
-                        quality_info["framerate"] = video_fps
-                    if resolution:
-                        quality_info["resolution"] = resolution
-                except Exception:
-                    pass  # Quality fields may not be available
+                        } if video_bitrate or audio_bitrate else None),
+                        ("framerate", getattr(push_info, "VideoFps", 0) or None),
+                        ("resolution", getattr(push_info, "Resolution", "") or None),
+                    )
+                    if value is not None
+                })
 
             # Get play quality info
             try:
@@ -2151,25 +3139,23 @@ class TencentCloudClient:
                 if domain:
                     play_req.DomainName = domain
 
-                parts = stream_name.split("/")
-                if len(parts) >= 2:
-                    play_req.AppName = parts[0]
-                    play_req.StreamName = "/".join(parts[1:])
-                else:
-                    play_req.StreamName = stream_name
+                app_name, stream = _parse_css_stream_name(stream_name)
+                if app_name:
+                    play_req.AppName = app_name
+                play_req.StreamName = stream
 
                 # Get recent play info (last hour)
-                from datetime import datetime, timedelta, timezone
                 end_time = datetime.now(timezone.utc)
                 start_time = end_time - timedelta(hours=1)
 
-                play_req.StartTime = start_time.strftime("%Y-%m-%d %H:%M:%S")
-                play_req.EndTime = end_time.strftime("%Y-%m-%d %H:%M:%S")
+                play_req.StartTime = start_time.strftime(CSS_DATETIME_FORMAT)
+                play_req.EndTime = end_time.strftime(CSS_DATETIME_FORMAT)
 
                 play_resp = client.DescribeStreamPlayInfoList(play_req)
 
-                if hasattr(play_resp, "DataInfoList") and play_resp.DataInfoList:
-                    play_info = play_resp.DataInfoList[0]
+                play_infos = getattr(play_resp, "DataInfoList", None)
+                if play_infos:
+                    play_info = play_infos[0]
 
                     # Extract play quality and viewer info
                     play_bandwidth = getattr(play_info, "Bandwidth", 0)
@@ -2182,15 +3168,12 @@ class TencentCloudClient:
                         "time": play_time,
                     }
 
-                    # Try to get viewer count (if available)
-                    try:
-                        # Note: Viewer count might be in a different field or API
-                        # This is a placeholder - actual field name may vary
-                        viewer_count = getattr(play_info, "Online", 0) or getattr(play_info, "ViewerCount", 0)
-                        if viewer_count:
-                            quality_info["viewer_count"] = viewer_count
-                    except Exception:
-                        pass
+                    # Viewer count (if available)
+                    # Note: Viewer count might be in a different field or API
+                    # This is a placeholder - actual field name may vary
+                    viewer_count = getattr(play_info, "Online", 0) or getattr(play_info, "ViewerCount", 0)
+                    if viewer_count:
+                        quality_info["viewer_count"] = viewer_count
 
             except Exception as e:
                 logger.debug(f"Could not get play quality info: {e}")
@@ -2226,8 +3209,6 @@ class TencentCloudClient:
             return []
 
         try:
-            from datetime import datetime, timedelta, timezone
-
             client = self._get_css_client()
             if not client:
                 return []
@@ -2238,18 +3219,17 @@ class TencentCloudClient:
                 req.DomainName = domain
 
             # Parse stream name
-            parts = stream_name.split("/")
-            if len(parts) >= 2:
-                req.AppName = parts[0]
-                req.StreamName = "/".join(parts[1:])
-            else:
-                req.StreamName = stream_name
+            app_name, stream = _parse_css_stream_name(stream_name)
+            if app_name:
+                req.AppName = app_name
+            req.StreamName = stream
 
             # Set time range
+            now = datetime.now(timezone.utc)
             if not start_time:
-                start_time = (datetime.now(timezone.utc) - timedelta(hours=hours)).strftime("%Y-%m-%d %H:%M:%S")
+                start_time = (now - timedelta(hours=hours)).strftime(CSS_DATETIME_FORMAT)
             if not end_time:
-                end_time = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+                end_time = now.strftime(CSS_DATETIME_FORMAT)
 
             req.StartTime = start_time
             req.EndTime = end_time
@@ -2257,8 +3237,9 @@ class TencentCloudClient:
             resp = client.DescribeLiveStreamEventList(req)
 
             events = []
-            if hasattr(resp, "EventList") and resp.EventList:
-                for event in resp.EventList:
+            event_list = getattr(resp, "EventList", None)
+            if event_list:
+                for event in event_list:
                     event_type = getattr(event, "EventType", "")
                     event_time = getattr(event, "Time", "")
                     event_status = getattr(event, "Status", "")
@@ -2274,7 +3255,7 @@ class TencentCloudClient:
                     })
 
             # Sort by time (most recent first)
-            events.sort(key=lambda x: x.get('time', ''), reverse=True)
+            events.sort(key=itemgetter("time"), reverse=True)
 
             return events
 
@@ -2304,22 +3285,14 @@ class TencentCloudClient:
             List of log entries with type, time, pipeline, message
         """
         try:
-            from datetime import datetime, timedelta, timezone
-
             client = self._get_mdl_client()
 
             log_req = mdl_models.DescribeStreamLiveChannelLogsRequest()
             log_req.ChannelId = channel_id
 
-            if start_time:
-                log_req.StartTime = start_time
-            else:
-                log_req.StartTime = (datetime.now(timezone.utc) - timedelta(hours=hours)).strftime("%Y-%m-%dT%H:%M:%SZ")
-
-            if end_time:
-                log_req.EndTime = end_time
-            else:
-                log_req.EndTime = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+            default_start, default_end = _iso_utc_window(hours)
+            log_req.StartTime = start_time or default_start
+            log_req.EndTime = end_time or default_end
 
             log_resp = client.DescribeStreamLiveChannelLogs(log_req)
 
@@ -2328,6 +3301,7 @@ class TencentCloudClient:
 
             infos = log_resp.Infos
             all_logs = []
+            event_types_set = set(event_types) if event_types else None
 
             # Collect logs from both pipelines
             for pipeline_attr in ['Pipeline0', 'Pipeline1']:
@@ -2337,34 +3311,23 @@ class TencentCloudClient:
                     continue
 
                 logs = pipeline_logs if isinstance(pipeline_logs, list) else [pipeline_logs]
-                for log in logs:
-                    log_type = getattr(log, 'Type', '')
-                    log_time = getattr(log, 'Time', '')
-                    log_message = getattr(log, 'Message', '')
-
-                    # Filter by event types if specified
-                    if event_types and log_type not in event_types:
-                        continue
-
-                    all_logs.append({
-                        "service": "StreamLive",
-                        "resource_id": channel_id,
-                        "pipeline": pipeline_name,
-                        "event_type": log_type,
-                        "time": log_time,
-                        "message": log_message,
-                        "timestamp": log_time,
-                    })
+                # Filter by event types if specified
+                all_logs.extend(
+                    ChannelLogRecord(channel_id, pipeline_name, log_type, log_time, log_message)
+                    for log_type, log_time, log_message in map(_CHANNEL_LOG_FIELDS, logs)
+                    if event_types_set is None or log_type in event_types_set
+                )
 
-            # Sort by time (most recent first)
-            all_logs.sort(key=lambda x: x.get('time', ''), reverse=True)
+            # Sort by time (most recent first), then convert at the API boundary
+            all_logs.sort(key=attrgetter("time"), reverse=True)
 
-            return all_logs
+            return [record.to_dict() for record in all_logs]
 
         except Exception as e:
             logger.error(f"Failed to get StreamLive channel logs: {e}")
             return []
 
+    @_ttl_cached(STATE_CACHE_TTL)
     def get_streamlink_flow_logs(
         self,
         flow_id: str,
@@ -2387,8 +3350,6 @@ class TencentCloudClient:
             List of log entries
         """
         try:
-            from datetime import datetime, timezone
-
             # StreamLink doesn't have direct log API, so we get flow details
             # and infer events from status changes
             client = self._get_mdc_client()
@@ -2396,15 +3357,15 @@ class TencentCloudClient:
             req.FlowId = flow_id
             resp = client.DescribeStreamLinkFlow(req)
 
-            if not hasattr(resp, "Info"):
+            info = getattr(resp, "Info", None)
+            if info is None:
                 return []
 
-            info = resp.Info
             logs = []
 
             # Get current state as an event
             state = getattr(info, "State", "")
-            state_time = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+            state_time = _iso_utc_now()
 
             logs.append({
                 "service": "StreamLink",
@@ -2425,12 +3386,14 @@ class TencentCloudClient:
             logger.error(f"Failed to get StreamLink flow logs: {e}")
             return []
 
+    @_ttl_cached(STATE_CACHE_TTL, ignore=("input_status",))
     def get_streampackage_channel_logs(
         self,
         channel_id: str,
         start_time: Optional[str] = None,
         end_time: Optional[str] = None,
         hours: int = 24,
+        input_status: Optional[Dict] = None,
     ) -> List[Dict]:
         """
         Get StreamPackage channel logs/events.
@@ -2442,13 +3405,13 @@ class TencentCloudClient:
             start_time: Start time in ISO format (optional)
             end_time: End time in ISO format (optional)
             hours: Number of hours to look back
+            input_status: Already-fetched input status with "active_input"
+                (optional, fetched when not given)
         
         Returns:
             List of log entries
         """
         try:
-            from datetime import datetime, timezone
-
             if not STREAMPACKAGE_AVAILABLE:
                 return []
 
@@ -2460,15 +3423,15 @@ class TencentCloudClient:
             req.Id = channel_id
             resp = client.DescribeStreamPackageChannel(req)
 
-            if not hasattr(resp, "Info"):
+            info = getattr(resp, "Info", None)
+            if info is None:
                 return []
 
-            info = resp.Info
             logs = []
 
             # Get current state as an event
             state = getattr(info, "State", "")
-            state_time = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+            state_time = _iso_utc_now()
 
             logs.append({
                 "service": "StreamPackage",
@@ -2481,7 +3444,8 @@ class TencentCloudClient:
             })
 
             # Get input status
-            input_status = self._get_streampackage_input_status(channel_id)
+            if input_status is None:
+                input_status = self._get_streampackage_input_status(channel_id)
             if input_status:
                 active_input = input_status.get("active_input")
                 if active_input:
@@ -2525,22 +3489,47 @@ class TencentCloudClient:
         Returns:
             List of log entries
         """
-        try:
-            from datetime import datetime, timezone
+        if not CSS_AVAILABLE or not self._get_css_client():
+            return []
+        return self._build_css_stream_logs(
+            stream_name, domain, self._get_css_push_infos_bulk(domain).get(stream_name, [])
+        )
 
-            if not CSS_AVAILABLE:
-                return []
+    @_ttl_cached(STATE_CACHE_TTL)
+    def _get_css_push_infos_bulk(self, domain: Optional[str] = None) -> Dict[str, list]:
+        """List current CSS push info in one call and bucket it by "app/stream" name.
 
+        Args:
+            domain: CSS push domain (optional, all domains if not set)
+        """
+        push_infos: Dict[str, list] = {}
+        try:
             client = self._get_css_client()
             if not client:
-                return []
+                return push_infos
+
+            push_req = live_models.DescribeLiveStreamPushInfoListRequest()
+            if domain:
+                push_req.PushDomain = domain
+            push_req.PageSize = 1000
 
+            push_resp = client.DescribeLiveStreamPushInfoList(push_req)
+            for push_info in getattr(push_resp, "DataInfoList", None) or ():
+                full_name = f"{getattr(push_info, 'AppName', '')}/{getattr(push_info, 'StreamName', '')}"
+                push_infos.setdefault(full_name, []).append(push_info)
+        except Exception as e:
+            logger.debug(f"Could not get CSS push info: {e}")
+        return push_infos
+
+    def _build_css_stream_logs(self, stream_name: str, domain: Optional[str], push_infos: list) -> List[Dict]:
+        """Build log entries for one CSS stream from its state and prefetched push info."""
+        try:
             logs = []
 
             # Get current stream state
             stream_status = self._get_css_stream_status(stream_name, domain)
             if stream_status:
-                state_time = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+                state_time = _iso_utc_now()
                 is_active = stream_status.get("is_active", False)
                 stream_state = stream_status.get("stream_state", "")
 
@@ -2556,46 +3545,59 @@ class TencentCloudClient:
                     "timestamp": state_time,
                 })
 
-            # Try to get push info history (if available)
-            try:
-                push_req = live_models.DescribeLiveStreamPushInfoListRequest()
-                if domain:
-                    push_req.DomainName = domain
-
-                parts = stream_name.split("/")
-                if len(parts) >= 2:
-                    push_req.AppName = parts[0]
-                    push_req.StreamName = "/".join(parts[1:])
-                else:
-                    push_req.StreamName = stream_name
-
-                push_resp = client.DescribeLiveStreamPushInfoList(push_req)
-                if hasattr(push_resp, "DataInfoList") and push_resp.DataInfoList:
-                    for push_info in push_resp.DataInfoList:
-                        push_time = getattr(push_info, "PushTime", "")
-                        if push_time:
-                            logs.append({
-                                "service": "CSS",
-                                "resource_id": stream_name,
-                                "domain": domain,
-                                "event_type": "PushInfo",
-                                "time": push_time,
-                                "message": f"Push info available",
-                                "push_url": getattr(push_info, "StreamUrl", ""),
-                                "timestamp": push_time,
-                            })
-            except Exception as e:
-                logger.debug(f"Could not get CSS push info: {e}")
+            # Push info for this stream (prefetched per domain)
+            for push_info in push_infos:
+                push_time = getattr(push_info, "BeginPushTime", "")
+                if push_time:
+                    logs.append({
+                        "service": "CSS",
+                        "resource_id": stream_name,
+                        "domain": domain,
+                        "event_type": "PushInfo",
+                        "time": push_time,
+                        "message": f"Push info available",
+                        "push_url": getattr(push_info, "StreamUrl", ""),
+                        "timestamp": push_time,
+                    })
 
             # Note: CSS may have limited historical log API
             # This is a limitation - we can only see current state and recent push info
 
+            # Sort by time (most recent first), like the other log getters
+            logs.sort(key=_log_sort_key, reverse=True)
             return logs
 
         except Exception as e:
             logger.error(f"Failed to get CSS stream logs: {e}")
             return []
 
+    def _get_parent_index(self) -> Dict[str, List[str]]:
+        """Map each hierarchy parent ID to its linked child IDs (cached for 30 seconds)."""
+        cache_key = "parent_index"
+        cached = self._linkage_cache.get(cache_key)
+        if cached and (time.time() - cached["timestamp"] < PARENT_INDEX_CACHE_TTL):
+            return cached["data"]
+
+        hierarchy = ResourceHierarchyBuilder.build_hierarchy(self.list_all_resources())
+        index = {
+            h["parent"].get("id"): [child["id"] for child in h["children"] if child.get("id")]
+            for h in hierarchy
+        }
+        self._linkage_cache[cache_key] = {"data": index, "timestamp": time.time()}
+        return index
+
+    def _get_linked_flow_ids(self, channel_id: str) -> List[str]:
+        """IDs of the StreamLink flows that feed a StreamLive channel."""
+        return self._get_parent_index().get(channel_id, [])
+
+    def _get_linked_streampackage(self, channel_id: str) -> Optional[Dict]:
+        """StreamPackage verification (ID and active input) for the channel a
+        StreamLive channel outputs to, if any."""
+        input_status = self.get_channel_input_status(channel_id)
+        if input_status:
+            return input_status.get("streampackage_verification")
+        return None
+
     def get_integrated_logs(
         self,
         channel_id: str,
@@ -2604,6 +3606,7 @@ class TencentCloudClient:
         hours: int = 24,
         services: Optional[List[str]] = None,
         event_types: Optional[List[str]] = None,
+        css_stream_names: Optional[List[str]] = None,
     ) -> Dict:
         """
         Get integrated logs from StreamLive, StreamLink, StreamPackage, and CSS.
@@ -2615,104 +3618,60 @@ class TencentCloudClient:
             hours: Number of hours to look back
             services: Filter by services (optional, e.g., ["StreamLive", "StreamLink"])
             event_types: Filter by event types (optional)
+            css_stream_names: CSS streams ("app/stream") to include (optional;
+                skips CSS stream enumeration)
         
         Returns:
             Dict with integrated logs from all services
+
+        Identical calls that arrive while one is in flight wait for and share
+        its result instead of issuing their own API calls.
         """
-        try:
-            from app.services.linkage import ResourceHierarchyBuilder
+        key = (
+            "integrated_logs", channel_id, start_time, end_time, hours,
+            tuple(services) if services else None,
+            tuple(event_types) if event_types else None,
+            tuple(css_stream_names) if css_stream_names else None,
+        )
+        return self._single_flight(
+            key, self._fetch_integrated_logs,
+            channel_id, start_time, end_time, hours, services, event_types, css_stream_names,
+        )
 
-            # Get StreamLive logs
-            streamlive_logs = []
-            if not services or "StreamLive" in services:
-                streamlive_logs = self.get_streamlive_channel_logs(
-                    channel_id=channel_id,
-                    start_time=start_time,
-                    end_time=end_time,
-                    hours=hours,
-                    event_types=event_types,
+    def _fetch_integrated_logs(
+        self,
+        channel_id: str,
+        start_time: Optional[str],
+        end_time: Optional[str],
+        hours: int,
+        services: Optional[List[str]],
+        event_types: Optional[List[str]],
+        css_stream_names: Optional[List[str]] = None,
+    ) -> Dict:
+        """Query and combine logs from every linked service (see get_integrated_logs)."""
+        default_start, default_end = _iso_utc_window(hours)
+        try:
+            streamlive_logs, streamlink_log_lists, streampackage_logs, css_log_lists = (
+                self._collect_integrated_logs(
+                    channel_id, start_time, end_time, hours, services, event_types, css_stream_names
                 )
+            )
+            streamlink_logs = [log for logs in streamlink_log_lists for log in logs]
+            css_logs = [log for logs in css_log_lists for log in logs]
 
-            # Get linked StreamLink flows
-            streamlink_logs = []
-            if not services or "StreamLink" in services:
-                resources = self.list_all_resources()
-                hierarchy = ResourceHierarchyBuilder.build_hierarchy(resources)
-
-                for h in hierarchy:
-                    if h["parent"].get("id") == channel_id:
-                        for child in h["children"]:
-                            flow_id = child.get("id")
-                            if flow_id:
-                                flow_logs = self.get_streamlink_flow_logs(
-                                    flow_id=flow_id,
-                                    start_time=start_time,
-                                    end_time=end_time,
-                                    hours=hours,
-                                )
-                                streamlink_logs.extend(flow_logs)
-                        break
-
-            # Get StreamPackage logs (if connected)
-            streampackage_logs = []
-            if not services or "StreamPackage" in services:
-                # Get StreamPackage ID from channel input status
-                input_status = self.get_channel_input_status(channel_id)
-                if input_status and "streampackage_verification" in input_status:
-                    sp_id = input_status["streampackage_verification"].get("streampackage_id")
-                    if sp_id:
-                        sp_logs = self.get_streampackage_channel_logs(
-                            channel_id=sp_id,
-                            start_time=start_time,
-                            end_time=end_time,
-                            hours=hours,
-                        )
-                        streampackage_logs.extend(sp_logs)
-
-            # Get CSS logs (if connected)
-            css_logs = []
-            if not services or "CSS" in services:
-                # Try to find CSS streams related to this channel
-                # This is indirect - we need to find CSS streams that might be related
-                # For now, we'll get CSS streams from StreamPackage if available
-                if streampackage_logs:
-                    # CSS streams are typically related to StreamPackage
-                    # We can list active CSS streams and match them
-                    all_css_streams = self.list_css_streams()
-                    for css_stream in all_css_streams[:10]:  # Limit to first 10 for performance
-                        stream_name = css_stream.get("full_name", "")
-                        if stream_name:
-                            css_stream_logs = self.get_css_stream_logs(
-                                stream_name=stream_name,
-                                start_time=start_time,
-                                end_time=end_time,
-                                hours=hours,
-                            )
-                            css_logs.extend(css_stream_logs)
-
-            # Combine all logs
-            all_logs = streamlive_logs + streamlink_logs + streampackage_logs + css_logs
-
-            # Sort by timestamp (most recent first)
-            all_logs.sort(key=lambda x: x.get('timestamp', x.get('time', '')), reverse=True)
-
-            # Filter by event types if specified
-            if event_types:
-                all_logs = [log for log in all_logs if log.get('event_type') in event_types]
+            all_logs = list(self._merge_integrated_logs(
+                [streamlive_logs, *streamlink_log_lists, streampackage_logs, *css_log_lists],
+                event_types,
+            ))
 
             # Generate summary statistics
-            event_counts = {}
-            service_counts = {}
-            for log in all_logs:
-                event_type = log.get('event_type', 'Unknown')
-                service = log.get('service', 'Unknown')
-                event_counts[event_type] = event_counts.get(event_type, 0) + 1
-                service_counts[service] = service_counts.get(service, 0) + 1
+            event_counts = dict(Counter(log.get('event_type', 'Unknown') for log in all_logs))
+            service_counts = dict(Counter(log.get('service', 'Unknown') for log in all_logs))
 
             return {
                 "channel_id": channel_id,
-                "start_time": start_time or (datetime.now(timezone.utc) - timedelta(hours=hours)).strftime("%Y-%m-%dT%H:%M:%SZ"),
-                "end_time": end_time or datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "start_time": start_time or default_start,
+                "end_time": end_time or default_end,
                 "total_logs": len(all_logs),
                 "service_counts": service_counts,
                 "event_counts": event_counts,
@@ -2724,12 +3683,11 @@ class TencentCloudClient:
             }
 
         except Exception as e:
-            from datetime import datetime, timedelta, timezone
             logger.error(f"Failed to get integrated logs: {e}", exc_info=True)
             return {
                 "channel_id": channel_id,
-                "start_time": start_time or (datetime.now(timezone.utc) - timedelta(hours=hours)).strftime("%Y-%m-%dT%H:%M:%SZ"),
-                "end_time": end_time or datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "start_time": start_time or default_start,
+                "end_time": end_time or default_end,
                 "total_logs": 0,
                 "error": str(e),
                 "logs": [],
@@ -2737,6 +3695,141 @@ class TencentCloudClient:
                 "event_counts": {},
             }
 
+    def iter_integrated_logs(
+        self,
+        channel_id: str,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        hours: int = 24,
+        services: Optional[List[str]] = None,
+        event_types: Optional[List[str]] = None,
+        css_stream_names: Optional[List[str]] = None,
+    ) -> Iterator[Dict]:
+        """
+        Yield integrated log entries most recent first, without building the
+        combined list (same arguments as get_integrated_logs).
+
+        Callers that only render the latest N entries can stop early; the
+        per-service lists are merged lazily as records are consumed.
+        """
+        per_service = self._collect_integrated_logs(
+            channel_id, start_time, end_time, hours, services, event_types, css_stream_names
+        )
+        streamlive_logs, streamlink_log_lists, streampackage_logs, css_log_lists = per_service
+        yield from self._merge_integrated_logs(
+            [streamlive_logs, *streamlink_log_lists, streampackage_logs, *css_log_lists],
+            event_types,
+        )
+
+    @staticmethod
+    def _merge_integrated_logs(log_lists: List[List[Dict]], event_types: Optional[List[str]]) -> Iterator[Dict]:
+        """Lazily merge per-service log lists, most recent first.
+
+        Every getter returns its entries newest first, so a k-way merge
+        replaces a full sort.
+        """
+        merged = heapq.merge(*log_lists, key=_log_sort_key, reverse=True)
+        if event_types:
+            return (log for log in merged if log.get('event_type') in event_types)
+        return merged
+
+    def _collect_integrated_logs(
+        self,
+        channel_id: str,
+        start_time: Optional[str],
+        end_time: Optional[str],
+        hours: int,
+        services: Optional[List[str]],
+        event_types: Optional[List[str]],
+        css_stream_names: Optional[List[str]] = None,
+    ) -> tuple:
+        """Fetch the per-service log lists for an integrated log query.
+
+        Returns:
+            (streamlive_logs, streamlink_log_lists, streampackage_logs, css_log_lists),
+            each list sorted most recent first
+        """
+        def want(service: str) -> bool:
+            return not services or service in services
+
+        log_range = {"start_time": start_time, "end_time": end_time, "hours": hours}
+
+        # The per-service log queries are independent SDK round-trips, so
+        # run them concurrently on a dedicated pool (these tasks call into
+        # self.executor, so they must not run on it)
+        with ThreadPoolExecutor(max_workers=INTEGRATED_LOGS_CONCURRENCY) as pool:
+            # Get StreamLive logs
+            sl_future = None
+            if want("StreamLive"):
+                sl_future = pool.submit(
+                    self.get_streamlive_channel_logs,
+                    channel_id=channel_id,
+                    event_types=event_types,
+                    **log_range,
+                )
+
+            # Resolve linked StreamLink flows and StreamPackage channel in parallel
+            flow_ids_future = pool.submit(self._get_linked_flow_ids, channel_id) if want("StreamLink") else None
+            sp_future = (
+                pool.submit(self._get_linked_streampackage, channel_id) if want("StreamPackage") else None
+            )
+
+            # Get linked StreamLink flow logs
+            flow_futures = []
+            if flow_ids_future:
+                flow_futures = [
+                    pool.submit(self.get_streamlink_flow_logs, flow_id=flow_id, **log_range)
+                    for flow_id in flow_ids_future.result()
+                ]
+
+            # Get StreamPackage logs (if connected), reusing the input status
+            # get_channel_input_status already fetched
+            sp_logs_future = None
+            if sp_future:
+                sp_verification = sp_future.result()
+                if sp_verification and sp_verification.get("streampackage_id"):
+                    sp_logs_future = pool.submit(
+                        self.get_streampackage_channel_logs,
+                        channel_id=sp_verification["streampackage_id"],
+                        input_status=sp_verification,
+                        **log_range,
+                    )
+
+            streamlive_logs = sl_future.result() if sl_future else []
+            streamlink_log_lists = [f.result() for f in flow_futures]
+            streampackage_logs = list(sp_logs_future.result()) if sp_logs_future else []
+
+            # Get CSS logs (if connected)
+            css_log_lists = []
+            css_streams = []
+            if want("CSS") and css_stream_names:
+                # Caller named the streams; no enumeration needed
+                css_streams = [{"full_name": name, "domain": None} for name in css_stream_names]
+            elif want("CSS") and streampackage_logs:
+                # CSS streams are typically related to StreamPackage; there is
+                # no direct link, so check the first active streams
+                css_streams = [
+                    css_stream
+                    for css_stream in self.list_css_streams()[:10]  # Limit to first 10 for performance
+                    if css_stream.get("full_name")
+                ]
+            if css_streams:
+                # One push info listing per domain, shared by its streams
+                domains = list(dict.fromkeys(css_stream.get("domain") for css_stream in css_streams))
+                push_infos_by_domain = dict(zip(domains, pool.map(self._get_css_push_infos_bulk, domains)))
+                css_futures = [
+                    pool.submit(
+                        self._build_css_stream_logs,
+                        css_stream["full_name"],
+                        css_stream.get("domain"),
+                        push_infos_by_domain[css_stream.get("domain")].get(css_stream["full_name"], []),
+                    )
+                    for css_stream in css_streams
+                ]
+                css_log_lists = [f.result() for f in css_futures]
+
+        return streamlive_logs, streamlink_log_lists, streampackage_logs, css_log_lists
+
     # ========== INPUT_SWITCH Plan API Methods ==========
 
     def switch_channel_input(
@@ -2813,8 +3906,9 @@ class TencentCloudClient:
             resp = client.DescribeStreamLivePlans(req)
 
             plans = []
-            if hasattr(resp, "Infos") and resp.Infos:
-                for plan_info in resp.Infos:
+            infos = getattr(resp, "Infos", None)
+            if infos:
+                for plan_info in infos:
                     plans.append({
                         "event_name": getattr(plan_info, "EventName", ""),
                         "event_type": getattr(plan_info, "EventType", ""),
@@ -2881,10 +3975,10 @@ class TencentCloudClient:
             req.Id = channel_id
             resp = client.DescribeStreamLiveChannel(req)
 
-            if not hasattr(resp, "Info"):
+            info = getattr(resp, "Info", None)
+            if info is None:
                 return None
 
-            info = resp.Info
             attached_inputs = getattr(info, "AttachedInputs", [])
 
             if not attached_inputs:
@@ -2895,7 +3989,7 @@ class TencentCloudClient:
             try:
                 inp_req = mdl_models.DescribeStreamLiveInputsRequest()
                 inp_resp = client.DescribeStreamLiveInputs(inp_req)
-                all_inputs = inp_resp.Infos if hasattr(inp_resp, "Infos") else []
+                all_inputs = getattr(inp_resp, "Infos", None) or []
                 for inp in all_inputs:
                     inp_id = getattr(inp, "Id", "")
                     inp_name = getattr(inp, "Name", "")
@@ -2951,52 +4045,176 @@ class TencentCloudClient:
 
 
 class AsyncTencentClient:
-    """Async wrapper for TencentCloudClient."""
+    """Async wrapper for TencentCloudClient.
+
+    Blocking SDK calls run on a bounded pool shared by all instances rather
+    than the event loop's default executor, so they neither compete with
+    unrelated to_thread work nor exceed the Tencent API budget.
+    """
+
+    _executor = ThreadPoolExecutor(max_workers=ASYNC_SDK_WORKERS, thread_name_prefix="tencent-sdk")
 
     def __init__(self, sync_client: Optional[TencentCloudClient] = None):
         self._sync = sync_client or TencentCloudClient()
 
+    async def _run(self, fn, *args):
+        """Run a blocking client call on the shared SDK pool."""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, partial(fn, *args))
+
+    @classmethod
+    def close(cls) -> None:
+        """Shut down the shared SDK pool (application shutdown)."""
+        cls._executor.shutdown(wait=False)
+
     async def list_all_resources(self) -> List[Dict]:
-        return await asyncio.to_thread(self._sync.list_all_resources)
+        return await self._run(self._sync.list_all_resources)
 
     async def list_mdl_channels(self) -> List[Dict]:
-        return await asyncio.to_thread(self._sync.list_mdl_channels)
+        return await self._run(self._sync.list_mdl_channels)
 
     async def list_streamlink_inputs(self) -> List[Dict]:
-        return await asyncio.to_thread(self._sync.list_streamlink_inputs)
+        """List StreamLink flows, fetching missing flow details concurrently.
+
+        Each detail call is its own task on the shared SDK pool rather than a
+        batch through the sync client's worker pool. Up to
+        FLOW_DETAIL_CONCURRENCY calls are in flight; the sync client's shared
+        token bucket paces them at FLOW_DETAIL_RATE_LIMIT req/sec.
+        """
+        sync = self._sync
+        semaphore = asyncio.Semaphore(FLOW_DETAIL_CONCURRENCY)
+
+        async def fetch_detail(flow_id: str) -> Dict:
+            async with semaphore:
+                return await self._run(sync._fetch_flow_detail_once, flow_id)
+
+        try:
+            summary_list = await self._run(sync._list_streamlink_flow_summaries)
+            if not summary_list:
+                return []
+            flow_details, ids_to_fetch = sync._get_cached_flow_details(summary_list)
+            if ids_to_fetch:
+                fetched = await asyncio.gather(*(fetch_detail(flow_id) for flow_id in ids_to_fetch))
+                flow_details = sync._cache_flow_details(flow_details, zip(ids_to_fetch, fetched))
+            return sync._build_streamlink_inputs(summary_list, flow_details)
+        except Exception as e:
+            logger.error(f"Failed to list StreamLink flows: {e}")
+            return []
 
     async def control_resource(self, resource_id: str, service: str, action: str) -> Dict:
-        return await asyncio.to_thread(self._sync.control_resource, resource_id, service, action)
+        return await self._run(self._sync.control_resource, resource_id, service, action)
 
     async def get_resource_details(self, resource_id: str, service: str) -> Optional[Dict]:
-        return await asyncio.to_thread(self._sync.get_resource_details, resource_id, service)
+        return await self._run(self._sync.get_resource_details, resource_id, service)
 
     async def search_resources(self, keywords: List[str]) -> List[Dict]:
-        return await asyncio.to_thread(self._sync.search_resources, keywords)
+        return await self._run(self._sync.search_resources, keywords)
 
     async def get_flow_statistics(self, flow_id: str) -> Optional[Dict]:
-        return await asyncio.to_thread(self._sync.get_flow_statistics, flow_id)
+        return await self._run(self._sync.get_flow_statistics, flow_id)
 
     async def get_flow_statistics_batch(self, flow_ids: List[str]) -> Dict[str, Optional[Dict]]:
-        return await asyncio.to_thread(self._sync.get_flow_statistics_batch, flow_ids)
+        """Get statistics for multiple flows concurrently with caching.
+
+        Uncached flows are fetched with up to FLOW_STATS_CONCURRENCY requests in
+        flight; the sync client's shared token bucket paces every SDK request at
+        FLOW_STATS_RATE_LIMIT req/sec. Each result is cached as it arrives.
+        """
+        results, ids_to_fetch = self._sync._get_cached_flow_stats(flow_ids)
+        if not ids_to_fetch:
+            logger.debug(f"All {len(flow_ids)} flow stats from cache")
+            return results
+
+        logger.info(f"Fetching stats for {len(ids_to_fetch)} flows ({len(flow_ids) - len(ids_to_fetch)} from cache)")
+
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(FLOW_STATS_CONCURRENCY)
+
+        async def fetch_stats(flow_id: str) -> None:
+            async with semaphore:
+                try:
+                    stats = await asyncio.wait_for(
+                        loop.run_in_executor(
+                            self._sync._stats_executor, self._sync.get_flow_statistics, flow_id
+                        ),
+                        timeout=self._sync._timeout,
+                    )
+                except Exception as e:
+                    logger.debug(f"Stats fetch skipped (rate limit ok): {e}")
+                    self._sync._cache_flow_stats(flow_id, None)
+                    return
+            results[flow_id] = stats
+            self._sync._cache_flow_stats(flow_id, stats)
+
+        await asyncio.gather(*(fetch_stats(fid) for fid in ids_to_fetch))
+        return results
+
+    async def get_channel_input_status(self, channel_id: str, **kwargs) -> Optional[Dict]:
+        """Active input status of a StreamLive channel.
+
+        Runs the sync lookup on the shared SDK pool; its independent SDK calls
+        already fan out on the sync client's leaf pool, so the event loop
+        only waits on one task.
+        """
+        return await self._run(partial(self._sync.get_channel_input_status, channel_id, **kwargs))
+
+    async def stream_channel_input_status(self, channel_id: str) -> AsyncIterator[Dict]:
+        """Yield a channel's input status in stages as they resolve.
+
+        The log-based pipeline detection (usually the deciding signal) is
+        yielded first as ``{"stage": "log_based", ...}``, then the full
+        get_channel_input_status result as ``{"stage": "final", ...}``. The
+        full lookup shares the log scan rather than repeating it.
+        """
+        status_task = asyncio.ensure_future(self.get_channel_input_status(channel_id))
+        try:
+            try:
+                log_result = await self._run(self._sync._active_pipeline_once, channel_id, 24)
+            except Exception as e:
+                logger.debug(f"Log-based detection failed: {e}")
+                log_result = None
+            yield {"stage": "log_based", "channel_id": channel_id, "log_based_detection": log_result}
+
+            status = await status_task
+            if not status:
+                yield {"stage": "final", "channel_id": channel_id, "error": "Failed to get input status"}
+            else:
+                yield {"stage": "final", **status}
+        finally:
+            status_task.cancel()
+
+    async def get_channel_input_status_batch(
+        self, channel_ids: List[str], min_level: str = "full"
+    ) -> Dict[str, Optional[Dict]]:
+        return await self._run(self._sync.get_channel_input_status_batch, channel_ids, min_level)
+
+    async def iter_integrated_logs(self, channel_id: str, **kwargs) -> AsyncIterator[Dict]:
+        """Async variant of TencentCloudClient.iter_integrated_logs."""
+        records = self._sync.iter_integrated_logs(channel_id, **kwargs)
+        # Only the first record waits on the SDK calls; the rest is an in-memory merge
+        record = await self._run(next, records, None)
+        if record is None:
+            return
+        yield record
+        for record in records:
+            yield record
 
     async def switch_channel_input(
         self, channel_id: str, input_id: str, event_name: str = None
     ) -> Dict:
-        return await asyncio.to_thread(
+        return await self._run(
             self._sync.switch_channel_input, channel_id, input_id, event_name
         )
 
     async def get_channel_plans(self, channel_id: str) -> List[Dict]:
-        return await asyncio.to_thread(self._sync.get_channel_plans, channel_id)
+        return await self._run(self._sync.get_channel_plans, channel_id)
 
     async def delete_channel_plan(self, channel_id: str, event_name: str) -> Dict:
-        return await asyncio.to_thread(
+        return await self._run(
             self._sync.delete_channel_plan, channel_id, event_name
         )
 
     async def get_channel_failover_inputs(self, channel_id: str) -> Optional[Dict]:
-        return await asyncio.to_thread(
+        return await self._run(
             self._sync.get_channel_failover_inputs, channel_id
         )
 
@@ -1,15 +1,21 @@
 """Slack Bolt App instance."""
+import threading
+
 from slack_bolt import App
 
 from app.config import get_settings
 
 _app: App = None
+_app_lock = threading.Lock()
 
 
 def get_slack_app() -> App:
     """Get the Slack Bolt App instance."""
     global _app
     if _app is None:
-        settings = get_settings()
-        _app = App(token=settings.SLACK_BOT_TOKEN)
+        with _app_lock:
+            # Re-check: another thread may have built it while we waited
+            if _app is None:
+                settings = get_settings()
+                _app = App(token=settings.SLACK_BOT_TOKEN)
     return _app
@@ -1,13 +1,9 @@
 """Slack command handlers."""
 import logging
 import re
-import threading
 
 from slack_bolt import App
 
-from app.slack.ui.dashboard import DashboardUI
-from app.slack.ui.schedule import ScheduleUI
-
 logger = logging.getLogger(__name__)
 
 # 제어 명령어 차단 키워드 (생성/수정/삭제 관련)
@@ -24,47 +20,39 @@ BLOCKED_KEYWORDS = {
 }
 
 
+# 활용형까지 차단하는 어간 (예: "생성해줘", "수정해줘" 등)
+_BLOCKED_STEMS = (
+    "생성", "만들", "추가", "수정", "변경", "업데이트", "삭제", "지우", "제거",
+    "create", "add", "make", "new", "modify", "update", "change", "edit", "delete", "remove", "drop",
+)
+
+
+def _minimal_stems(keywords) -> tuple:
+    """Drop keywords that contain a shorter keyword (containment implies a match)."""
+    ordered = sorted({k.lower() for k in keywords}, key=lambda k: (len(k), k))
+    stems = []
+    for keyword in ordered:
+        if not any(stem in keyword for stem in stems):
+            stems.append(keyword)
+    return tuple(stems)
+
+
+# "stem\S*" matches exactly when the stem is a substring, so the keyword set
+# and the regex stems collapse into one deduplicated list of substrings
+_BLOCKED_SUBSTRINGS = _minimal_stems(BLOCKED_KEYWORDS | set(_BLOCKED_STEMS))
+_BLOCKED_RE = re.compile("|".join(map(re.escape, _BLOCKED_SUBSTRINGS)))
+# ASCII-only text can only contain the ASCII keywords
+_BLOCKED_ASCII_RE = re.compile("|".join(re.escape(k) for k in _BLOCKED_SUBSTRINGS if k.isascii()))
+_MIN_BLOCKED_LEN = min(map(len, _BLOCKED_SUBSTRINGS))
+
+
 def _contains_blocked_keywords(text: str) -> bool:
     """Check if text contains blocked control keywords."""
-    if not text:
+    if not text or len(text) < _MIN_BLOCKED_LEN:
         return False
-    
-    text_lower = text.lower()
-    
-    # 키워드 확인
-    for keyword in BLOCKED_KEYWORDS:
-        if keyword.lower() in text_lower:
-            return True
-    
-    # 정규식 패턴으로 더 정확한 검사 (예: "생성해줘", "수정해줘" 등)
-    patterns = [
-        r"생성\S*",
-        r"만들\S*",
-        r"추가\S*",
-        r"수정\S*",
-        r"변경\S*",
-        r"업데이트\S*",
-        r"삭제\S*",
-        r"지우\S*",
-        r"제거\S*",
-        r"create\S*",
-        r"add\S*",
-        r"make\S*",
-        r"new\S*",
-        r"modify\S*",
-        r"update\S*",
-        r"change\S*",
-        r"edit\S*",
-        r"delete\S*",
-        r"remove\S*",
-        r"drop\S*",
-    ]
-    
-    for pattern in patterns:
-        if re.search(pattern, text_lower):
-            return True
-    
-    return False
+
+    pattern = _BLOCKED_ASCII_RE if text.isascii() else _BLOCKED_RE
+    return pattern.search(text.lower()) is not None
 
 
 def register(app: App, services):
@@ -85,7 +73,7 @@ def register(app: App, services):
         # Check user permission
         settings = services.settings
         # User must be in ALLOWED_USERS or STREAMLINK_ONLY_USERS
-        all_allowed_users = set(settings.allowed_users_list) | set(settings.streamlink_only_users_list)
+        all_allowed_users = settings.all_allowed_users_set
         if all_allowed_users and user_id not in all_allowed_users:
             respond("접근 권한이 없습니다.")
             return
@@ -105,10 +93,45 @@ def register(app: App, services):
             return
 
         if sub_cmd in ["list", "ls", "dashboard", ""]:
+            from app.slack.ui.dashboard import DashboardUI
+
             # Check if user is StreamLink-only user
             is_streamlink_only = settings.is_streamlink_only_user(user_id)
 
             try:
+                # Parse initial keyword
+                initial_keyword = ""
+                if len(cmd_parts) > 1:
+                    initial_keyword = " ".join(cmd_parts[1:])
+
+                def build_modal(all_resources):
+                    if is_streamlink_only:
+                        # StreamLink-only dashboard - use same hierarchy as full dashboard
+                        from app.services.linkage import ResourceHierarchyBuilder
+                        hierarchy = ResourceHierarchyBuilder.build_hierarchy(all_resources)
+                        logger.info(f"/tencent: Built hierarchy with {len(hierarchy)} groups")
+
+                        return DashboardUI.create_streamlink_only_modal(
+                            hierarchy=hierarchy,
+                            keyword=initial_keyword,
+                            channel_id=channel_id,
+                        )
+                    # Full dashboard
+                    logger.info(f"/tencent: Got {len(all_resources)} resources, building modal...")
+                    return DashboardUI.create_dashboard_modal(
+                        channels=all_resources,
+                        keyword=initial_keyword,
+                        channel_id=channel_id,
+                    )
+
+                # Warm cache: open the dashboard directly, without a loading
+                # modal round trip or a background task
+                cached_resources = services.tencent_client.list_all_resources(cached_only=True)
+                if cached_resources is not None:
+                    logger.info(f"/tencent: Opening dashboard from cache (streamlink_only={is_streamlink_only})")
+                    client.views_open(trigger_id=trigger_id, view=build_modal(cached_resources))
+                    return
+
                 # Show loading modal
                 logger.info(f"/tencent: Opening loading modal... (streamlink_only={is_streamlink_only})")
                 if is_streamlink_only:
@@ -119,36 +142,11 @@ def register(app: App, services):
                 view_id = resp["view"]["id"]
                 logger.info(f"/tencent: Loading modal opened, view_id={view_id}")
 
-                # Parse initial keyword
-                initial_keyword = ""
-                if len(cmd_parts) > 1:
-                    initial_keyword = " ".join(cmd_parts[1:])
-
                 # Load resources in background
                 def async_load():
                     try:
                         logger.info(f"/tencent: Fetching resources...")
-                        all_resources = services.tencent_client.list_all_resources()
-
-                        if is_streamlink_only:
-                            # StreamLink-only dashboard - use same hierarchy as full dashboard
-                            from app.services.linkage import ResourceHierarchyBuilder
-                            hierarchy = ResourceHierarchyBuilder.build_hierarchy(all_resources)
-                            logger.info(f"/tencent: Built hierarchy with {len(hierarchy)} groups")
-
-                            modal_view = DashboardUI.create_streamlink_only_modal(
-                                hierarchy=hierarchy,
-                                keyword=initial_keyword,
-                                channel_id=channel_id,
-                            )
-                        else:
-                            # Full dashboard
-                            logger.info(f"/tencent: Got {len(all_resources)} resources, building modal...")
-                            modal_view = DashboardUI.create_dashboard_modal(
-                                channels=all_resources,
-                                keyword=initial_keyword,
-                                channel_id=channel_id,
-                            )
+                        modal_view = build_modal(services.tencent_client.list_all_resources())
 
                         logger.info(f"/tencent: Updating modal view...")
                         client.views_update(view_id=view_id, view=modal_view)
@@ -176,13 +174,15 @@ def register(app: App, services):
                             },
                         )
 
-                threading.Thread(target=async_load, daemon=True).start()
+                services.background_pool.submit(async_load)
 
             except Exception as e:
                 logger.error(f"Error opening loading modal: {e}")
                 respond(f"대시보드 로드 중 오류 발생: {str(e)}")
 
         elif sub_cmd in ["schedule", "일정", "스케줄"]:
+            from app.slack.ui.schedule import ScheduleUI
+
             try:
                 # Get upcoming schedules
                 schedules = services.schedule_manager.get_all_upcoming_schedules()
@@ -260,7 +260,7 @@ def register(app: App, services):
                         text=f":x: Flow 통계 조회 중 오류 발생: {str(e)}"
                     )
 
-            threading.Thread(target=async_fetch_stats, daemon=True).start()
+            services.background_pool.submit(async_fetch_stats)
 
         elif sub_cmd in ["trace", "chain", "추적"]:
             # /tencent trace <channel_name> [--refresh]
@@ -300,7 +300,7 @@ def register(app: App, services):
                         text=f":x: 소스 체인 추적 중 오류 발생: {str(e)}"
                     )
 
-            threading.Thread(target=async_trace, daemon=True).start()
+            services.background_pool.submit(async_trace)
 
         elif sub_cmd == "help":
             respond(_get_help_text())
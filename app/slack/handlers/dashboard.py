@@ -270,7 +270,7 @@ def register(app: App, services):
     # ========== StreamLink Only Dashboard Handlers ==========
 
     def _build_failover_map(services, hierarchy: list) -> dict:
-        """Build a map of channel_id to failover status (parallel fetching).
+        """Build a map of channel_id to failover status (batched fetching).
 
         Args:
             services: Services container
@@ -279,8 +279,6 @@ def register(app: App, services):
         Returns:
             {channel_id: {"active_input": str, "failover_info": dict}}
         """
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-
         # Collect channel IDs to fetch
         channel_ids = []
         for group in hierarchy:
@@ -294,25 +292,20 @@ def register(app: App, services):
 
         failover_map = {}
 
-        def fetch_status(channel_id):
-            try:
-                input_status = services.tencent_client.get_channel_input_status(channel_id)
-                if input_status:
-                    return channel_id, {
-                        "active_input": input_status.get("active_input"),
-                        "failover_info": input_status.get("log_based_detection", {}),
-                    }
-            except Exception as e:
-                logger.debug(f"Could not get failover status for {channel_id}: {e}")
-            return channel_id, None
+        # Batch fetch shares the flow/channel listings across all channels; the
+        # traffic lights only need the quick check once a log event decides it
+        try:
+            statuses = services.tencent_client.get_channel_input_status_batch(channel_ids, min_level="quick")
+        except Exception as e:
+            logger.debug(f"Could not get failover status for {len(channel_ids)} channels: {e}")
+            return failover_map
 
-        # Parallel fetch with max 10 workers
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            futures = {executor.submit(fetch_status, cid): cid for cid in channel_ids}
-            for future in as_completed(futures):
-                channel_id, result = future.result()
-                if result:
-                    failover_map[channel_id] = result
+        for channel_id, input_status in statuses.items():
+            if input_status:
+                failover_map[channel_id] = {
+                    "active_input": input_status.get("active_input"),
+                    "failover_info": input_status.get("log_based_detection", {}),
+                }
 
         return failover_map
 
@@ -781,7 +774,9 @@ def register(app: App, services):
                 return
 
             # Get current active input status
-            input_status = services.tencent_client.get_channel_input_status(channel_id)
+            # Only active_input is shown; skip the extra verification when the
+            # channel logs already settle it
+            input_status = services.tencent_client.get_channel_input_status(channel_id, min_level="quick")
             active_input = "main"  # default
             if input_status:
                 active_input = input_status.get("active_input", "main") or "main"
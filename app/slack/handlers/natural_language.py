@@ -223,7 +223,7 @@ def register(app: App, services):
             
             # Check user permission
             settings = services.settings
-            if settings.allowed_users_list and user_id not in settings.allowed_users_list:
+            if settings.allowed_users_set and user_id not in settings.allowed_users_set:
                 say("접근 권한이 없습니다.")
                 return
             
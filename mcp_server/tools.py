@@ -693,6 +693,11 @@ def register_tools(server: Server, get_tencent_client, get_schedule_manager):
                             "items": {"type": "string"},
                             "description": "Filter by event types (e.g., ['PipelineFailover', 'No Input Data'])",
                         },
+                        "css_stream_names": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "CSS streams to include ('app/stream'); skips CSS stream discovery",
+                        },
                     },
                     "required": ["channel_id"],
                 },
@@ -1434,6 +1439,7 @@ async def _handle_get_integrated_logs(ctx: ToolContext, arguments: Dict[str, Any
     hours = arguments.get("hours", 24)
     services = arguments.get("services")
     event_types = arguments.get("event_types")
+    css_stream_names = arguments.get("css_stream_names")
 
     result = await ctx.call(
         ctx.client.get_integrated_logs,
@@ -1441,6 +1447,7 @@ async def _handle_get_integrated_logs(ctx: ToolContext, arguments: Dict[str, Any
         hours=hours,
         services=services,
         event_types=event_types,
+        css_stream_names=css_stream_names,
     )
 
     return {
@@ -0,0 +1,43 @@
+"""Tests for app.services.linkage module."""
+import pytest
+from unittest.mock import Mock, patch
+
+from app.services.linkage import LinkageMatcher
+
+
+@pytest.fixture
+def mock_settings():
+    """Create mock settings for stream key matching."""
+    settings = Mock()
+    settings.MIN_STREAM_KEY_LENGTH = 4
+    return settings
+
+
+class TestFlowIndex:
+    """Tests for LinkageMatcher.build_index and find_linked_flows_indexed."""
+
+    def test_indexed_lookup_matches_linear_scan(self, mock_settings):
+        """Test the index links the same flows, in the same order, as find_linked_flows."""
+        flows = [
+            {"id": "f1", "output_urls": ["rtmp://host-a/live/key-one"]},
+            {"id": "f2", "output_urls": ["srt://host-b:9000?streamid=key-one"]},
+            {"id": "f3", "output_urls": ["rtmp://HOST-C//live/abc/"]},
+            {"id": "f4", "output_urls": ["rtmp://host-d/live/xyz"]},
+            {"id": "f5", "output_urls": ["", "rtmp://host-e/live/other-key"]},
+        ]
+        channels = [
+            {"id": "ch-1", "input_endpoints": ["rtmp://elsewhere/app/key-one"]},
+            {"id": "ch-2", "input_endpoints": ["rtmp://host-c/live/abc", "rtmp://host-x/live/xyz"]},
+            {"id": "ch-3", "input_endpoints": [""]},
+        ]
+
+        with patch("app.services.linkage.get_settings", return_value=mock_settings):
+            index = LinkageMatcher.build_index(flows)
+            for channel in channels:
+                for exclude in (set(), {"f2"}):
+                    assert LinkageMatcher.find_linked_flows_indexed(channel, index, exclude) == \
+                        LinkageMatcher.find_linked_flows(channel, flows, exclude)
+
+            assert [f["id"] for f in LinkageMatcher.find_linked_flows_indexed(channels[0], index)] == ["f1", "f2"]
+            # "xyz" is shorter than MIN_STREAM_KEY_LENGTH, so only the exact URL links
+            assert [f["id"] for f in LinkageMatcher.find_linked_flows_indexed(channels[1], index)] == ["f3"]
@@ -0,0 +1,1320 @@
+"""Tests for app.services.tencent_client module."""
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+from unittest.mock import Mock, patch
+from tencentcloud.common.exception.tencent_cloud_sdk_exception import TencentCloudSDKException
+
+from app.services.tencent_client import (
+    FLOW_DETAIL_CONCURRENCY,
+    INPUT_STATE_QUERY_TIMEOUT,
+    AsyncTencentClient,
+    BoundedCache,
+    RateLimiter,
+    ShardedCache,
+    TencentCloudClient,
+    _iso_utc_hours_ago,
+    _model_fields,
+    _parse_css_stream_name,
+    _url_match_forms,
+)
+
+
+@pytest.fixture
+def mock_settings():
+    """Create mock settings for the Tencent client."""
+    settings = Mock()
+    settings.TENCENT_SECRET_ID = "test_secret_id"
+    settings.TENCENT_SECRET_KEY = "test_secret_key"
+    settings.TENCENT_REGION = "ap-seoul"
+    settings.CACHE_TTL_SECONDS = 120
+    settings.API_REQUEST_TIMEOUT = 20
+    settings.THREAD_POOL_WORKERS = 4
+    return settings
+
+
+@pytest.fixture
+def client(mock_settings):
+    """Create TencentCloudClient with mock settings."""
+    with patch("app.services.tencent_client.get_settings", return_value=mock_settings):
+        yield TencentCloudClient()
+
+
+class TestSdkClients:
+    """Tests for the cached SDK clients."""
+
+    def test_clients_reused_with_worker_sized_pool(self, mock_settings):
+        """Test each SDK client is built once and its pool covers every worker."""
+        mock_settings.THREAD_POOL_WORKERS = 64
+        with patch("app.services.tencent_client.get_settings", return_value=mock_settings):
+            client = TencentCloudClient()
+
+        mdl = client._get_mdl_client()
+
+        assert client._get_mdl_client() is mdl
+        adapter = mdl.request.conn._session.get_adapter("https://mdl.tencentcloudapi.com")
+        assert adapter._pool_maxsize == 64
+        assert adapter.max_retries.total == 2
+        # POST requests: only connection errors are retried, never HTTP statuses
+        assert not adapter.max_retries.is_retry("POST", 429)
+        assert adapter.max_retries.read == adapter.max_retries.status == 0
+
+    def test_client_profiles_built_once_per_endpoint(self, client):
+        """Test regional services share a profile and StreamPackage has its own."""
+        profiles = client._client_profiles
+
+        assert profiles["mdc"] is profiles["mdl"] is profiles["css"]
+        assert profiles["mdp"].httpProfile.endpoint == "mdp.intl.tencentcloudapi.com"
+        assert client._get_mdc_client().profile is profiles["mdc"]
+
+    def test_refresh_credentials_rebuilds_clients(self, client):
+        """Test rotated credentials are used by clients built afterwards."""
+        old = client._get_mdl_client()
+
+        client.refresh_credentials("new_id", "new_key")
+        new = client._get_mdl_client()
+
+        assert new is not old
+        assert new.credential.secret_id == "new_id"
+        assert old.credential.secret_id == "test_secret_id"
+
+    def test_worker_pools_shared_across_instances(self, client, mock_settings):
+        """Test per-request clients reuse the process-wide worker pools."""
+        with patch("app.services.tencent_client.get_settings", return_value=mock_settings):
+            other = TencentCloudClient()
+
+        assert other.executor is client.executor
+        assert other._stats_executor is client._stats_executor
+        assert other._mdc_rate_limiter is client._mdc_rate_limiter
+        assert other._flow_stats_rate_limiter is client._flow_stats_rate_limiter
+
+    def test_flow_detail_backs_off_when_throttled(self, client):
+        """Test RequestLimitExceeded is retried and other SDK errors are not."""
+        mdc = Mock()
+        mdc.DescribeStreamLinkFlow.side_effect = [
+            TencentCloudSDKException("RequestLimitExceeded", "too many requests"),
+            SimpleNamespace(Info=SimpleNamespace(State="RUNNING")),
+        ]
+
+        with patch.object(client, "_get_mdc_client", return_value=mdc), \
+             patch("app.services.tencent_client.FLOW_DETAIL_THROTTLE_BACKOFF", 0):
+            assert client._fetch_single_flow_detail("flow-001")["status"] == "running"
+            assert mdc.DescribeStreamLinkFlow.call_count == 2
+
+            mdc.DescribeStreamLinkFlow.side_effect = TencentCloudSDKException("ResourceNotFound", "no flow")
+            assert client._fetch_single_flow_detail("flow-002")["status"] == "unknown"
+            assert mdc.DescribeStreamLinkFlow.call_count == 3
+
+
+class TestModelFields:
+    """Tests for _model_fields helper."""
+
+    def test_reads_sdk_model_fields(self):
+        """Test SDK models are read from their private field storage."""
+        from tencentcloud.mdl.v20200326 import models as mdl_models
+
+        info = mdl_models.InputStreamInfo()
+        info.Status = 1
+        info.InputAddress = "rtmp://host"
+
+        fields = _model_fields(info, {"Status": 0, "InputAddress": "", "AppName": ""})
+
+        assert fields == {"Status": 1, "InputAddress": "rtmp://host", "AppName": ""}
+
+    def test_falls_back_to_getattr(self):
+        """Test plain objects and class attributes are still supported."""
+        class Info:
+            Status = 1
+
+        info = Info()
+        info.AppName = "live"
+
+        fields = _model_fields(info, {"Status": 0, "AppName": "", "StreamName": ""})
+
+        assert fields == {"Status": 1, "AppName": "live", "StreamName": ""}
+
+
+class TestUrlHelpers:
+    """Tests for the memoized URL/stream name helpers."""
+
+    def test_css_stream_name_parse_is_cached(self):
+        """Test repeated stream names are served from the parse cache."""
+        _parse_css_stream_name.cache_clear()
+
+        assert _parse_css_stream_name("live/stream-1") == ("live", "stream-1")
+        assert _parse_css_stream_name("live/stream-1") == ("live", "stream-1")
+        assert _parse_css_stream_name("stream-2") == ("", "stream-2")
+
+        info = _parse_css_stream_name.cache_info()
+        assert (info.hits, info.misses) == (1, 2)
+
+    def test_url_match_forms(self):
+        """Test stream key, normalized URL and source region are derived from the URL."""
+        assert _url_match_forms("rtmp://ap-seoul-2.Example.com/live/Key/") == (
+            "", "rtmp://ap-seoul-2.example.com/live/key", "backup",
+        )
+        assert _url_match_forms("rtmp://host/live/Key")[::2] == ("Key", None)
+
+
+class TestBoundedCache:
+    """Tests for BoundedCache."""
+
+    def test_evicts_least_recently_used(self):
+        """Test the oldest untouched entry is evicted past maxsize."""
+        cache = BoundedCache(maxsize=2)
+        cache["a"] = 1
+        cache["b"] = 2
+        assert cache.get("a") == 1
+        cache["c"] = 3
+
+        assert list(cache) == ["a", "c"]
+        assert cache.get("b") is None
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter."""
+
+    def test_blocks_only_once_burst_is_spent(self):
+        """Test a burst of ``rate`` passes immediately and the next call waits."""
+        limiter = RateLimiter(rate=5, period=0.1)
+        start = time.monotonic()
+        for _ in range(5):
+            limiter.acquire()
+        burst = time.monotonic() - start
+        limiter.acquire()
+
+        assert burst < 0.01
+        assert time.monotonic() - start >= 0.015
+
+
+class TestShardedCache:
+    """Tests for ShardedCache."""
+
+    def test_behaves_like_a_dict(self):
+        """Test single-key operations and whole-cache views across shards."""
+        cache = ShardedCache(maxsize=64, shards=4)
+        for i in range(10):
+            cache[f"key-{i}"] = i
+
+        assert cache.get("key-3") == 3
+        assert cache.pop("key-3") == 3
+        assert "key-3" not in cache
+        assert cache.pop("missing", None) is None
+        assert len(cache) == 9
+        assert sorted(cache) == sorted(f"key-{i}" for i in range(10) if i != 3)
+
+        cache.clear()
+        assert cache == {}
+
+
+class TestResourceDetailsCache:
+    """Tests for get_resource_details caching."""
+
+    def test_cached_until_invalidated(self, client):
+        """Test repeated lookups hit the cache and start/stop invalidates it."""
+        details = {"id": "ch-001", "status": "idle"}
+
+        with patch.object(client, "_fetch_resource_details", return_value=details) as mock_fetch, \
+             patch.object(client, "_get_mdl_client"):
+            assert client.get_resource_details("ch-001", "StreamLive") is details
+            assert client.get_resource_details("ch-001", "MediaLive") is details
+            assert mock_fetch.call_count == 1
+
+            client.start_mdl_channel("ch-001")
+            client.get_resource_details("ch-001", "StreamLive")
+            assert mock_fetch.call_count == 2
+
+    def test_missing_resource_not_cached(self, client):
+        """Test failed lookups are retried."""
+        with patch.object(client, "_fetch_resource_details", return_value=None) as mock_fetch:
+            client.get_resource_details("ch-404", "StreamLive")
+            client.get_resource_details("ch-404", "StreamLive")
+        assert mock_fetch.call_count == 2
+
+
+class TestListAllResources:
+    """Tests for list_all_resources caching."""
+
+    def test_concurrent_cold_calls_share_one_fetch(self, client):
+        """Test callers arriving during a cold-cache fetch wait for it instead of refetching."""
+        started = threading.Event()
+        release = threading.Event()
+        resources = [{"id": "ch-001"}]
+
+        def fetch():
+            started.set()
+            release.wait(2)
+            return resources
+
+        with patch.object(client, "_fetch_all_resources_sync", side_effect=fetch) as mock_fetch, \
+             ThreadPoolExecutor(max_workers=3) as pool:
+            first = pool.submit(client.list_all_resources)
+            assert started.wait(2)
+            others = [pool.submit(client.list_all_resources) for _ in range(2)]
+            time.sleep(0.05)
+            release.set()
+            results = [f.result(timeout=2) for f in [first, *others]]
+
+            assert client.list_all_resources() is resources
+
+        assert all(r is resources for r in results)
+        mock_fetch.assert_called_once()
+
+    def test_cached_only_never_fetches(self, client):
+        """Test cached_only returns None on a cold cache and the cached list once warm."""
+        resources = [{"id": "ch-001"}]
+
+        with patch.object(client, "_fetch_all_resources_sync", return_value=resources) as mock_fetch:
+            assert client.list_all_resources(cached_only=True) is None
+            mock_fetch.assert_not_called()
+
+            client.list_all_resources()
+            assert client.list_all_resources(cached_only=True) is resources
+
+        mock_fetch.assert_called_once()
+
+    def test_fetch_runs_fan_out_on_leaf_pool(self, client):
+        """Test a full fetch never queues work on the general pool it may be running on."""
+        detail_threads = []
+        summaries = [SimpleNamespace(FlowId="flow-001", FlowName="Flow", State="RUNNING")]
+
+        def fetch_detail(flow_id):
+            detail_threads.append(threading.current_thread().name)
+            return {"id": flow_id}
+
+        with patch.object(client, "executor") as general_pool, \
+             patch.object(client, "list_mdl_channels", return_value=[{"id": "ch-001"}]), \
+             patch.object(client, "_list_streamlink_flow_summaries", return_value=summaries), \
+             patch.object(client, "_fetch_single_flow_detail", side_effect=fetch_detail):
+            resources = client._fetch_all_resources_sync()
+
+        general_pool.submit.assert_not_called()
+        general_pool.map.assert_not_called()
+        assert [r["id"] for r in resources] == ["ch-001", "flow-001"]
+        assert detail_threads and all(name.startswith("tc-leaf") for name in detail_threads)
+
+
+class TestSearchResources:
+    """Tests for search_resources."""
+
+    def test_keywords_match_case_insensitively(self, client):
+        """Test single and multiple keywords match names regardless of case."""
+        resources = [{"name": "KBS News"}, {"name": "mbc-sports"}, {"name": "Other"}, {"id": "no-name"}]
+
+        with patch.object(client, "list_all_resources", return_value=resources):
+            assert client.search_resources(["news"]) == [resources[0]]
+            assert client.search_resources(["NEWS", "Sports", "news"]) == resources[:2]
+            assert client.search_resources([]) is resources
+
+    def test_redundant_keywords_pruned(self, client):
+        """Test keywords containing a shorter keyword are dropped before matching."""
+        resources = [{"name": "KBS News"}, {"name": "News Desk"}, {"name": "Other"}]
+
+        with patch.object(client, "list_all_resources", return_value=resources):
+            assert client.search_resources(["kbs news", "News", "news desk"]) == resources[:2]
+            assert client.search_resources(["KBS", "kbs news", "other"]) == [resources[0], resources[2]]
+
+
+class TestControlResource:
+    """Tests for control_resource dispatch."""
+
+    def test_restart_stops_then_starts_via_alias(self, client):
+        """Test restart on a legacy service alias stops before starting."""
+        calls = []
+        ok = {"success": True, "message": "ok"}
+
+        with patch.object(client, "stop_streamlink_input", side_effect=lambda rid: calls.append(("stop", rid)) or ok), \
+             patch.object(client, "start_streamlink_input", side_effect=lambda rid: calls.append(("start", rid)) or ok):
+            assert client.control_resource("flow-001", "MediaConnect", "restart") is ok
+
+        assert calls == [("stop", "flow-001"), ("start", "flow-001")]
+
+    def test_restart_returns_stop_failure(self, client):
+        """Test a failed stop skips the start."""
+        failed = {"success": False, "message": "boom"}
+
+        with patch.object(client, "stop_mdl_channel", return_value=failed), \
+             patch.object(client, "start_mdl_channel") as mock_start:
+            assert client.control_resource("ch-001", "StreamLive", "restart") is failed
+        mock_start.assert_not_called()
+
+
+class TestStreamLiveChannelLogs:
+    """Tests for get_streamlive_channel_logs."""
+
+    def test_collects_and_filters_pipeline_logs(self, client):
+        """Test logs from both pipelines are filtered by type and sorted newest first."""
+        from tencentcloud.mdl.v20200326 import models as mdl_models
+
+        def log(log_type, log_time):
+            info = mdl_models.LogInfo()
+            info.Type = log_type
+            info.Time = log_time
+            return info
+
+        infos = mdl_models.PipelineLogInfo()
+        infos.Pipeline0 = [log("PipelineFailover", "2024-01-01T00:00:01Z"), log("StreamStart", "2024-01-01T00:00:02Z")]
+        infos.Pipeline1 = [log("PipelineRecover", "2024-01-01T00:00:03Z")]
+        mdl = Mock()
+        mdl.DescribeStreamLiveChannelLogs.return_value = SimpleNamespace(Infos=infos)
+
+        with patch.object(client, "_get_mdl_client", return_value=mdl):
+            logs = client.get_streamlive_channel_logs(
+                "ch-001", event_types=["PipelineFailover", "PipelineRecover"]
+            )
+
+        assert [(entry["event_type"], entry["pipeline"]) for entry in logs] == [
+            ("PipelineRecover", "Pipeline B (Backup)"),
+            ("PipelineFailover", "Pipeline A (Main)"),
+        ]
+
+
+class TestActivePipelineFromLogs:
+    """Tests for _get_active_pipeline_from_logs."""
+
+    def test_rescans_only_since_last_cursor(self, client):
+        """Test repeated scans fetch the delta and keep earlier failover events."""
+        recent = _iso_utc_hours_ago(1)
+        first = SimpleNamespace(Infos=SimpleNamespace(
+            Pipeline0=[SimpleNamespace(Type="PipelineFailover", Time=recent)], Pipeline1=None,
+        ))
+        empty = SimpleNamespace(Infos=None)
+        mdl = Mock()
+        mdl.DescribeStreamLiveChannelLogs.side_effect = [first, empty]
+
+        with patch.object(client, "_get_mdl_client", return_value=mdl):
+            client._get_active_pipeline_from_logs("ch-001")
+            result = client._get_active_pipeline_from_logs("ch-001")
+
+        first_req, second_req = (c.args[0] for c in mdl.DescribeStreamLiveChannelLogs.call_args_list)
+        assert second_req.StartTime > first_req.StartTime
+        assert result["active_pipeline"] == "backup"
+        assert result["failover_count"] == 1
+
+    def test_empty_rescan_keeps_channel_logged(self, client):
+        """Test a rescan with no new logs reports no failover events rather than no logs."""
+        first = SimpleNamespace(Infos=SimpleNamespace(
+            Pipeline0=[SimpleNamespace(Type="StreamStart", Time=_iso_utc_hours_ago(1))], Pipeline1=None,
+        ))
+        mdl = Mock()
+        mdl.DescribeStreamLiveChannelLogs.side_effect = [first, SimpleNamespace(Infos=None)]
+
+        with patch.object(client, "_get_mdl_client", return_value=mdl):
+            initial = client._get_active_pipeline_from_logs("ch-001")
+            rescan = client._get_active_pipeline_from_logs("ch-001")
+
+        assert initial["message"] == rescan["message"] == "Failover 이벤트 없음 - main으로 서비스 중"
+
+
+class TestStateCache:
+    """Tests for the short-lived state cache on describe calls."""
+
+    def test_flow_logs_share_one_describe_call(self, client):
+        """Test repeated state lookups within the TTL reuse the SDK result."""
+        mdc = Mock()
+        mdc.DescribeStreamLinkFlow.return_value = SimpleNamespace(Info=SimpleNamespace(State="RUNNING"))
+
+        with patch.object(client, "_get_mdc_client", return_value=mdc):
+            first = client.get_streamlink_flow_logs("flow-001", hours=24)
+            second = client.get_streamlink_flow_logs("flow-001", hours=24)
+            client.get_streamlink_flow_logs("flow-002", hours=24)
+
+        assert first == second
+        assert mdc.DescribeStreamLinkFlow.call_count == 2
+
+    def test_streampackage_input_status_cached_until_invalidated(self, client):
+        """Test StreamPackage input status shares the decorator cache and its invalidation."""
+        sp_client = Mock()
+        sp_client.DescribeStreamPackageChannel.return_value = SimpleNamespace(Info=SimpleNamespace(
+            Points=SimpleNamespace(Inputs=[SimpleNamespace(Url="rtmp://sp/main")]), InputSettings=[],
+        ))
+        sp_models = SimpleNamespace(DescribeStreamPackageChannelRequest=SimpleNamespace)
+
+        with patch.object(client, "_get_mdp_client", return_value=sp_client), \
+             patch("app.services.tencent_client.STREAMPACKAGE_AVAILABLE", True), \
+             patch("app.services.tencent_client.mdp_models", sp_models, create=True):
+            first = client._get_streampackage_input_status("sp-1")
+            assert client._get_streampackage_input_status("sp-1") is first
+            assert sp_client.DescribeStreamPackageChannel.call_count == 1
+
+            client._get_streampackage_input_status.invalidate(client, "sp-1")
+            client._get_streampackage_input_status("sp-1")
+
+        assert first["active_input"] == "main"
+        assert sp_client.DescribeStreamPackageChannel.call_count == 2
+
+
+class TestIntegratedLogs:
+    """Tests for get_integrated_logs."""
+
+    def test_parent_index_is_cached(self, client):
+        """Test the linked-flow index is built once and reused."""
+        resources = [
+            {"id": "ch-001", "service": "StreamLive", "input_endpoints": []},
+            {"id": "flow-1", "service": "StreamLink", "output_urls": []},
+        ]
+        with patch.object(client, "list_all_resources", return_value=resources) as mock_list, \
+             patch("app.services.tencent_client.ResourceHierarchyBuilder.build_hierarchy", return_value=[
+                 {"parent": resources[0], "children": [resources[1]]},
+             ]):
+            assert client._get_linked_flow_ids("ch-001") == ["flow-1"]
+            assert client._get_linked_flow_ids("ch-404") == []
+
+        mock_list.assert_called_once()
+
+    def test_combines_linked_service_logs(self, client):
+        """Test logs from every linked service are gathered and sorted."""
+        live_logs = [
+            {"service": "StreamLive", "event_type": "PipelineFailover", "timestamp": "2024-01-01T00:00:03Z"},
+        ]
+        package_logs = [{"service": "StreamPackage", "event_type": "Info", "timestamp": "2024-01-01T00:00:02Z"}]
+
+        def flow_logs(flow_id, **kw):
+            return [{"service": "StreamLink", "event_type": flow_id, "timestamp": "2024-01-01T00:00:01Z"}]
+
+        with patch.object(client, "get_streamlive_channel_logs", return_value=live_logs), \
+             patch.object(client, "_get_linked_flow_ids", return_value=["flow-1", "flow-2"]), \
+             patch.object(client, "get_streamlink_flow_logs", side_effect=flow_logs), \
+             patch.object(client, "_get_linked_streampackage", return_value={"streampackage_id": "sp-1"}), \
+             patch.object(client, "get_streampackage_channel_logs", return_value=package_logs), \
+             patch.object(client, "list_css_streams", return_value=[]):
+            result = client.get_integrated_logs("ch-001")
+
+        assert result["total_logs"] == 4
+        assert [log["event_type"] for log in result["streamlink_logs"]] == ["flow-1", "flow-2"]
+        assert result["logs"][0]["service"] == "StreamLive"
+        assert result["service_counts"] == {"StreamLive": 1, "StreamLink": 2, "StreamPackage": 1}
+
+    def test_iter_integrated_logs_merges_lazily(self, client):
+        """Test the streaming variant yields filtered records newest first."""
+        live_logs = [
+            {"service": "StreamLive", "event_type": "Alert", "timestamp": "2024-01-01T00:00:03Z"},
+            {"service": "StreamLive", "event_type": "Info", "timestamp": "2024-01-01T00:00:00Z"},
+        ]
+        flow_logs = [{"service": "StreamLink", "event_type": "Alert", "timestamp": "2024-01-01T00:00:01Z"}]
+
+        with patch.object(client, "get_streamlive_channel_logs", return_value=live_logs), \
+             patch.object(client, "_get_linked_flow_ids", return_value=["flow-1"]), \
+             patch.object(client, "get_streamlink_flow_logs", return_value=flow_logs), \
+             patch.object(client, "_get_linked_streampackage", return_value=None):
+            logs = list(client.iter_integrated_logs("ch-001", event_types=["Alert"]))
+            first = asyncio.run(anext(AsyncTencentClient(client).iter_integrated_logs("ch-001")))
+
+        assert [log["service"] for log in logs] == ["StreamLive", "StreamLink"]
+        assert first["timestamp"] == "2024-01-01T00:00:03Z"
+
+    def test_concurrent_identical_calls_share_one_fetch(self, client):
+        """Test identical in-flight requests are coalesced."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def fetch(*args):
+            started.set()
+            release.wait(5)
+            return {"channel_id": "ch-001", "logs": []}
+
+        with patch.object(client, "_fetch_integrated_logs", side_effect=fetch) as mock_fetch:
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                first = pool.submit(client.get_integrated_logs, "ch-001")
+                started.wait(5)
+                second = pool.submit(client.get_integrated_logs, "ch-001")
+                time.sleep(0.05)
+                release.set()
+                assert first.result(5) is second.result(5)
+
+        mock_fetch.assert_called_once()
+
+    def test_css_push_info_listed_once_per_domain(self, client):
+        """Test CSS push info is fetched per domain and split by stream."""
+        push = SimpleNamespace(AppName="live", StreamName="a", BeginPushTime="2024-01-01T00:00:00Z")
+        css = Mock()
+        css.DescribeLiveStreamPushInfoList.return_value = SimpleNamespace(DataInfoList=[push])
+        streams = [
+            {"full_name": "live/a", "domain": "push.example.com"},
+            {"full_name": "live/b", "domain": "push.example.com"},
+        ]
+        package_logs = [{"service": "StreamPackage", "event_type": "Info", "timestamp": "2024-01-01T00:00:02Z"}]
+
+        with patch.object(client, "get_streamlive_channel_logs", return_value=[]), \
+             patch.object(client, "_get_linked_flow_ids", return_value=[]), \
+             patch.object(client, "_get_linked_streampackage", return_value={"streampackage_id": "sp-1"}), \
+             patch.object(client, "get_streampackage_channel_logs", return_value=package_logs), \
+             patch.object(client, "list_css_streams", return_value=streams), \
+             patch.object(client, "_get_css_client", return_value=css), \
+             patch.object(client, "_get_css_stream_status", return_value=None):
+            result = client.get_integrated_logs("ch-001")
+
+        css.DescribeLiveStreamPushInfoList.assert_called_once()
+        assert [(log["resource_id"], log["event_type"]) for log in result["css_logs"]] == [
+            ("live/a", "PushInfo"),
+        ]
+
+    def test_named_css_streams_skip_enumeration(self, client):
+        """Test explicit CSS stream names are used without listing streams."""
+        with patch.object(client, "get_streamlive_channel_logs", return_value=[]), \
+             patch.object(client, "list_css_streams") as mock_list, \
+             patch.object(client, "_get_css_push_infos_bulk", return_value={}), \
+             patch.object(client, "_build_css_stream_logs", return_value=[
+                 {"service": "CSS", "event_type": "StreamState", "timestamp": "2024-01-01T00:00:00Z"},
+             ]) as mock_build:
+            result = client.get_integrated_logs(
+                "ch-001", services=["StreamLive", "CSS"], css_stream_names=["live/a"]
+            )
+
+        mock_list.assert_not_called()
+        mock_build.assert_called_once_with("live/a", None, [])
+        assert result["service_counts"] == {"CSS": 1}
+
+    def test_streampackage_input_status_fetched_once(self, client):
+        """Test the StreamPackage input status from the channel status is reused."""
+        sp_client = Mock()
+        sp_client.DescribeStreamPackageChannel.return_value = SimpleNamespace(Info=SimpleNamespace(State="Running"))
+        verification = {"streampackage_id": "sp-1", "active_input": "main", "input_details": []}
+        input_status = {"streampackage_verification": verification}
+        # The MDP SDK is optional, so its request model may not be importable
+        sp_models = SimpleNamespace(DescribeStreamPackageChannelRequest=SimpleNamespace)
+
+        with patch.object(client, "get_streamlive_channel_logs", return_value=[]), \
+             patch.object(client, "get_channel_input_status", return_value=input_status), \
+             patch.object(client, "_get_mdp_client", return_value=sp_client), \
+             patch("app.services.tencent_client.STREAMPACKAGE_AVAILABLE", True), \
+             patch("app.services.tencent_client.mdp_models", sp_models, create=True), \
+             patch.object(client, "_get_streampackage_input_status") as mock_sp_status:
+            result = client.get_integrated_logs("ch-001", services=["StreamPackage"])
+
+        mock_sp_status.assert_not_called()
+        assert sp_client.DescribeStreamPackageChannel.call_args.args[0].Id == "sp-1"
+        assert [log["event_type"] for log in result["streampackage_logs"]] == ["StateChange", "InputStatus"]
+
+    def test_service_filter(self, client):
+        """Test unrequested services are not queried."""
+        with patch.object(client, "get_streamlive_channel_logs", return_value=[]), \
+             patch.object(client, "_get_linked_flow_ids") as mock_flows, \
+             patch.object(client, "_get_linked_streampackage") as mock_sp:
+            result = client.get_integrated_logs("ch-001", services=["StreamLive"])
+
+        assert result["total_logs"] == 0
+        mock_flows.assert_not_called()
+        mock_sp.assert_not_called()
+
+
+class TestChannelInputStatusBatch:
+    """Tests for get_channel_input_status_batch."""
+
+    def test_shares_listings_across_channels(self, client, mock_settings):
+        """Test flows are listed and indexed once for the whole batch and channels not at all."""
+        flows = [{"id": "flow-001"}]
+        mock_settings.MIN_STREAM_KEY_LENGTH = 4
+
+        with patch.object(client, "list_streamlink_inputs", return_value=flows) as mock_flows, \
+             patch("app.services.linkage.get_settings", return_value=mock_settings), \
+             patch.object(client, "list_mdl_channels") as mock_channels, \
+             patch.object(client, "get_channel_input_status") as mock_status:
+            mock_status.side_effect = lambda cid, **kwargs: {"channel_id": cid}
+            result = client.get_channel_input_status_batch(["ch-001", "ch-002"])
+
+        assert result == {
+            "ch-001": {"channel_id": "ch-001"},
+            "ch-002": {"channel_id": "ch-002"},
+        }
+        mock_flows.assert_called_once()
+        mock_channels.assert_not_called()
+        indexes = {id(call.kwargs["flow_index"]) for call in mock_status.call_args_list}
+        assert len(indexes) == 1
+        assert mock_status.call_args.kwargs["flow_index"].flows is flows
+
+    def test_listings_shared_across_batches_until_flow_control(self, client, mock_settings):
+        """Test back-to-back batches reuse the listings until a flow is started."""
+        mock_settings.MIN_STREAM_KEY_LENGTH = 4
+        with patch.object(client, "list_streamlink_inputs", return_value=[]) as mock_flows, \
+             patch("app.services.linkage.get_settings", return_value=mock_settings), \
+             patch.object(client, "get_channel_input_status"), \
+             patch.object(client, "_get_mdc_client"):
+            client.get_channel_input_status_batch(["ch-001"])
+            client.get_channel_input_status_batch(["ch-001"])
+            assert mock_flows.call_count == 1
+
+            client.start_streamlink_input("flow-001")
+            client.get_channel_input_status_batch(["ch-001"])
+
+        assert mock_flows.call_count == 2
+
+    def test_queued_state_queries_not_timed_out(self, client):
+        """Test state queries waiting behind a batch larger than the leaf pool still count."""
+        channel_ids = [f"ch-{i:03d}" for i in range(client._sdk_call_executor._max_workers * 2 + 1)]
+        mdl = Mock()
+        mdl.DescribeStreamLiveChannel.return_value = SimpleNamespace(Info=SimpleNamespace(
+            Name="Channel", AttachedInputs=[SimpleNamespace(Id="in-main")],
+        ))
+        mdl.DescribeStreamLiveInputs.return_value = SimpleNamespace(Infos=[])
+        mdl.DescribeStreamLiveChannelInputStatistics.return_value = SimpleNamespace(Infos=[])
+
+        def query_state(req):
+            time.sleep(0.05)
+            return SimpleNamespace(Info=SimpleNamespace(InputStreamInfoList=[
+                SimpleNamespace(Status=1, InputAddress="rtmp://host", AppName="live", StreamName="s"),
+            ]))
+
+        mdl.QueryInputStreamState.side_effect = query_state
+
+        with patch.object(client, "_get_mdl_client", return_value=mdl), \
+             patch.object(client, "_get_mdl_state_client", return_value=mdl), \
+             patch.object(client, "_get_active_pipeline_from_logs", return_value=None), \
+             patch.object(client, "_streamlink_flow_index"), \
+             patch("app.services.tencent_client.INPUT_STATE_QUERY_TIMEOUT", 0.01):
+            results = client.get_channel_input_status_batch(channel_ids)
+
+        assert {status["active_input_id"] for status in results.values()} == {"in-main"}
+        assert all("QueryInputStreamState" in status["verification_sources"] for status in results.values())
+
+    def test_min_level_passed_to_each_channel(self, client):
+        """Test the batch verification level reaches every lookup and typos are rejected."""
+        with patch.object(client, "_streamlink_flow_index"), \
+             patch.object(client, "get_channel_input_status") as mock_status:
+            client.get_channel_input_status_batch(["ch-001", "ch-002"], min_level="quick")
+
+            with pytest.raises(ValueError):
+                client.get_channel_input_status_batch(["ch-001"], min_level="Quick")
+
+        assert [call.kwargs["min_level"] for call in mock_status.call_args_list] == ["quick", "quick"]
+        with pytest.raises(ValueError):
+            client.get_channel_input_status("ch-001", min_level="Quick")
+
+    def test_empty_channel_ids(self, client):
+        """Test empty input skips all API calls."""
+        with patch.object(client, "list_streamlink_inputs") as mock_flows:
+            assert client.get_channel_input_status_batch([]) == {}
+        mock_flows.assert_not_called()
+
+
+class TestChannelInputStatus:
+    """Tests for get_channel_input_status."""
+
+    def test_attached_inputs_queried_concurrently(self, client):
+        """Test input stream states are queried at once and read in attachment order."""
+        both_queried = threading.Barrier(2, timeout=2)
+        mdl = Mock()
+        mdl.DescribeStreamLiveChannel.return_value = SimpleNamespace(Info=SimpleNamespace(
+            Name="Channel",
+            AttachedInputs=[
+                SimpleNamespace(Id="in-main", FailOverSettings=SimpleNamespace(SecondaryInputId="in-backup")),
+                SimpleNamespace(Id="in-backup"),
+            ],
+        ))
+        mdl.DescribeStreamLiveInputs.return_value = SimpleNamespace(Infos=[])
+
+        def query_state(req):
+            both_queried.wait()
+            status = 1 if req.Id == "in-backup" else 0
+            return SimpleNamespace(Info=SimpleNamespace(InputStreamInfoList=[
+                SimpleNamespace(Status=status, InputAddress=f"rtmp://{req.Id}", AppName="live", StreamName="s"),
+            ]))
+
+        mdl.QueryInputStreamState.side_effect = query_state
+
+        with patch.object(client, "_get_mdl_client", return_value=mdl), \
+             patch.object(client, "_get_mdl_state_client", return_value=mdl), \
+             patch.object(client, "_get_active_pipeline_from_logs", return_value=None):
+            result = client.get_channel_input_status("ch-001", flows=[], channels_by_id={})
+
+        assert result["active_input_id"] == "in-backup"
+        assert result["active_input"] == "backup"
+
+    def test_state_queries_capped_per_request(self, client):
+        """Test QueryInputStreamState runs on a short-timeout client and a timed-out query is skipped."""
+        mdl = Mock()
+        mdl.DescribeStreamLiveChannel.return_value = SimpleNamespace(Info=SimpleNamespace(
+            Name="Channel", AttachedInputs=[SimpleNamespace(Id="in-main"), SimpleNamespace(Id="in-backup")],
+        ))
+        mdl.DescribeStreamLiveInputs.return_value = SimpleNamespace(Infos=[])
+        state = Mock()
+
+        def query_state(req):
+            if req.Id == "in-main":
+                raise TencentCloudSDKException("ClientNetworkError", "read timed out")
+            return SimpleNamespace(Info=SimpleNamespace(InputStreamInfoList=[
+                SimpleNamespace(Status=1, InputAddress=f"rtmp://{req.Id}", AppName="live", StreamName="s"),
+            ]))
+
+        state.QueryInputStreamState.side_effect = query_state
+
+        with patch.object(client, "_get_mdl_client", return_value=mdl), \
+             patch.object(client, "_get_mdl_state_client", return_value=state), \
+             patch.object(client, "_get_active_pipeline_from_logs", return_value=None):
+            result = client.get_channel_input_status("ch-001", flows=[], channels_by_id={})
+
+        assert result["active_input_id"] == "in-backup"
+        mdl.QueryInputStreamState.assert_not_called()
+        assert client._client_profiles["mdl_state"].httpProfile.reqTimeout == INPUT_STATE_QUERY_TIMEOUT
+
+    def test_scan_all_inputs_keeps_every_active_input(self, client):
+        """Test the first active input wins but scan_all_inputs records the rest."""
+        mdl = Mock()
+        mdl.DescribeStreamLiveChannel.return_value = SimpleNamespace(Info=SimpleNamespace(
+            Name="Channel", AttachedInputs=[SimpleNamespace(Id="in-main"), SimpleNamespace(Id="in-backup")],
+        ))
+        mdl.DescribeStreamLiveInputs.return_value = SimpleNamespace(Infos=[])
+        mdl.QueryInputStreamState.side_effect = lambda req: SimpleNamespace(Info=SimpleNamespace(InputStreamInfoList=[
+            SimpleNamespace(Status=1, InputAddress=f"rtmp://{req.Id}", AppName="live", StreamName="s"),
+        ]))
+
+        with patch.object(client, "_get_mdl_client", return_value=mdl), \
+             patch.object(client, "_get_mdl_state_client", return_value=mdl), \
+             patch.object(client, "_get_active_pipeline_from_logs", return_value=None):
+            first_only = client.get_channel_input_status("ch-001", flows=[], channels_by_id={})
+            full = client.get_channel_input_status("ch-001", flows=[], channels_by_id={}, scan_all_inputs=True)
+
+        assert first_only["active_input_id"] == full["active_input_id"] == "in-main"
+        assert set(first_only["input_states"]) == {"in-main"}
+        assert set(full["input_states"]) == {"in-main", "in-backup"}
+
+    def test_quick_level_skips_verification_after_log_event(self, client):
+        """Test a conclusive log event skips StreamPackage and StreamLink checks below full."""
+        mdl = Mock()
+        mdl.DescribeStreamLiveChannel.return_value = SimpleNamespace(Info=SimpleNamespace(
+            Name="Channel",
+            AttachedInputs=[SimpleNamespace(Id="in-main")],
+            OutputGroups=[SimpleNamespace(StreamPackageSettings=SimpleNamespace(Id="sp-001"))],
+        ))
+        mdl.DescribeStreamLiveInputs.return_value = SimpleNamespace(Infos=[])
+        mdl.QueryInputStreamState.return_value = SimpleNamespace(Info=None)
+        mdl.DescribeStreamLiveChannelInputStatistics.return_value = SimpleNamespace(Infos=[
+            SimpleNamespace(InputId="in-main", NetworkIn=5000, NetworkValid=True),
+        ])
+        log_result = {"active_pipeline": "backup", "last_event_type": "PipelineFailover"}
+
+        with patch.object(client, "_get_mdl_client", return_value=mdl), \
+             patch.object(client, "_get_mdl_state_client", return_value=mdl), \
+             patch.object(client, "_get_active_pipeline_from_logs", return_value=log_result), \
+             patch.object(client, "_get_streampackage_input_status", return_value=None) as mock_sp, \
+             patch.object(client, "_streamlink_flows", return_value=[]) as mock_flows:
+            quick = client.get_channel_input_status("ch-001", min_level="quick")
+            assert mock_sp.call_count == 0 and mock_flows.call_count == 0
+
+            full = client.get_channel_input_status("ch-001")
+
+        assert quick["active_input"] == full["active_input"] == "backup"
+        assert quick["verification_sources"] == ["ChannelLogs"]
+        mock_sp.assert_called_once_with("sp-001")
+        mock_flows.assert_called_once()
+
+    def test_async_lookup_runs_off_the_event_loop(self, client):
+        """Test the async client runs the sync lookup on its pool with the same arguments."""
+        loop_thread = threading.get_ident()
+        seen = {}
+
+        def lookup(channel_id, **kwargs):
+            seen.update(kwargs, thread=threading.get_ident())
+            return {"channel_id": channel_id}
+
+        async def run():
+            nonlocal loop_thread
+            loop_thread = threading.get_ident()
+            return await AsyncTencentClient(client).get_channel_input_status("ch-001", scan_all_inputs=True)
+
+        with patch.object(client, "get_channel_input_status", side_effect=lookup):
+            assert asyncio.run(run()) == {"channel_id": "ch-001"}
+
+        assert seen["scan_all_inputs"] is True
+        assert seen["thread"] != loop_thread
+
+    def test_stream_yields_log_stage_before_final(self, client):
+        """Test the log-based stage is yielded before the full lookup finishes."""
+        release = threading.Event()
+        log_result = {"active_pipeline": "backup", "last_event_type": "PipelineFailover"}
+
+        def lookup(channel_id, **kwargs):
+            release.wait(5)
+            return {"channel_id": channel_id, "active_input": "backup"}
+
+        async def collect():
+            stages = []
+            async for stage in AsyncTencentClient(client).stream_channel_input_status("ch-001"):
+                stages.append(stage)
+                release.set()
+            return stages
+
+        with patch.object(client, "_get_active_pipeline_from_logs", return_value=log_result), \
+             patch.object(client, "get_channel_input_status", side_effect=lookup):
+            stages = asyncio.run(collect())
+
+        assert stages == [
+            {"stage": "log_based", "channel_id": "ch-001", "log_based_detection": log_result},
+            {"stage": "final", "channel_id": "ch-001", "active_input": "backup"},
+        ]
+
+    def test_statistics_fallback_hedged_with_state_queries(self, client):
+        """Test input statistics are requested while slow stream state queries are pending."""
+        all_started = threading.Barrier(3, timeout=2)
+        mdl = Mock()
+        mdl.DescribeStreamLiveChannel.return_value = SimpleNamespace(Info=SimpleNamespace(
+            Name="Channel", AttachedInputs=[SimpleNamespace(Id="in-main"), SimpleNamespace(Id="in-backup")],
+        ))
+        mdl.DescribeStreamLiveInputs.return_value = SimpleNamespace(Infos=[])
+
+        def query_state(req):
+            all_started.wait()
+            return SimpleNamespace(Info=SimpleNamespace(InputStreamInfoList=[SimpleNamespace(Status=0)]))
+
+        def input_statistics(req):
+            all_started.wait()
+            return SimpleNamespace(Infos=[
+                SimpleNamespace(InputId="in-main", NetworkIn=0, NetworkValid=False),
+                SimpleNamespace(InputId="in-backup", NetworkIn=5000, NetworkValid=True),
+            ])
+
+        mdl.QueryInputStreamState.side_effect = query_state
+        mdl.DescribeStreamLiveChannelInputStatistics.side_effect = input_statistics
+
+        with patch.object(client, "_get_mdl_client", return_value=mdl), \
+             patch.object(client, "_get_mdl_state_client", return_value=mdl), \
+             patch.object(client, "_get_active_pipeline_from_logs", return_value=None):
+            result = client.get_channel_input_status("ch-001", flows=[], channels_by_id={})
+
+        assert result["active_input_id"] == "in-backup"
+
+    def test_statistics_not_requested_when_state_query_finds_input(self, client):
+        """Test a prompt active stream state skips the statistics request entirely."""
+        mdl = Mock()
+        mdl.DescribeStreamLiveChannel.return_value = SimpleNamespace(Info=SimpleNamespace(
+            Name="Channel", AttachedInputs=[SimpleNamespace(Id="in-main")],
+        ))
+        mdl.DescribeStreamLiveInputs.return_value = SimpleNamespace(Infos=[])
+        mdl.QueryInputStreamState.return_value = SimpleNamespace(Info=SimpleNamespace(
+            InputStreamInfoList=[SimpleNamespace(Status=1, InputAddress="rtmp://host/live/key")],
+        ))
+
+        with patch.object(client, "_get_mdl_client", return_value=mdl), \
+             patch.object(client, "_get_mdl_state_client", return_value=mdl), \
+             patch.object(client, "_get_active_pipeline_from_logs", return_value=None):
+            result = client.get_channel_input_status("ch-001", flows=[], channels_by_id={})
+
+        assert result["active_input_id"] == "in-main"
+        mdl.DescribeStreamLiveChannelInputStatistics.assert_not_called()
+
+    def test_running_flow_marks_matching_source_address(self, client, mock_settings):
+        """Test the StreamLink fallback picks the endpoint fed by a running flow."""
+        main_url = "rtmp://ap-seoul-1.example.com/live/channel-key"
+        backup_url = "rtmp://ap-seoul-2.example.com/live/channel-key"
+        mdl = Mock()
+        mdl.DescribeStreamLiveChannel.return_value = SimpleNamespace(Info=SimpleNamespace(
+            Name="Channel", AttachedInputs=[SimpleNamespace(Id="in-1")],
+        ))
+        mdl.DescribeStreamLiveInputs.return_value = SimpleNamespace(Infos=[SimpleNamespace(Id="in-1", Name="Input")])
+        mdl.QueryInputStreamState.return_value = SimpleNamespace(Info=None)
+        mdl.DescribeStreamLiveChannelInputStatistics.return_value = SimpleNamespace(Infos=[])
+        mock_settings.MIN_STREAM_KEY_LENGTH = 4
+        flows = [
+            {"id": "flow-main", "name": "Feed", "status": "idle", "output_urls": [main_url]},
+            {"id": "flow-backup", "name": "Feed", "status": "running", "output_urls": [backup_url + "/"]},
+        ]
+
+        with patch.object(client, "_get_mdl_client", return_value=mdl), \
+             patch.object(client, "_get_mdl_state_client", return_value=mdl), \
+             patch.object(client, "_extract_input_endpoints", return_value=[main_url, backup_url]), \
+             patch.object(client, "_get_active_pipeline_from_logs", return_value=None), \
+             patch("app.services.linkage.get_settings", return_value=mock_settings), \
+             patch.object(client, "list_mdl_channels") as mock_channels:
+            result = client.get_channel_input_status("ch-001", flows=flows)
+
+        assert result["active_input_id"] == "in-1"
+        assert result["active_source_address"] == backup_url
+        mock_channels.assert_not_called()
+
+    def test_running_flow_attributed_to_owning_input(self, client, mock_settings):
+        """Test a flow feeding the secondary input's endpoint marks that input active."""
+        endpoints = {
+            "in-main": ["rtmp://primary.example.com/live/main-key"],
+            "in-backup": ["rtmp://secondary.example.com/live/backup-key"],
+        }
+        mdl = Mock()
+        mdl.DescribeStreamLiveChannel.return_value = SimpleNamespace(Info=SimpleNamespace(
+            Name="Channel", AttachedInputs=[SimpleNamespace(Id="in-main"), SimpleNamespace(Id="in-backup")],
+        ))
+        mdl.DescribeStreamLiveInputs.return_value = SimpleNamespace(Infos=[
+            SimpleNamespace(Id="in-main", Name="Main"), SimpleNamespace(Id="in-backup", Name="Backup"),
+        ])
+        mdl.QueryInputStreamState.return_value = SimpleNamespace(Info=None)
+        mdl.DescribeStreamLiveChannelInputStatistics.return_value = SimpleNamespace(Infos=[])
+        mock_settings.MIN_STREAM_KEY_LENGTH = 4
+        flows = [{"id": "flow-b", "name": "Feed", "status": "running", "output_urls": endpoints["in-backup"]}]
+
+        with patch.object(client, "_get_mdl_client", return_value=mdl), \
+             patch.object(client, "_get_mdl_state_client", return_value=mdl), \
+             patch.object(client, "_extract_input_endpoints", side_effect=lambda inp: endpoints[inp.Id]), \
+             patch.object(client, "_get_active_pipeline_from_logs", return_value=None), \
+             patch("app.services.linkage.get_settings", return_value=mock_settings):
+            result = client.get_channel_input_status("ch-001", flows=flows)
+
+        assert result["active_input_id"] == "in-backup"
+
+
+class TestListMdlChannels:
+    """Tests for list_mdl_channels."""
+
+    def test_inputs_listed_alongside_channels(self, client):
+        """Test the input listing is in flight while channels are described."""
+        inputs_started = threading.Event()
+        mdl = Mock()
+
+        def describe_inputs(req):
+            inputs_started.set()
+            return SimpleNamespace(Infos=[SimpleNamespace(Id="in-1", Name="Main", Type="RTMP_PUSH")])
+
+        def describe_channels(req):
+            overlapped = inputs_started.wait(2)
+            return SimpleNamespace(Infos=[SimpleNamespace(
+                Id="ch-001", Name="Channel" if overlapped else "sequential", State="RUNNING",
+                AttachedInputs=[SimpleNamespace(Id="in-1", Name="")],
+            )])
+
+        mdl.DescribeStreamLiveInputs.side_effect = describe_inputs
+        mdl.DescribeStreamLiveChannels.side_effect = describe_channels
+
+        with patch.object(client, "_get_mdl_client", return_value=mdl):
+            channels = client.list_mdl_channels()
+
+        assert channels[0]["name"] == "Channel"
+        assert channels[0]["input_attachments"] == [{"id": "in-1", "name": "Main", "type": "RTMP_PUSH"}]
+
+    def test_input_endpoints_keep_attachment_order(self, client):
+        """Test endpoints are deduplicated without losing primary-first order."""
+        mdl = Mock()
+        mdl.DescribeStreamLiveChannels.return_value = SimpleNamespace(Infos=[SimpleNamespace(
+            Id="ch-001", Name="Channel", State="RUNNING",
+            AttachedInputs=[SimpleNamespace(Id="in-main", Name="m"), SimpleNamespace(Id="in-backup", Name="b")],
+        )])
+        input_map = {"in-main": ["rtmp://a/live/m", "rtmp://shared"], "in-backup": ["rtmp://shared", "rtmp://b/live/b"]}
+
+        with patch.object(client, "_get_mdl_client", return_value=mdl), \
+             patch.object(client, "_fetch_mdl_input_maps", return_value=(input_map, {})):
+            channels = client.list_mdl_channels()
+
+        assert channels[0]["input_endpoints"] == ["rtmp://a/live/m", "rtmp://shared", "rtmp://b/live/b"]
+
+    def test_concurrent_cache_misses_share_one_input_listing(self, client):
+        """Test concurrent cold-cache listings issue one DescribeStreamLiveInputs."""
+        release = threading.Event()
+        mdl = Mock()
+
+        def describe_inputs(req):
+            release.wait(5)
+            return SimpleNamespace(Infos=[SimpleNamespace(Id="in-1", Name="Main", Type="")])
+
+        mdl.DescribeStreamLiveInputs.side_effect = describe_inputs
+        mdl.DescribeStreamLiveChannels.return_value = SimpleNamespace(Infos=[])
+
+        with patch.object(client, "_get_mdl_client", return_value=mdl):
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                futures = [pool.submit(client.list_mdl_channels) for _ in range(2)]
+                time.sleep(0.05)
+                release.set()
+                for future in futures:
+                    future.result(5)
+
+        mdl.DescribeStreamLiveInputs.assert_called_once()
+
+    def test_no_channels_returns_without_waiting_for_inputs(self, client):
+        """Test an empty channel listing does not wait on the input listing."""
+        release = threading.Event()
+        mdl = Mock()
+        mdl.DescribeStreamLiveInputs.side_effect = lambda req: release.wait(5) and SimpleNamespace(Infos=[])
+        mdl.DescribeStreamLiveChannels.return_value = SimpleNamespace(Infos=[])
+
+        try:
+            with patch.object(client, "_get_mdl_client", return_value=mdl):
+                start = time.monotonic()
+                assert client.list_mdl_channels() == []
+                assert time.monotonic() - start < 1
+        finally:
+            release.set()
+
+
+class TestAsyncStreamLinkInputs:
+    """Tests for AsyncTencentClient.list_streamlink_inputs."""
+
+    def test_fetches_only_uncached_flow_details(self, client):
+        """Test cached flow details are reused and the rest fetched concurrently."""
+        summaries = [
+            SimpleNamespace(FlowId="flow-cached", FlowName="Cached", State="RUNNING", MaxBandwidth=0),
+            SimpleNamespace(FlowId="flow-new", FlowName="New", State="IDLE", MaxBandwidth=20000000),
+        ]
+        client._cache_flow_details({}, [("flow-cached", {"id": "flow-cached", "status": "running"})])
+
+        with patch.object(client, "_list_streamlink_flow_summaries", return_value=summaries), \
+             patch.object(client, "_fetch_single_flow_detail") as mock_detail:
+            mock_detail.side_effect = lambda fid: {"id": fid, "status": "idle"}
+            result = asyncio.run(AsyncTencentClient(client).list_streamlink_inputs())
+
+        mock_detail.assert_called_once_with("flow-new")
+        assert [(r["id"], r["status"]) for r in result] == [("flow-cached", "running"), ("flow-new", "idle")]
+        assert result[1]["max_bandwidth_mbps"] == 20
+        flow_details, ids_to_fetch = client._get_cached_flow_details(summaries)
+        assert ids_to_fetch == []
+        assert flow_details is client._linkage_cache["mdc_linkage_details"]["data"]
+
+    def test_overlapping_listings_keep_each_others_details(self, client):
+        """Test a listing caching from a stale snapshot keeps concurrent results."""
+        summaries = [SimpleNamespace(FlowId="flow-a"), SimpleNamespace(FlowId="flow-b")]
+        snapshot, _ = client._get_cached_flow_details(summaries)
+
+        client._cache_flow_details(snapshot, [("flow-a", {"id": "flow-a"})])
+        client._cache_flow_details(snapshot, [("flow-b", {"id": "flow-b"})])
+
+        assert client._get_cached_flow_details(summaries)[1] == []
+
+    def test_flow_detail_concurrency_is_bounded(self, client):
+        """Test no more than FLOW_DETAIL_CONCURRENCY detail calls run at once."""
+        summaries = [SimpleNamespace(FlowId=f"flow-{i}") for i in range(20)]
+        in_flight = []
+        peak = []
+        lock = threading.Lock()
+
+        def fetch(fid):
+            with lock:
+                in_flight.append(fid)
+                peak.append(len(in_flight))
+            time.sleep(0.01)
+            with lock:
+                in_flight.remove(fid)
+            return {"id": fid}
+
+        with patch.object(client, "_list_streamlink_flow_summaries", return_value=summaries), \
+             patch.object(client, "_fetch_single_flow_detail", side_effect=fetch):
+            result = asyncio.run(AsyncTencentClient(client).list_streamlink_inputs())
+
+        assert len(result) == 20
+        assert max(peak) <= FLOW_DETAIL_CONCURRENCY
+
+
+class TestAsyncFlowStatisticsBatch:
+    """Tests for AsyncTencentClient.get_flow_statistics_batch."""
+
+    def test_fetches_uncached_and_caches_results(self, client):
+        """Test only uncached flows are fetched and results are cached."""
+        client._cache_flow_stats("flow-cached", {"flow_id": "flow-cached"})
+        async_client = AsyncTencentClient(client)
+
+        with patch.object(client, "get_flow_statistics") as mock_stats:
+            mock_stats.side_effect = lambda fid: {"flow_id": fid}
+            result = asyncio.run(async_client.get_flow_statistics_batch(
+                ["flow-cached", "flow-001", "flow-002"]
+            ))
+
+        assert result == {
+            "flow-cached": {"flow_id": "flow-cached"},
+            "flow-001": {"flow_id": "flow-001"},
+            "flow-002": {"flow_id": "flow-002"},
+        }
+        assert sorted(c.args[0] for c in mock_stats.call_args_list) == ["flow-001", "flow-002"]
+        cached, to_fetch = client._get_cached_flow_stats(["flow-001", "flow-002"])
+        assert to_fetch == []
+
+    def test_failed_fetch_is_skipped(self, client):
+        """Test a failing flow does not break the batch."""
+        async_client = AsyncTencentClient(client)
+
+        def fetch(fid):
+            if fid == "flow-bad":
+                raise RuntimeError("rate limited")
+            return {"flow_id": fid}
+
+        with patch.object(client, "get_flow_statistics", side_effect=fetch):
+            result = asyncio.run(async_client.get_flow_statistics_batch(["flow-bad", "flow-001"]))
+
+        assert result == {"flow-001": {"flow_id": "flow-001"}}
+
+    def test_failed_fetch_is_negatively_cached(self, client):
+        """Test failed flows use the short negative-cache TTL."""
+        async_client = AsyncTencentClient(client)
+
+        with patch.object(client, "get_flow_statistics", side_effect=RuntimeError("boom")):
+            asyncio.run(async_client.get_flow_statistics_batch(["flow-bad"]))
+
+        cached, to_fetch = client._get_cached_flow_stats(["flow-bad"])
+        assert cached == {"flow-bad": None}
+        assert to_fetch == []
+
+        shard, _ = client._flow_stats_shard("flow-bad")
+        shard["flow-bad"]["timestamp"] -= 20
+        cached, to_fetch = client._get_cached_flow_stats(["flow-bad"])
+        assert to_fetch == ["flow-bad"]
+
+    def test_clear_cache_drops_flow_stats(self, client):
+        """Test clear_cache also empties the flow statistics shards."""
+        client._cache_flow_stats("flow-001", {"flow_id": "flow-001"})
+        client.clear_cache()
+
+        _, to_fetch = client._get_cached_flow_stats(["flow-001"])
+        assert to_fetch == ["flow-001"]
+
+    def test_invalidate_flow_stats(self, client):
+        """Test invalidation forces a refetch."""
+        client._cache_flow_stats("flow-001", {"flow_id": "flow-001"})
+        client.invalidate_flow_stats("flow-001")
+
+        _, to_fetch = client._get_cached_flow_stats(["flow-001"])
+        assert to_fetch == ["flow-001"]
+
+
+class TestStatusNormalization:
+    """Tests for status normalization helpers."""
+
+    def test_normalize_mdl_status(self, client):
+        """Test MediaLive states map to ChannelStatus values."""
+        assert client._normalize_mdl_status("RUNNING") == "running"
+        assert client._normalize_mdl_status("Idle") == "idle"
+        assert client._normalize_mdl_status("STOPPED") == "stopped"
+        assert client._normalize_mdl_status("ALERT") == "error"
+        assert client._normalize_mdl_status(None) == "unknown"
+
+    def test_normalize_streamlink_status(self, client):
+        """Test StreamLink states map to ChannelStatus values."""
+        assert client._normalize_streamlink_status("active") == "running"
+        assert client._normalize_streamlink_status("WAIT") == "idle"
+        assert client._normalize_streamlink_status("off") == "stopped"
+        assert client._normalize_streamlink_status("failed") == "error"
+        assert client._normalize_streamlink_status("") == "unknown"
+
+
+class TestFlowStatistics:
+    """Tests for get_flow_statistics."""
+
+    @staticmethod
+    def _item(item_type, bitrate, state, protocol="RTMP", srt=None):
+        return SimpleNamespace(
+            Type=item_type,
+            InputId="in-1" if item_type == "Input" else "",
+            OutputId="out-1" if item_type == "Output" else "",
+            Protocol=protocol,
+            CommonStatus=SimpleNamespace(Bitrate=bitrate, State=state, ConnectedTime="10s"),
+            SRTStatus=srt,
+        )
+
+    @staticmethod
+    def _mdc(datas, stats_infos=None):
+        mdc = Mock()
+        mdc.DescribeStreamLinkFlowRealtimeStatus.return_value = SimpleNamespace(Datas=datas)
+        mdc.DescribeStreamLinkFlowStatistics.return_value = SimpleNamespace(Infos=stats_infos or [])
+        return mdc
+
+    def test_sums_input_bitrate(self, client):
+        """Test input bitrate and state come from realtime status."""
+        srt = SimpleNamespace(RTT=12, RecvPacketLossRate=0.1, SendPacketLossRate=None)
+        mdc = self._mdc([
+            self._item("Input", 3_000_000, "Connected", protocol="SRT", srt=srt),
+            self._item("Input", 1_500_000, "Connected"),
+            self._item("Output", 4_000_000, "Connected"),
+            SimpleNamespace(Type="Input", CommonStatus=None),
+        ])
+
+        with patch.object(client, "_get_mdc_client", return_value=mdc):
+            result = client.get_flow_statistics("flow-001")
+
+        assert result["bitrate"] == 4_500_000
+        assert result["bitrate_mbps"] == "4.50"
+        assert result["state"] == "Connected"
+        assert result["connected_time"] == "10s"
+        assert len(result["inputs"]) == 2
+        assert len(result["outputs"]) == 1
+        assert result["inputs"][0]["rtt"] == 12
+
+    def test_idle_flow_skips_statistics(self, client):
+        """Test an idle flow returns without issuing the statistics request."""
+        mdc = self._mdc([self._item("Input", 0, "unknown")])
+
+        with patch.object(client, "_get_mdc_client", return_value=mdc), \
+             patch.object(client, "_merge_flow_statistics") as mock_merge:
+            result = client.get_flow_statistics("flow-idle")
+
+        assert result["state"] == "unknown"
+        assert result["bitrate_mbps"] == "0"
+        mock_merge.assert_not_called()
+        mdc.DescribeStreamLinkFlowStatistics.assert_not_called()
+
+        client._cache_flow_stats("flow-idle", result)
+        shard, _ = client._flow_stats_shard("flow-idle")
+        assert shard["flow-idle"]["ttl"] == 120
+
+    def test_previously_active_flow_overlaps_statistics(self, client):
+        """Test a flow cached as active requests statistics alongside realtime status."""
+        both_started = threading.Barrier(2, timeout=2)
+        latest = SimpleNamespace(Video=SimpleNamespace(Fps=30, Rate=0), Audio=None)
+        mdc = Mock()
+
+        def realtime(req):
+            both_started.wait()
+            return SimpleNamespace(Datas=[self._item("Input", 1_000_000, "Connected")])
+
+        def statistics(req):
+            both_started.wait()
+            return SimpleNamespace(Infos=[SimpleNamespace(FlowStatistics=[latest])])
+
+        mdc.DescribeStreamLinkFlowRealtimeStatus.side_effect = realtime
+        mdc.DescribeStreamLinkFlowStatistics.side_effect = statistics
+        client._cache_flow_stats("flow-001", {"state": "Connected", "bitrate": 1_000_000})
+
+        with patch.object(client, "_get_mdc_client", return_value=mdc):
+            result = client.get_flow_statistics("flow-001")
+
+        assert result["fps"] == 30
+
+    def test_slow_realtime_status_hedges_statistics(self, client):
+        """Test statistics are requested once realtime status outlasts the hedge delay."""
+        stats_requested = threading.Event()
+        mdc = Mock()
+
+        def realtime(req):
+            stats_requested.wait(2)
+            return SimpleNamespace(Datas=[self._item("Input", 1_000_000, "Connected")])
+
+        def statistics(req):
+            stats_requested.set()
+            return SimpleNamespace(Infos=[])
+
+        mdc.DescribeStreamLinkFlowRealtimeStatus.side_effect = realtime
+        mdc.DescribeStreamLinkFlowStatistics.side_effect = statistics
+
+        with patch.object(client, "_get_mdc_client", return_value=mdc), \
+             patch("app.services.tencent_client.FLOW_STATS_HEDGE_DELAY", 0.01):
+            start = time.monotonic()
+            result = client.get_flow_statistics("flow-001")
+
+        assert time.monotonic() - start < 1
+        assert result["state"] == "Connected"
+        mdc.DescribeStreamLinkFlowStatistics.assert_called_once()
+
+    def test_falls_back_to_output_and_statistics(self, client):
+        """Test output bitrate and statistics fps are used when inputs report nothing."""
+        latest = SimpleNamespace(Video=SimpleNamespace(Fps=25, Rate=0), Audio=None)
+        mdc = self._mdc(
+            [self._item("Input", 0, "unknown"), self._item("Output", 2_000_000, "Connected")],
+            stats_infos=[SimpleNamespace(FlowStatistics=[latest])],
+        )
+
+        with patch.object(client, "_get_mdc_client", return_value=mdc):
+            result = client.get_flow_statistics("flow-001")
+
+        assert result["bitrate"] == 2_000_000
+        assert result["bitrate_mbps"] == "2.00"
+        assert result["state"] == "Connected"
+        assert result["fps"] == 25
+
+    def test_each_sdk_request_takes_a_rate_limit_token(self, client):
+        """Test active flows take a token per SDK request and idle flows only one."""
+        active = self._mdc([self._item("Input", 1_000_000, "Connected")])
+        idle = self._mdc([self._item("Input", 0, "unknown")])
+        limiter = Mock()
+
+        with patch.object(client, "_flow_stats_rate_limiter", limiter):
+            with patch.object(client, "_get_mdc_client", return_value=active):
+                client.get_flow_statistics_batch(["flow-active"])
+            assert limiter.acquire.call_count == 2
+
+            with patch.object(client, "_get_mdc_client", return_value=idle):
+                asyncio.run(AsyncTencentClient(client).get_flow_statistics_batch(["flow-idle"]))
+            assert limiter.acquire.call_count == 3